@@ -0,0 +1,60 @@
+"""
+Concurrent Job Extraction
+
+Parses every job card of a list page up front, then fetches the detail pages
+concurrently (bounded by a semaphore) instead of one round trip at a time.
+"""
+
+import asyncio
+from typing import Any, Dict, List
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+async def extract_jobs_async(
+    extractor, job_cards, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+) -> List[Dict[str, Any]]:
+    """Extract job cards with concurrent detail fetches
+
+    Returns the same job dicts as calling extractor.extract_job_data on each
+    card, in card order (None for cards skipped as duplicates).
+    """
+    # Parse all cards first so detail fetches can start together
+    parsed_jobs = []
+    for job_card in job_cards:
+        try:
+            parsed_jobs.append(extractor.parse_job_card(job_card))
+        except Exception as e:
+            print(f"Error extracting job data: {e}")
+            parsed_jobs.append(None)
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def complete_job(job):
+        if job is None:
+            return extractor.empty_job()
+        # Cards are claimed in card order, before any detail fetch starts
+        if extractor.is_duplicate_card(job):
+            return None
+        try:
+            async with semaphore:
+                # Detail fetches are blocking I/O, so run them in the default
+                # thread pool
+                job["description"] = await asyncio.to_thread(
+                    extractor.fetch_description, job
+                )
+        except Exception as e:
+            # One failing card must not lose the rest of the page
+            print(f"Error extracting job data: {e}")
+            return extractor.empty_job()
+        job["source"] = extractor.SOURCE
+        return job
+
+    return list(await asyncio.gather(*(complete_job(job) for job in parsed_jobs)))
+
+
+def extract_jobs_concurrently(
+    extractor, job_cards, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+) -> List[Dict[str, Any]]:
+    """Synchronous entry point for extract_jobs_async"""
+    return asyncio.run(extract_jobs_async(extractor, job_cards, max_concurrency))
@@ -1,5 +1,14 @@
-import random
-import time
+from async_extraction import extract_jobs_concurrently
+from html_parser import DEFAULT_PARSER
+from pagination import DEFAULT_PREFETCH_PAGES, iter_list_pages
+from parse_pool import ParsePool
+from seen_url_store import SeenUrlStore
+from transport import (
+    DEFAULT_BURST,
+    DEFAULT_REQUESTS_PER_SECOND,
+    HttpCache,
+    configure_default_pool,
+)
 
 
 class BaseScraperCLI:
@@ -15,7 +24,14 @@ class BaseScraperCLI:
         base_url,
         output_file=None,
         max_pages=1,
-        delay=None,
+        requests_per_second=DEFAULT_REQUESTS_PER_SECOND,
+        burst=DEFAULT_BURST,
+        max_concurrency=None,
+        cache_dir=None,
+        seen_store_path=None,
+        prefetch_pages=DEFAULT_PREFETCH_PAGES,
+        parser=DEFAULT_PARSER,
+        parse_workers=None,
     ):
         """
         Initialize the CLI with scraper/extractor classes and configuration.
@@ -27,55 +43,76 @@ class BaseScraperCLI:
             output_file: Output filename (optional, will generate timestamped name
             if None)
             max_pages: Maximum number of pages to scrape (default: 1)
-            delay: Delay between requests in seconds (optional, random 1-5s if None)
+            requests_per_second: Average rate of list and detail requests per host
+            (default: 2.0, rate limiting disabled if None)
+            burst: Requests a host may receive back to back (default: 5)
+            max_concurrency: Fetch detail pages of a list page concurrently with at
+            most this many requests in flight (optional, sequential if None)
+            cache_dir: Directory of the on-disk HTTP cache used for conditional
+            requests (optional, caching disabled if None)
+            seen_store_path: JSON file of already scraped URLs whose descriptions
+            are reused instead of fetched again (optional, disabled if None)
+            prefetch_pages: List pages fetched ahead while the current page is
+            being extracted (default: 2)
+            parser: HTML parser backend, one of html_parser.PARSER_BACKENDS
+            (default: "html.parser")
+            parse_workers: Parse detail pages in this many worker processes
+            instead of the fetching threads (optional, disabled if None)
         """
         self.scraper_class = scraper_class
         self.extractor_class = extractor_class
         self.base_url = base_url
         self.output_file = output_file
         self.max_pages = max_pages
-        self.delay = delay
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.cache_dir = cache_dir
+        self.seen_store_path = seen_store_path
+        self.prefetch_pages = prefetch_pages
+        self.parser = parser
+        self.parse_workers = parse_workers
 
     def run(self):
         """Run the scraping process with pagination and error handling."""
-        # Initialize scraper and extractor
-        scraper = self.scraper_class()
-        extractor = self.extractor_class(scraper)
-
-        # Handle infinite pages (None = unlimited)
-        if self.max_pages is None:
-            max_pages = float("inf")
-        else:
-            max_pages = self.max_pages
-
-        # Set delay (random if not specified)
-        delay = random.uniform(1, 5) if self.delay is None else self.delay
-
-        page_num = 0
-        while page_num < max_pages:
-            # Construct page URL
-            if page_num == 0:
-                job_url = self.base_url
-            else:
-                job_url = f"{self.base_url}?page={page_num}"
-
-            print(f"Scraping page {page_num + 1}...")
-
-            try:
-                # Scrape job listings from current page
-                job_cards = scraper.scrape_jobs_list(job_url)
-
-                # Stop if no more jobs found (but allow first page to be empty)
-                if not job_cards and page_num > 0:
-                    print("No more job postings found. Exiting.")
-                    break
+        # Rate-limit every request per host and revalidate previously fetched
+        # pages instead of downloading them again
+        configure_default_pool(
+            cache=HttpCache(self.cache_dir) if self.cache_dir is not None else None,
+            requests_per_second=self.requests_per_second,
+            burst=self.burst,
+        )
 
+        # Initialize scraper and extractor
+        seen_store = (
+            SeenUrlStore(self.seen_store_path) if self.seen_store_path else None
+        )
+        parse_pool = (
+            ParsePool([self.scraper_class.PROFILE], self.parser, self.parse_workers)
+            if self.parse_workers
+            else None
+        )
+        scraper = self.scraper_class(parser=self.parser, parse_pool=parse_pool)
+        extractor = self.extractor_class(scraper, seen_store=seen_store)
+
+        try:
+            # The next list page is fetched while this one's cards are extracted
+            for _, job_cards in iter_list_pages(
+                scraper, self.base_url, self.max_pages, prefetch=self.prefetch_pages
+            ):
                 print(f"Found {len(job_cards)} job postings on this page.")
 
                 # Process each job card
-                for job_card in job_cards:
-                    job_data = extractor.extract_job_data(job_card)
-
+                if self.max_concurrency:
+                    page_jobs = extract_jobs_concurrently(
+                        extractor, job_cards, self.max_concurrency
+                    )
+                else:
+                    page_jobs = (
+                        extractor.extract_job_data(job_card) for job_card in job_cards
+                    )
+
+                for job_data in page_jobs:
                     # Only add valid jobs
                     if (
                         job_data
@@ -85,15 +122,21 @@ class BaseScraperCLI:
                         extractor.jobs.append(job_data)
 
                 print(f"Total jobs collected so far: {len(extractor.jobs)}")
-                page_num += 1
-
-                # Add delay between requests
-                if delay > 0:
-                    time.sleep(delay)
 
-            except Exception as e:
-                print(f"Error occurred while scraping: {e}")
-                break
+        except Exception as e:
+            print(f"Error occurred while scraping: {e}")
+        finally:
+            if parse_pool is not None:
+                parse_pool.close()
 
         # Save results
         extractor.save_jobs(self.output_file)
+        if parse_pool is None:
+            # Workers learn selectors in their own processes
+            print(f"Description selectors: {scraper.description_extractor.stats()}")
+        if seen_store is not None:
+            seen_store.save()
+            print(
+                f"Reused {seen_store.hits} stored descriptions, "
+                f"fetched {seen_store.misses} detail pages"
+            )
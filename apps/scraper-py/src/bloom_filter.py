@@ -0,0 +1,112 @@
+"""
+Bloom Filter
+
+Fixed-size probabilistic set of string keys for deduplicating very large
+crawls in bounded memory. A Bloom filter never forgets a key it was given, but
+may claim an unseen key was seen with a small false-positive rate, which
+grows once more than `capacity` keys have been added.
+
+BoundedKeySet keeps keys exactly up to a limit and spills further keys to a
+Bloom filter, so ordinary runs stay exact and only very large ones trade exact
+answers for bounded memory.
+"""
+
+import hashlib
+import math
+from typing import Hashable, Optional, Set
+
+DEFAULT_CAPACITY = 1_000_000
+DEFAULT_ERROR_RATE = 0.001
+
+
+class BloomFilter:
+    """Bit array with num_hashes positions per key (double hashing)"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, error_rate=DEFAULT_ERROR_RATE):
+        """
+        Args:
+            capacity: Number of keys at which the false-positive rate is
+            error_rate
+            error_rate: Target false-positive rate (0-1)
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        if not 0 < error_rate < 1:
+            raise ValueError(f"error_rate must be in (0, 1), got {error_rate}")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # Optimal sizes: m = -n ln p / (ln 2)^2 bits, k = m / n ln 2 hashes
+        self.num_bits = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: Hashable):
+        digest = hashlib.blake2b(str(key).encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        # Odd step, so the positions differ for every hash
+        step = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * step) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, key: Hashable):
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: Hashable) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+    def __len__(self) -> int:
+        """Number of keys added (repeats included)"""
+        return self.count
+
+
+class BoundedKeySet:
+    """Exact set of up to max_exact keys, with later keys in a Bloom filter"""
+
+    def __init__(
+        self,
+        max_exact: Optional[int] = None,
+        capacity: int = DEFAULT_CAPACITY,
+        error_rate=DEFAULT_ERROR_RATE,
+    ):
+        """
+        Args:
+            max_exact: Keys stored exactly before spilling to the Bloom filter
+            (None: always exact, unbounded memory)
+            capacity: Capacity of the Bloom filter, allocated on first spill
+            error_rate: False-positive rate of the Bloom filter at capacity
+        """
+        self.max_exact = max_exact
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._exact: Set[Hashable] = set()
+        self._bloom: Optional[BloomFilter] = None
+
+    @property
+    def spilled(self) -> bool:
+        """Whether keys have gone to the Bloom filter (answers may be approximate)"""
+        return self._bloom is not None
+
+    def add(self, key: Hashable):
+        if key in self._exact:
+            return
+        if self.max_exact is None or len(self._exact) < self.max_exact:
+            self._exact.add(key)
+            return
+        if self._bloom is None:
+            self._bloom = BloomFilter(self.capacity, self.error_rate)
+        self._bloom.add(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        if key in self._exact:
+            return True
+        return self._bloom is not None and key in self._bloom
+
+    def __len__(self) -> int:
+        return len(self._exact) + (len(self._bloom) if self._bloom else 0)
@@ -0,0 +1,94 @@
+"""
+Description Extractor
+
+Finds the job description on a detail page by trying CSS selectors in priority
+order until an element has more than a minimum number of words. The selector
+that wins on a host is remembered and tried first on that host's next page,
+since the pages of one job board share a template; the full selector list is
+only walked again when the learned selector misses. Generic containers
+(article, main) are never learned: they match nearly every page, so a learned
+one would shadow the specific selectors on all later pages of the host.
+"""
+
+import threading
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+
+class DescriptionExtractor:
+    """Priority-ordered selector scan with a per-host learned selector"""
+
+    def __init__(
+        self, selectors: Iterable[str], min_words: int, generic: Iterable[str] = ()
+    ):
+        """
+        Args:
+            selectors: CSS selectors in priority order
+            min_words: A description must have more words than this
+            generic: Selectors among selectors that may win a page but are
+            never learned
+        """
+        self.selectors = list(selectors)
+        self.min_words = min_words
+        self.generic = list(generic)
+        # host -> selector that last produced a description there
+        self.learned: Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def extract(self, soup, url: str) -> str:
+        """Return the description text of a parsed detail page ("" if none)"""
+        host = urlparse(url).netloc
+        with self._lock:
+            learned = self.learned.get(host)
+
+        if learned is not None:
+            text = self.match(soup, learned)
+            if text:
+                with self._lock:
+                    self.hits += 1
+                return text
+
+        with self._lock:
+            self.misses += 1
+        for selector in self.selectors:
+            if selector == learned:
+                continue
+            text = self.match(soup, selector)
+            if text:
+                if selector not in self.generic:
+                    with self._lock:
+                        self.learned[host] = selector
+                return text
+        return ""
+
+    def match(self, soup, selector: str) -> Optional[str]:
+        """Text of the first element matching selector with enough words"""
+        for elem in soup.select(selector):
+            if self.has_enough_words(elem):
+                # Only the winning element's full text is built
+                return elem.get_text(separator=" ", strip=True)
+        return None
+
+    def has_enough_words(self, elem) -> bool:
+        """Whether elem has more than min_words words, counted node by node and
+        stopping at the threshold; equals len(get_text(" ", strip=True).split())
+        compared with min_words, without building the text of large containers"""
+        words = 0
+        for text in elem.stripped_strings:
+            words += len(text.split())
+            if words > self.min_words:
+                return True
+        return False
+
+    def stats(self) -> str:
+        return (
+            f"{self.hits} learned-selector hits, {self.misses} full scans "
+            f"({self.hit_rate:.0%} hit rate)"
+        )
@@ -8,6 +8,8 @@ from duunitori_extractor import DuunitoriExtractor  # noqa: E402
 from duunitori_scraper import DuunitoriScraper  # noqa: E402
 
 from base_cli import BaseScraperCLI  # noqa: E402
+from seen_url_store import DEFAULT_STORE_PATH  # noqa: E402
+from transport import DEFAULT_CACHE_DIR  # noqa: E402
 
 if __name__ == "__main__":
     cli = BaseScraperCLI(
@@ -16,6 +18,12 @@ if __name__ == "__main__":
         base_url="https://duunitori.fi/tyopaikat",
         output_file=f"duunitori_jobs_{datetime.now().strftime('%Y%m%d')}.json",
         max_pages=1,  # current test value
-        delay=None,  # random delay
+        requests_per_second=2.0,  # per-host politeness budget
+        burst=5,
+        max_concurrency=8,  # concurrent detail-page fetches
+        cache_dir=DEFAULT_CACHE_DIR,  # logs/http_cache
+        seen_store_path=DEFAULT_STORE_PATH,  # logs/seen_urls.json
+        parser="selectolax",  # or "lxml" / "html.parser"
+        parse_workers=4,  # detail-page parsing processes
     )
     cli.run()
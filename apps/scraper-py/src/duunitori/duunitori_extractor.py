@@ -1,131 +1,7 @@
-import json
-import os
-from datetime import datetime
+from site_profiles import DUUNITORI, ProfileExtractor
 
 
-class DuunitoriExtractor:
-    def __init__(self, scraper):
-        self.jobs = []
-        self.scraper = scraper
+class DuunitoriExtractor(ProfileExtractor):
+    """duunitori.fi job cards, see site_profiles.duunitori"""
 
-    def extract_job_data(self, job_card):
-        job = {}
-
-        # Extract Job Title and URL
-        try:
-            # job_card is now the parent container, look for the <a> tag inside it
-            link_elem = job_card.find("a", class_="job-box__hover")
-            if link_elem:
-                job["title"] = link_elem.get_text(strip=True)
-                href = link_elem.get("href")
-                if href:
-                    job["url"] = (
-                        "https://duunitori.fi" + href if href.startswith("/") else href
-                    )
-                else:
-                    job["url"] = "N/A"
-            else:
-                # Fallback: any anchor tag
-                link_elem = job_card.find("a")
-                if link_elem:
-                    job["title"] = link_elem.get_text(strip=True)
-                    href = link_elem.get("href")
-                    if href:
-                        job["url"] = (
-                            "https://duunitori.fi" + href
-                            if href.startswith("/")
-                            else href
-                        )
-                    else:
-                        job["url"] = "N/A"
-                else:
-                    job["title"] = job_card.get_text(strip=True)[
-                        :100
-                    ]  # Limit title length
-                    job["url"] = "N/A"
-
-            # Extract Company Name - try data attribute first (from HTML structure)
-            company_name = link_elem.get("data-company")
-            if company_name and company_name.strip():
-                job["company"] = company_name.strip()
-            else:
-                # Fallback to looking for company elements
-                company_selectors = [
-                    'span[class*="company"]',
-                    'div[class*="company"]',
-                    '[class*="employer"]',
-                    'span[class*="recruiter"]',
-                    'div[class*="recruiter"]',
-                ]
-
-                company_elem = None
-                for selector in company_selectors:
-                    company_elem = job_card.select_one(selector)
-                    if company_elem:
-                        break
-
-                if company_elem:
-                    job["company"] = company_elem.get_text(strip=True)
-                else:
-                    job["company"] = "N/A"
-
-            # Extract Location - look for job-box__job-location anywhere in the job card
-            location_elem = job_card.select_one(".job-box__job-location")
-            if location_elem:
-                # Clean up the location text (remove extra elements)
-                location_text = location_elem.get_text(strip=True)
-                # Remove the "–" and anything after it if present
-                location_text = location_text.split("–")[0].strip()
-                job["location"] = location_text
-            else:
-                job["location"] = "N/A"
-
-            # Extract Posted Date - look for job-box__job-posted anywhere
-            date_elem = job_card.select_one(".job-box__job-posted")
-            if date_elem:
-                date_text = date_elem.get_text(strip=True)
-                # Clean up "Julkaistu" prefix if present
-                if date_text.startswith("Julkaistu"):
-                    date_text = date_text.replace("Julkaistu", "").strip()
-                job["publish_date"] = date_text
-            else:
-                job["publish_date"] = "N/A"
-
-            job["description"] = self.scraper.scrape_job(job["url"])
-
-            job["source"] = "duunitori.fi"
-            return job
-
-        except Exception as e:
-            print(f"Error extracting job data: {e}")
-            return {
-                "title": "N/A",
-                "url": "N/A",
-                "company": "N/A",
-                "location": "N/A",
-                "publish_date": "N/A",
-                "description": "N/A",
-                "source": "duunitori.fi",
-            }
-
-    def save_jobs(self, output_file):
-        # get path
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.abspath(os.path.join(script_dir, "../.."))
-        logs_dir = os.path.join(project_root, "logs")  # apps/scraper-py/logs/
-
-        # Ensure logs directory exists
-        os.makedirs(logs_dir, exist_ok=True)
-
-        if not output_file:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"jobs_duunitori_{timestamp}.json"
-
-        output_file = os.path.join(logs_dir, output_file)
-
-        try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(self.jobs, f, ensure_ascii=False, indent=4)
-            print(f"Jobs saved to {output_file}")
-        except Exception as e:
-            print(f"Error saving jobs: {e}")
+    PROFILE = DUUNITORI
@@ -0,0 +1,144 @@
+"""
+Fingerprint Index
+
+Persistent SQLite index of the jobs ingested by earlier pipeline runs, keyed by
+content fingerprint (company + title + location, see job_deduplicator) and by
+URL, with first_seen/last_seen and a hash of the job's content. Each scraped
+job is classified as:
+
+- new: neither its fingerprint nor its URL is known
+- unchanged: known, with the same content as last recorded
+- updated: known, but its content (or, for a known URL, its fingerprint)
+  changed
+
+so analysis, translation and database inserts only need to see new and
+updated jobs. Classifying never writes; jobs are recorded once they have been
+processed.
+"""
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from job_deduplicator import generate_job_fingerprint
+from seen_url_store import LOGS_DIR
+
+DEFAULT_INDEX_PATH = LOGS_DIR / "fingerprint_index.sqlite3"
+
+NEW = "new"
+UNCHANGED = "unchanged"
+UPDATED = "updated"
+
+# Fields whose change makes a known job "updated"
+CONTENT_FIELDS = ("title", "company", "location", "publish_date", "description")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    fingerprint TEXT PRIMARY KEY,
+    url TEXT,
+    content_hash TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_url ON jobs (url);
+"""
+
+
+def content_hash(job: Dict[str, Any]) -> str:
+    """Short hash of the job's CONTENT_FIELDS"""
+    content = json.dumps(
+        [job.get(field) for field in CONTENT_FIELDS], ensure_ascii=False
+    )
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def job_url(job: Dict[str, Any]) -> Optional[str]:
+    url = job.get("url")
+    return url if url and url != "N/A" else None
+
+
+class FingerprintIndex:
+    """Cross-run record of ingested jobs in an SQLite file"""
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path: SQLite file backing the index (DEFAULT_INDEX_PATH if None,
+            ":memory:" for a throwaway index)
+        """
+        self.path = path or DEFAULT_INDEX_PATH
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.row_factory = sqlite3.Row
+        with self._conn:
+            self._conn.executescript(SCHEMA)
+
+    def _find(self, fingerprint: str, url: Optional[str]) -> Optional[sqlite3.Row]:
+        row = self._conn.execute(
+            "SELECT * FROM jobs WHERE fingerprint = ?", (fingerprint,)
+        ).fetchone()
+        if row is None and url:
+            row = self._conn.execute(
+                "SELECT * FROM jobs WHERE url = ? ORDER BY last_seen DESC", (url,)
+            ).fetchone()
+        return row
+
+    def classify(self, job: Dict[str, Any]) -> str:
+        """NEW, UNCHANGED or UPDATED compared to the recorded version"""
+        fingerprint = generate_job_fingerprint(job)
+        row = self._find(fingerprint, job_url(job))
+        if row is None:
+            return NEW
+        same_content = row["content_hash"] == content_hash(job)
+        if row["fingerprint"] == fingerprint and same_content:
+            return UNCHANGED
+        return UPDATED
+
+    def classify_jobs(
+        self, jobs: Iterable[Dict[str, Any]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Jobs grouped by classification, in input order"""
+        groups: Dict[str, List[Dict[str, Any]]] = {NEW: [], UNCHANGED: [], UPDATED: []}
+        for job in jobs:
+            groups[self.classify(job)].append(job)
+        return groups
+
+    def record(self, jobs: Iterable[Dict[str, Any]], seen_at=None):
+        """Store the jobs' current fingerprint, URL and content as processed"""
+        seen_at = (seen_at or datetime.now()).isoformat(timespec="seconds")
+        with self._conn:
+            for job in jobs:
+                fingerprint = generate_job_fingerprint(job)
+                url = job_url(job)
+                first_seen = seen_at
+                row = self._find(fingerprint, url)
+                if row is not None:
+                    first_seen = row["first_seen"]
+                    # A known URL may come back under a new fingerprint
+                    self._conn.execute(
+                        "DELETE FROM jobs WHERE fingerprint = ?", (row["fingerprint"],)
+                    )
+                self._conn.execute(
+                    "INSERT INTO jobs (fingerprint, url, content_hash, first_seen,"
+                    " last_seen) VALUES (?, ?, ?, ?, ?)"
+                    " ON CONFLICT (fingerprint) DO UPDATE SET url = excluded.url,"
+                    " content_hash = excluded.content_hash,"
+                    " last_seen = excluded.last_seen",
+                    (fingerprint, url, content_hash(job), first_seen, seen_at),
+                )
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
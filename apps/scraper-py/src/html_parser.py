@@ -0,0 +1,157 @@
+"""
+Pluggable HTML parser backends for the scrapers and extractors
+
+parse_html() returns a document whose nodes all answer the same small, CSS-only
+interface, so extraction code runs unchanged on every backend:
+
+    select(css)                  -> list of nodes
+    select_one(css)              -> node or None
+    get_text(separator, strip)   -> text of the node (script/style excluded)
+    get(attribute, default)      -> attribute value
+    stripped_strings             -> iterator of the non-blank text nodes
+    parent                       -> enclosing node, None above the document
+
+Selectors may be given as strings or precompiled once with compile_selector().
+
+BeautifulSoup Tags provide this interface natively; selectolax nodes are
+wrapped in SelectolaxNode. lxml and selectolax are imported only when their
+backend is selected.
+
+List pages are parsed with a SoupStrainer so the BeautifulSoup backends only
+build the job-card subtrees. selectolax always builds the whole tree, which is
+still cheaper than a strained BeautifulSoup parse.
+
+Documents should be handed to release_tree() once the needed values are read.
+"""
+
+from typing import Iterator, List, Optional, Union
+
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+# BeautifulSoup's stdlib parser: slowest, but needs no compiled dependency
+DEFAULT_PARSER = "html.parser"
+PARSER_BACKENDS = ("html.parser", "lxml", "selectolax")
+
+# Text BeautifulSoup leaves out of get_text() for HTML documents
+NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+Selector = Union[str, soupsieve.SoupSieve]
+
+
+def compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """Compile a CSS selector once for repeated select()/select_one() calls
+
+    BeautifulSoup runs the compiled soupsieve pattern directly; selectolax,
+    whose lexbor selectors are not reusable across documents, reads back its
+    source text. Invalid selectors fail here rather than on the first page.
+    """
+    return soupsieve.compile(selector)
+
+
+def _css(selector: Selector) -> str:
+    return selector if isinstance(selector, str) else selector.pattern
+
+
+class SelectolaxNode:
+    """BeautifulSoup-compatible view of a selectolax (lexbor) node"""
+
+    __slots__ = ("node",)
+
+    def __init__(self, node):
+        self.node = node
+
+    @property
+    def name(self) -> str:
+        return self.node.tag
+
+    @property
+    def parent(self) -> Optional["SelectolaxNode"]:
+        node = self.node.parent
+        return SelectolaxNode(node) if node is not None else None
+
+    def select(self, selector: Selector) -> List["SelectolaxNode"]:
+        return [SelectolaxNode(node) for node in self.node.css(_css(selector))]
+
+    def select_one(self, selector: Selector) -> Optional["SelectolaxNode"]:
+        node = self.node.css_first(_css(selector))
+        return SelectolaxNode(node) if node is not None else None
+
+    def get(self, attribute: str, default=None):
+        value = self.node.attributes.get(attribute, default)
+        # Valueless attributes (<div hidden>) read as "" like in BeautifulSoup
+        return "" if value is None and attribute in self.node.attributes else value
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        return separator.join(self._all_strings(strip))
+
+    @property
+    def stripped_strings(self) -> Iterator[str]:
+        """Non-blank text nodes, stripped, in document order"""
+        return self._all_strings(strip=True)
+
+    def _all_strings(self, strip: bool) -> Iterator[str]:
+        for node in self.node.traverse(include_text=True):
+            if not node.is_text_node or node.parent.tag in NON_TEXT_TAGS:
+                continue
+            text = node.text_content
+            if strip:
+                text = text.strip()
+                if not text:
+                    continue
+            yield text
+
+    def __repr__(self):
+        return f"<SelectolaxNode {self.node.tag}>"
+
+
+def node_key(node) -> int:
+    """Identity of a document node, the same for every SelectolaxNode wrapping
+    it (BeautifulSoup Tags hash and compare by their markup)"""
+    return node.node.mem_id if isinstance(node, SelectolaxNode) else id(node)
+
+
+def parse_html(
+    markup, parser: str = DEFAULT_PARSER, parse_only: Optional[SoupStrainer] = None
+):
+    """Parse a page with the given backend
+
+    Args:
+        markup: HTML as str or bytes
+        parser: One of PARSER_BACKENDS
+        parse_only: Keep only the subtrees matching this strainer (BeautifulSoup
+        backends, ignored by selectolax)
+
+    Returns:
+        The document root, queried with select()/select_one()
+    """
+    if parser == "selectolax":
+        from selectolax.lexbor import LexborHTMLParser
+
+        return SelectolaxNode(LexborHTMLParser(markup).root)
+    if parser in PARSER_BACKENDS:
+        return BeautifulSoup(markup, parser, parse_only=parse_only)
+    raise ValueError(
+        f"Unknown parser backend {parser!r}, expected one of {PARSER_BACKENDS}"
+    )
+
+
+def release_tree(document) -> None:
+    """Free a document returned by parse_html() now rather than at the next
+    garbage collection
+
+    BeautifulSoup trees are held together by parent/sibling reference cycles,
+    so they outlive their last reference until the cycle collector runs;
+    decompose() breaks the cycles. selectolax trees have no cycles and are
+    freed with their last reference.
+    """
+    if not isinstance(document, Tag):
+        return
+    # decompose() walks next_element, which is None on a BeautifulSoup root,
+    # so the root's children are decomposed one by one
+    for child in list(document.contents):
+        if isinstance(child, Tag):
+            child.decompose()
+        else:
+            child.extract()
+    document.decompose()
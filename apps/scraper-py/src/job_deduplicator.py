@@ -2,26 +2,44 @@
 Job Deduplication Utility
 
 Provides content-based deduplication for job listings from multiple sources.
-Uses company + title + location fingerprints to identify duplicates across platforms.
+Uses company + title + location fingerprints to identify duplicates across platforms,
+and optionally MinHash similarity of title + description to catch near duplicates
+(reworded titles or locations) that the exact fingerprint misses.
+
+JobDeduplicator checks jobs one at a time as they arrive, so deduplication can
+run inline while sources are still being scraped; with max_exact_keys its seen
+URLs and fingerprints stay bounded in memory (see bloom_filter).
 """
 
 import hashlib
 import re
-from typing import Any, Dict, List
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from bloom_filter import BoundedKeySet
+from near_duplicates import NearDuplicateIndex
+
+# Company-form suffixes (Oy, Ltd, Inc) and punctuation, removed in one pass:
+# suffixes are letters only, so removing them before the punctuation or
+# together with it leaves the same text
+NOISE = re.compile(r"\b(?:oy|oyj|ab|ltd|inc|gmbh)\b|[^\w\s]")
+
+FINGERPRINT_FIELDS = ("company", "title", "location")
 
 
 def normalize_text(text: str) -> str:
     """Normalize text for comparison: lowercase, remove extra spaces, punctuation"""
     if not text:
         return ""
-    # Lowercase and strip
-    text = text.lower().strip()
-    # Remove common suffixes like Oy, Ltd, Inc
-    text = re.sub(r"\b(oy|oyj|ab|ltd|inc|gmbh)\b", "", text)
-    # Remove punctuation and extra spaces
-    text = re.sub(r"[^\w\s]", "", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    # Lowercase, drop suffixes and punctuation, collapse and strip whitespace
+    return " ".join(NOISE.sub("", text.lower()).split())
+
+
+def fingerprint_hash(fingerprint_str: str) -> str:
+    return hashlib.blake2b(fingerprint_str.encode(), digest_size=16).hexdigest()
 
 
 def generate_job_fingerprint(job: Dict[str, Any]) -> str:
@@ -34,38 +52,177 @@ def generate_job_fingerprint(job: Dict[str, Any]) -> str:
     fingerprint_str = f"{company}|{title}|{location}"
 
     # Return hash
-    return hashlib.blake2b(fingerprint_str.encode(), digest_size=16).hexdigest()
+    return fingerprint_hash(fingerprint_str)
 
 
-def deduplicate_jobs(jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Deduplicate jobs by fingerprint, keeping first occurrence
+def _normalize_column(column: pd.Series) -> np.ndarray:
+    """normalize_text of every value, computed once per distinct value"""
+    codes, uniques = pd.factorize(column)
+    # Missing values get code -1, which picks the trailing ""
+    normalized = [normalize_text(value) for value in uniques] + [""]
+    return np.array(normalized, dtype=object)[codes]
+
+
+def fingerprint_frame(frame: pd.DataFrame) -> pd.Series:
+    """Fingerprints of the company/title/location columns of a DataFrame,
+    identical to generate_job_fingerprint of each row
+
+    Company names and locations repeat across a job archive, so each distinct
+    value is normalized once, and each distinct fingerprint string hashed once.
+    """
+    columns = [
+        (
+            _normalize_column(frame[field])
+            if field in frame
+            else np.full(len(frame), "", dtype=object)
+        )
+        for field in FINGERPRINT_FIELDS
+    ]
+    fingerprint_strs = columns[0] + "|" + columns[1] + "|" + columns[2]
+    codes, uniques = pd.factorize(fingerprint_strs)
+    hashes = np.array([fingerprint_hash(value) for value in uniques], dtype=object)
+    return pd.Series(hashes[codes], index=frame.index, dtype=object)
+
+
+def generate_job_fingerprints(jobs: List[Dict[str, Any]]) -> List[str]:
+    """generate_job_fingerprint of every job, in one batch"""
+    if not jobs:
+        return []
+    frame = pd.DataFrame.from_records(jobs, columns=list(FINGERPRINT_FIELDS))
+    return fingerprint_frame(frame).tolist()
+
 
-    Uses two-level deduplication:
+def job_text(job: Dict[str, Any]) -> str:
+    """Normalized title + description compared by near-duplicate detection
+    ("" without a description: titles alone are too short to compare)"""
+    description = job.get("description") or ""
+    if not description or description == "N/A":
+        return ""
+    return normalize_text(f"{job.get('title') or ''} {description}")
+
+
+class JobDeduplicator:
+    """Incremental deduplication against the jobs accepted so far
+
+    Uses up to three levels of deduplication:
     1. Fast URL-based deduplication (if URLs available)
     2. Content-based deduplication using company+title+location fingerprint
+    3. Near-duplicate detection on title + description, if similarity_threshold
+    (estimated Jaccard similarity of word shingles, 0-1) is given; a match
+    counts only for the same company on a different source, since one
+    employer's postings on one board (the same role in several cities) share
+    their description
 
-    This catches duplicate jobs posted on different platforms with different URLs.
+    Safe to share between scraping threads. Memory is bounded by
+    max_exact_keys for the exact levels and by near_duplicate_window for the
+    MinHash signatures of accepted jobs.
     """
-    seen_fingerprints = set()
-    seen_urls = set()
-    deduped = []
 
-    for job in jobs:
-        # Skip if URL already seen (fast check)
+    def __init__(
+        self,
+        similarity_threshold: Optional[float] = None,
+        max_exact_keys: Optional[int] = None,
+        near_duplicate_window: Optional[int] = None,
+    ):
+        """
+        Args:
+            similarity_threshold: Near-duplicate threshold (None: exact only)
+            max_exact_keys: URLs and fingerprints each kept exactly before
+            further ones go to a Bloom filter, which may drop a unique job
+            with a small false-positive rate (None: always exact)
+            near_duplicate_window: Most recently accepted jobs whose
+            signatures are kept for near-duplicate detection (None: all)
+        """
+        self.seen_urls = BoundedKeySet(max_exact_keys)
+        self.seen_fingerprints = BoundedKeySet(max_exact_keys)
+        self.near_duplicates = (
+            NearDuplicateIndex(similarity_threshold, max_size=near_duplicate_window)
+            if similarity_threshold
+            else None
+        )
+        self.accepted = 0
+        self.duplicates = 0
+        self._lock = threading.Lock()
+
+    def accept(self, job: Dict[str, Any], fingerprint: Optional[str] = None) -> bool:
+        """Record the job and return True unless it duplicates an accepted job
+
+        Args:
+            job: Job dictionary
+            fingerprint: generate_job_fingerprint(job), if already computed
+        """
+        if fingerprint is None:
+            fingerprint = generate_job_fingerprint(job)
         url = job.get("url", "")
-        if url and url in seen_urls:
-            continue
 
-        # Generate fingerprint for content-based dedup
-        fingerprint = generate_job_fingerprint(job)
+        with self._lock:
+            # Skip if URL already seen (fast check)
+            if (url and url in self.seen_urls) or fingerprint in self.seen_fingerprints:
+                self.duplicates += 1
+                return False
 
-        if fingerprint not in seen_fingerprints:
-            seen_fingerprints.add(fingerprint)
+            if self.near_duplicates is not None:
+                # Jobs without a description are only deduplicated exactly
+                signature = self.near_duplicates.signature(job_text(job))
+                if signature is not None:
+                    company = normalize_text(job.get("company") or "")
+                    source = job.get("source")
+                    match = self.near_duplicates.query(
+                        signature,
+                        accept=lambda key: key[1] == company and key[2] != source,
+                    )
+                    if match is not None:
+                        self.duplicates += 1
+                        return False
+                    key = (self.accepted, company, source)
+                    self.near_duplicates.add(key, signature)
+
+            self.seen_fingerprints.add(fingerprint)
             if url:
-                seen_urls.add(url)
-            deduped.append(job)
+                self.seen_urls.add(url)
+            self.accepted += 1
+            return True
+
+    def unique(self, jobs: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Yield the jobs that are not duplicates, as they arrive"""
+        for job in jobs:
+            if self.accept(job):
+                yield job
 
-    return deduped
+
+def iter_unique_jobs(
+    jobs: Iterable[Dict[str, Any]],
+    similarity_threshold: Optional[float] = None,
+    max_exact_keys: Optional[int] = None,
+    near_duplicate_window: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Deduplicate a stream of jobs, yielding first occurrences as they arrive
+
+    Same results as deduplicate_jobs without holding the jobs in memory (see
+    JobDeduplicator for the arguments).
+    """
+    deduplicator = JobDeduplicator(
+        similarity_threshold, max_exact_keys, near_duplicate_window
+    )
+    yield from deduplicator.unique(jobs)
+
+
+def deduplicate_jobs(
+    jobs: List[Dict[str, Any]], similarity_threshold: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """Deduplicate jobs by fingerprint, keeping first occurrence
+
+    This catches duplicate jobs posted on different platforms with different URLs
+    (see JobDeduplicator for the levels of deduplication).
+    """
+    deduplicator = JobDeduplicator(similarity_threshold)
+    # Fingerprints for content-based dedup, generated in one batch
+    fingerprints = generate_job_fingerprints(jobs)
+    return [
+        job
+        for job, fingerprint in zip(jobs, fingerprints)
+        if deduplicator.accept(job, fingerprint)
+    ]
 
 
 # Example usage and testing
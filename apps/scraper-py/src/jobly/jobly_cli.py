@@ -7,6 +7,8 @@ from jobly_extractor import JoblyExtractor  # noqa: E402
 from jobly_scraper import JoblyScraper  # noqa: E402
 
 from base_cli import BaseScraperCLI  # noqa: E402
+from seen_url_store import DEFAULT_STORE_PATH  # noqa: E402
+from transport import DEFAULT_CACHE_DIR  # noqa: E402
 
 if __name__ == "__main__":
     cli = BaseScraperCLI(
@@ -15,6 +17,12 @@ if __name__ == "__main__":
         base_url="https://www.jobly.fi/en/jobs",
         output_file=None,  # Will generate timestamped filename
         max_pages=1,  # current test value
-        delay=None,  # random delay
+        requests_per_second=2.0,  # per-host politeness budget
+        burst=5,
+        max_concurrency=8,  # concurrent detail-page fetches
+        cache_dir=DEFAULT_CACHE_DIR,  # logs/http_cache
+        seen_store_path=DEFAULT_STORE_PATH,  # logs/seen_urls.json
+        parser="selectolax",  # or "lxml" / "html.parser"
+        parse_workers=4,  # detail-page parsing processes
     )
     cli.run()
@@ -0,0 +1,131 @@
+"""
+JSON-LD JobPosting fast path
+
+Job boards often embed schema.org JobPosting data in
+<script type="application/ld+json"> blocks. When a page has it, the job's
+title, company, location, posting date and description are read from one small
+JSON blob found with a regex on the raw HTML, with no DOM walk at all. Pages
+without it fall back to the scrapers' selector logic.
+"""
+
+import html
+import json
+import re
+from typing import Any, Dict, Iterator, List, Optional
+from urllib.parse import urldefrag, urljoin
+
+from html_parser import DEFAULT_PARSER, parse_html
+
+JSON_LD_PATTERN = re.compile(
+    r"<script\b[^>]*\btype\s*=\s*[\"']?application/ld\+json[\"']?[^>]*>"
+    r"(.*?)</script>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def iter_json_ld(markup: str) -> Iterator[Dict[str, Any]]:
+    """Yield every JSON-LD object of a page, flattening lists, @graph and
+    ItemList containers; blocks that are not valid JSON are skipped"""
+    for match in JSON_LD_PATTERN.finditer(markup):
+        try:
+            data = json.loads(match.group(1))
+        except ValueError:
+            continue
+        yield from _flatten(data)
+
+
+def _flatten(data) -> Iterator[Dict[str, Any]]:
+    if isinstance(data, list):
+        for item in data:
+            yield from _flatten(item)
+        return
+    if not isinstance(data, dict):
+        return
+    yield data
+    if "@graph" in data:
+        yield from _flatten(data["@graph"])
+    for element in data.get("itemListElement") or []:
+        # ListItem wrappers hold the posting in "item"
+        if isinstance(element, dict) and isinstance(element.get("item"), dict):
+            element = element["item"]
+        yield from _flatten(element)
+
+
+def is_job_posting(data: Dict[str, Any]) -> bool:
+    types = data.get("@type")
+    return types == "JobPosting" or (isinstance(types, list) and "JobPosting" in types)
+
+
+def find_job_postings(markup: str) -> List[Dict[str, Any]]:
+    """All JobPosting objects embedded in a page"""
+    return [data for data in iter_json_ld(markup) if is_job_posting(data)]
+
+
+def page_posting(
+    postings: List[Dict[str, Any]], page_url: str
+) -> Optional[Dict[str, Any]]:
+    """The JobPosting of the detail page at page_url: the posting whose url is
+    the page's, else the page's only posting (None if other postings, such as
+    related jobs, leave it ambiguous)"""
+    page = urldefrag(page_url)[0].rstrip("/")
+    for posting in postings:
+        url = posting.get("url")
+        if isinstance(url, str) and url:
+            if urldefrag(urljoin(page_url, url))[0].rstrip("/") == page:
+                return posting
+    return postings[0] if len(postings) == 1 else None
+
+
+def _name(value) -> Optional[str]:
+    """Name of a schema.org Thing given as a string, object or list of them"""
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        value = value.get("name")
+    return value.strip() if isinstance(value, str) and value.strip() else None
+
+
+def _location(value) -> Optional[str]:
+    """City of a jobLocation Place (or the first of several)"""
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if not isinstance(value, dict):
+        return _name(value)
+    address = value.get("address")
+    if isinstance(address, dict):
+        for field in ("addressLocality", "addressRegion", "streetAddress"):
+            if isinstance(address.get(field), str) and address[field].strip():
+                return address[field].strip()
+        return None
+    return _name(address) or _name(value)
+
+
+def job_from_posting(posting: Dict[str, Any], base_url: str) -> Dict[str, Any]:
+    """List-card fields of a job (everything but the description) from a
+    JobPosting; publish_date is the ISO date of datePosted"""
+    url = posting.get("url")
+    date_posted = posting.get("datePosted")
+    return {
+        "title": _name(posting.get("title")) or "N/A",
+        "url": urljoin(base_url, url) if isinstance(url, str) and url else "N/A",
+        "company": _name(posting.get("hiringOrganization")) or "N/A",
+        "location": _location(posting.get("jobLocation")) or "N/A",
+        "publish_date": (
+            date_posted[:10] if isinstance(date_posted, str) and date_posted else "N/A"
+        ),
+    }
+
+
+def posting_description(
+    posting: Dict[str, Any], min_words: int, parser: str = DEFAULT_PARSER
+) -> str:
+    """Plain text of a JobPosting's (HTML) description, or "" unless it has
+    more than min_words words"""
+    description = posting.get("description")
+    if not isinstance(description, str):
+        return ""
+    if "<" not in description and "&lt;" in description:
+        # HTML that was entity-escaped a second time
+        description = html.unescape(description)
+    text = parse_html(description, parser).get_text(separator=" ", strip=True)
+    return text if len(text.split()) > min_words else ""
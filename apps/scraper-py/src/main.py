@@ -7,11 +7,11 @@
 """
 
 import json
-import random  # For delay calculations
 import subprocess
 import sys
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add paths to allow importing jobly and job_analyzer
@@ -28,16 +28,117 @@ if str(jobly_path) not in sys.path:
 import jobly_extractor  # noqa: E402
 import jobly_scraper  # noqa: E402
 
+# Import concurrent detail-page extraction
+from async_extraction import extract_jobs_concurrently  # noqa: E402
+
 # Import duunitori components
 from duunitori.duunitori_extractor import DuunitoriExtractor  # noqa: E402
 from duunitori.duunitori_scraper import DuunitoriScraper  # noqa: E402
+
+# Import cross-run index of already ingested jobs
+from fingerprint_index import NEW, UNCHANGED, UPDATED, FingerprintIndex  # noqa: E402
 from job_analyzer.hybrid_job_analyzer import HybridJobAnalyzer  # noqa: E402
 
 # Import deduplication utility
-from job_deduplicator import deduplicate_jobs  # noqa: E402
+from job_deduplicator import JobDeduplicator  # noqa: E402
+
+# Import list-page prefetching
+from pagination import iter_list_pages  # noqa: E402
+
+# Import detail-page parsing in worker processes
+from parse_pool import ParsePool  # noqa: E402
+
+# Import cross-run store of already scraped detail pages
+from seen_url_store import SeenUrlStore  # noqa: E402
+
+# Import shared HTTP transport
+from transport import HttpCache, configure_default_pool  # noqa: E402
+
+# Detail pages fetched concurrently per list page
+MAX_CONCURRENCY = 8
+
+# Per-host politeness budget applied to every list and detail request
+REQUESTS_PER_SECOND = 2.0
+BURST = 5
+
+# HTML parser backend of list and detail pages: "html.parser", "lxml" or
+# "selectolax" (see html_parser.PARSER_BACKENDS)
+PARSER = "selectolax"
+
+# Estimated title + description similarity (0-1) at which jobs of the same
+# company from different sources are the same posting (None: exact
+# fingerprint matches only)
+NEAR_DUPLICATE_THRESHOLD = 0.8
+
+# URLs and fingerprints deduplicated exactly before further ones go to a Bloom
+# filter, bounding deduplication memory on very large crawls (None: exact)
+MAX_EXACT_DEDUP_KEYS = 100_000
+
+# Most recently accepted jobs compared for near duplicates (~4 KB each);
+# both sources are deduplicated as they are scraped, so a posting's copy on
+# the other board arrives within the window
+NEAR_DUPLICATE_WINDOW = 20_000
+
+# Only pass jobs that are new or changed since earlier runs to the analysis,
+# translation and database steps (logs/fingerprint_index.sqlite3)
+INCREMENTAL = True
+
+# Processes parsing detail pages for the fetch threads of both sources
+# (None parses in the fetch threads)
+PARSE_WORKERS = 4
+
+
+def scrape_source(source, scraper, extractor, base_url, max_pages, deduplicator):
+    """Scrape one job board page by page and return its jobs that are not
+    duplicates of jobs already scraped from either source
+
+    Each source runs in its own thread; the per-host rate limiter gives every
+    source an independent politeness budget. Both threads share the
+    deduplicator, so a posting on both boards is kept from whichever source
+    reaches it first. extractor.jobs keeps all of the source's valid jobs
+    except cards skipped by the card index before their detail fetch.
+    """
+    step_start = time.time()
+    unique_jobs = []
+
+    try:
+        # The next list page is fetched while this one's cards are extracted
+        for _, job_cards in iter_list_pages(
+            scraper, base_url, max_pages, label=f"[{source}] "
+        ):
+            print(f"[{source}] Found {len(job_cards)} job postings.")
+            page_jobs = extract_jobs_concurrently(extractor, job_cards, MAX_CONCURRENCY)
+            valid_jobs = [
+                job_data
+                for job_data in page_jobs
+                if job_data and job_data.get("title") and job_data["title"] != "N/A"
+            ]
+            extractor.jobs.extend(valid_jobs)
+            # Deduplicate inline, page by page
+            unique_jobs.extend(deduplicator.unique(valid_jobs))
+
+    except Exception as e:
+        print(f"[{source}] Error during scraping: {e}")
+
+    print(
+        f"✅ Scraped {len(extractor.jobs)} jobs from {source},"
+        f" {len(unique_jobs)} unique (took {time.time() - step_start:.2f}s)"
+    )
+    return unique_jobs
 
 
 def main():
+    if not INCREMENTAL:
+        run_pipeline(None)
+        return
+    # Open for the whole run, so it is closed however the pipeline stops
+    with FingerprintIndex() as fingerprint_index:
+        run_pipeline(fingerprint_index)
+
+
+def run_pipeline(fingerprint_index):
+    """Run every pipeline step, passing only jobs that fingerprint_index
+    classifies as new or updated past Step 1 (all jobs if it is None)"""
     # Full pipeline
     print("\n" + "=" * 70)
     print("🚀 JOB SCRAPER & ANALYZER PIPELINE")
@@ -56,156 +157,150 @@ def main():
     # Pipeline Execution Timer
     pipeline_start_time = time.time()
 
-    # Step 1a: Scrape jobs from jobly.fi
-    print("\n🕷️ [1a/5] Scraping jobs from jobly.fi...")
+    # Rate-limit every request per host and serve unchanged list and detail
+    # pages from logs/http_cache
+    configure_default_pool(
+        cache=HttpCache(), requests_per_second=REQUESTS_PER_SECOND, burst=BURST
+    )
+
+    # Reuse descriptions of URLs scraped in earlier runs (logs/seen_urls.json)
+    seen_store = SeenUrlStore()
+    imported = seen_store.import_pipeline_results()
+    if imported:
+        print(f"📚 Imported {imported} known job URLs from earlier pipeline results")
+
+    # Step 1a + 1b: Scrape jobly.fi and duunitori.fi concurrently
+    print("\n🕷️ [1a+1b/5] Scraping jobs from jobly.fi and duunitori.fi...")
     step_start = time.time()
     try:
-        # Create JoblyExtractor and modify to return jobs instead of saving
-        scraper = jobly_scraper.JoblyScraper()
-        extractor = jobly_extractor.JoblyExtractor(scraper)
+        # One pool of parse workers serves both sources' fetch threads
+        parse_pool = (
+            ParsePool(
+                [jobly_scraper.JoblyScraper.PROFILE, DuunitoriScraper.PROFILE],
+                PARSER,
+                PARSE_WORKERS,
+            )
+            if PARSE_WORKERS
+            else None
+        )
 
-        # Use a temporary output file for scraping
-        temp_output = None  # None means save to default logs location
+        # Card fields (company + title + location) shared by both sources'
+        # extractors: a posting already found on one board is not fetched
+        # again from the other
+        card_index = JobDeduplicator(max_exact_keys=MAX_EXACT_DEDUP_KEYS)
 
-        # Reset extractor's job list
-        extractor.jobs = []
+        # Create extractors (jobs are collected in extractor.jobs)
+        scraper = jobly_scraper.JoblyScraper(parser=PARSER, parse_pool=parse_pool)
+        extractor = jobly_extractor.JoblyExtractor(
+            scraper, seen_store=seen_store, card_index=card_index
+        )
+        duunitori_scraper = DuunitoriScraper(parser=PARSER, parse_pool=parse_pool)
+        duunitori_extractor = DuunitoriExtractor(
+            duunitori_scraper, seen_store=seen_store, card_index=card_index
+        )
 
-        # Import the scraping variables/values from jobly_cli
+        # Scraping parameters
         BASE_URL = "https://www.jobly.fi/en/jobs"
         MAX_PAGES = 1  # Quick test mode
-        DELAY = random.uniform(1, 3) if hasattr(random, "uniform") else 1.5
-
-        # Scrape jobs
-        max_pages = MAX_PAGES if MAX_PAGES is not None else float("inf")
-        page_num = 0
-
-        while page_num < max_pages:
-            job_url = BASE_URL if page_num == 0 else f"{BASE_URL}?page={page_num}"
-            print(f"Scraping page {page_num + 1}...")
-
-            try:
-                job_cards = scraper.scrape_jobs_list(job_url)
-                if not job_cards and page_num > 0:
-                    print("No more job postings found.")
-                    break
-
-                print(f"Found {len(job_cards)} job postings.")
-                for job_card in job_cards:
-                    job_data = extractor.extract_job_data(job_card)
-                    if (
-                        job_data
-                        and job_data.get("title")
-                        and job_data["title"] != "N/A"
-                    ):
-                        extractor.jobs.append(job_data)
-
-                page_num += 1
-                if DELAY > 0:
-
-                    time.sleep(DELAY)
-
-            except Exception as e:
-                print(f"Error during scraping: {e}")
-                break
-
-        # Save scraped jobs temporarily (will be used by analyzer)
-        extractor.save_jobs(temp_output)
-        scraped_jobs = extractor.jobs.copy()
-
-        jobly_jobs = scraped_jobs.copy()  # Keep all for now, dedup later
-        print(
-            f"✅ Scraped {len(jobly_jobs)} jobs from jobly.fi "
-            f"took {time.time() - step_start:.2f}s"
-        )
-
-    except Exception as e:
-        print(f"❌ Jobly scraping failed: {e}")
-        return
-
-    # Step 1b: Scrape jobs from duunitori.fi
-    print("\n🕷️ [1b/5] Scraping jobs from duunitori.fi...")
-    step_start = time.time()
-    try:
-        # Create DuunitoriExtractor
-        duunitori_scraper = DuunitoriScraper()
-        duunitori_extractor = DuunitoriExtractor(duunitori_scraper)
-
-        # Reset extractor's job list
-        duunitori_extractor.jobs = []
-
-        # Duunitori scraping parameters
         DUUNITORI_BASE_URL = "https://duunitori.fi/tyopaikat"
         DUUNITORI_MAX_PAGES = 1  # Quick test mode
-        DUUNITORI_DELAY = random.uniform(1, 3)
 
-        # Scrape duunitori jobs
-        duunitori_max_pages = (
-            DUUNITORI_MAX_PAGES if DUUNITORI_MAX_PAGES is not None else float("inf")
+        # Advanced content-based deduplication (company + title + location),
+        # plus near duplicates with reworded titles or locations, applied to
+        # both sources' jobs as they are scraped
+        deduplicator = JobDeduplicator(
+            similarity_threshold=NEAR_DUPLICATE_THRESHOLD,
+            max_exact_keys=MAX_EXACT_DEDUP_KEYS,
+            near_duplicate_window=NEAR_DUPLICATE_WINDOW,
         )
-        duunitori_page_num = 0
 
-        while duunitori_page_num < duunitori_max_pages:
-            duunitori_job_url = (
-                DUUNITORI_BASE_URL
-                if duunitori_page_num == 0
-                else f"{DUUNITORI_BASE_URL}?page={duunitori_page_num}"
-            )
-            print(f"Scraping duunitori page {duunitori_page_num + 1}...")
-
-            try:
-                duunitori_job_cards = duunitori_scraper.scrape_jobs_list(
-                    duunitori_job_url
+        # Independent hosts: crawl both at once, each within its own
+        # per-host rate limit
+        try:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                jobly_future = executor.submit(
+                    scrape_source,
+                    "jobly.fi",
+                    scraper,
+                    extractor,
+                    BASE_URL,
+                    MAX_PAGES,
+                    deduplicator,
+                )
+                duunitori_future = executor.submit(
+                    scrape_source,
+                    "duunitori.fi",
+                    duunitori_scraper,
+                    duunitori_extractor,
+                    DUUNITORI_BASE_URL,
+                    DUUNITORI_MAX_PAGES,
+                    deduplicator,
                 )
-                if not duunitori_job_cards and duunitori_page_num > 0:
-                    print("No more duunitori job postings found.")
-                    break
-
-                print(f"Found {len(duunitori_job_cards)} duunitori job postings.")
-                for job_card in duunitori_job_cards:
-                    job_data = duunitori_extractor.extract_job_data(job_card)
-                    if (
-                        job_data
-                        and job_data.get("title")
-                        and job_data["title"] != "N/A"
-                    ):
-                        duunitori_extractor.jobs.append(job_data)
-
-                duunitori_page_num += 1
-                if DUUNITORI_DELAY > 0:
-                    time.sleep(DUUNITORI_DELAY)
-
-            except Exception as e:
-                print(f"Error during duunitori scraping: {e}")
-                break
-
-        duunitori_jobs = duunitori_extractor.jobs.copy()
+                jobly_jobs = jobly_future.result()
+                duunitori_jobs = duunitori_future.result()
+        finally:
+            if parse_pool is not None:
+                parse_pool.close()
+
+        # Save scraped jobly jobs (None means save to default logs location)
+        extractor.save_jobs(None)
+
         print(
-            f"✅ Scraped {len(duunitori_jobs)} jobs from duunitori.fi"
+            f"✅ Scraped {len(extractor.jobs) + len(duunitori_extractor.jobs)} jobs"
+            " from both sources"
             f" (took {time.time() - step_start:.2f}s)"
         )
+        # With a parse pool, workers learn selectors in their own processes
+        if parse_pool is None:
+            for source, source_scraper in [
+                ("jobly.fi", scraper),
+                ("duunitori.fi", duunitori_scraper),
+            ]:
+                print(
+                    f"   🎯 {source} description selectors: "
+                    f"{source_scraper.description_extractor.stats()}"
+                )
 
     except Exception as e:
-        print(f"❌ Duunitori scraping failed: {e}")
+        print(f"❌ Scraping failed: {e}")
         return
 
-    # Step 1c: Combine and deduplicate across both sources
-    print("\n🔄 [1c/5] Combining and deduplicating jobs...")
-    step_start = time.time()
+    # Step 1c: Combine both sources' jobs, deduplicated while scraping
+    print("\n🔄 [1c/5] Combining deduplicated jobs...")
     try:
-        all_scraped_jobs = jobly_jobs + duunitori_jobs
-
-        # Advanced content-based deduplication (company + title + location)
-        scraped_jobs = deduplicate_jobs(all_scraped_jobs)
+        scraped_jobs = jobly_jobs + duunitori_jobs
 
         print(
             f"✅ Combined: {len(scraped_jobs)} jobs"
-            f" (took {time.time() - step_start:.2f}s)"
+            f" ({card_index.duplicates} duplicate cards not fetched,"
+            f" {deduplicator.duplicates} duplicates dropped while scraping)"
+        )
+
+        if fingerprint_index is not None:
+            groups = fingerprint_index.classify_jobs(scraped_jobs)
+            # Unchanged jobs are done; only their last_seen moves
+            fingerprint_index.record(groups[UNCHANGED])
+            scraped_jobs = groups[NEW] + groups[UPDATED]
+            print(
+                f"🗂️ {len(groups[NEW])} new, {len(groups[UPDATED])} updated,"
+                f" {len(groups[UNCHANGED])} unchanged since earlier runs"
+            )
+
+        # Persist known URLs for the next run
+        seen_store.save()
+        print(
+            f"📚 Reused {seen_store.hits} stored descriptions,"
+            f" fetched {seen_store.misses} detail pages"
         )
 
     except Exception as e:
         print(f"❌ Deduplication failed: {e}")
         return
 
+    if fingerprint_index is not None and not scraped_jobs:
+        print("✅ No new or updated jobs since the last run")
+        return
+
     # Step 2: Pre-translate jobs to English
     print("\n🌐 [2/5] Pre-translating jobs to English...")
     step_start = time.time()
@@ -438,6 +533,11 @@ def main():
                     f"(took {time.time() - step_start:.2f}s)"
                 )
 
+                # In the database: the next run classifies these jobs as
+                # unchanged (jobs that failed to insert are processed again)
+                if fingerprint_index is not None:
+                    fingerprint_index.record(scraped_jobs)
+
     except Exception as e:
         print(f"❌ Insert original jobs failed: {e}")
         print("   Continuing with pipeline...")
@@ -0,0 +1,158 @@
+"""
+Near-Duplicate Detection
+
+Finds jobs whose title + description are nearly the same text ("Senior
+Developer" vs "Senior Software Developer" over the same description) with
+MinHash signatures and LSH banding:
+
+1. The normalized text is split into word shingles (overlapping runs of
+   shingle_size words), each hashed to 32 bits
+2. num_perm hash permutations of the shingles are applied with numpy; the
+   signature keeps each permutation's minimum, and two signatures agree in
+   a position with probability equal to the texts' Jaccard similarity
+3. Signatures are cut into bands; texts sharing any whole band land in the
+   same bucket and become candidates, which are then checked against the
+   similarity threshold (bands are sized so that texts at the threshold
+   become candidates 95% of the time)
+
+Only candidates are compared, so indexing n jobs takes roughly linear time
+instead of comparing every pair. With max_size, only the most recently added
+texts are kept (a sliding window), bounding memory at about 4 KB per text
+(signature and band buckets) for the default settings.
+"""
+
+import zlib
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_NUM_PERM = 128
+DEFAULT_SHINGLE_SIZE = 3
+
+# Permutations are (a * x + b) mod MERSENNE_PRIME, truncated to 32 bits
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+def shingles(text: str, size: int = DEFAULT_SHINGLE_SIZE) -> List[str]:
+    """Overlapping runs of `size` words (the whole text if shorter)"""
+    words = text.split()
+    if len(words) <= size:
+        return [" ".join(words)] if words else []
+    return [" ".join(words[i : i + size]) for i in range(len(words) - size + 1)]
+
+
+def lsh_bands(threshold: float, num_perm: int, recall: float = 0.95) -> Tuple[int, int]:
+    """(bands, rows) with the most rows per band (fewest dissimilar candidates)
+    that still makes two texts at the threshold candidates with probability
+    of at least recall"""
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if 1 - (1 - threshold**rows) ** bands >= recall:
+            best = (bands, rows)
+    return best
+
+
+class NearDuplicateIndex:
+    """MinHash LSH index of texts, answering "is there a similar text?" """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        seed: int = 1,
+        max_size: Optional[int] = None,
+    ):
+        """
+        Args:
+            threshold: Estimated Jaccard similarity of shingle sets at which a
+            text is a near duplicate (0-1)
+            num_perm: Signature length; longer is more accurate and slower
+            shingle_size: Words per shingle
+            seed: Seed of the hash permutations
+            max_size: Texts kept; adding more evicts the oldest (None: all)
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.max_size = max_size
+        self.bands, self.rows = lsh_bands(threshold, num_perm)
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, MERSENNE_PRIME, num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, MERSENNE_PRIME, num_perm, dtype=np.uint64)
+        # One bucket table per band: band bytes -> keys
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [
+            {} for _ in range(self.bands)
+        ]
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """MinHash signature of a normalized text, None if it has no words"""
+        words = shingles(text, self.shingle_size)
+        if not words:
+            return None
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode()) for shingle in words),
+            dtype=np.uint64,
+            count=len(words),
+        )
+        # uint64 products wrap around, which keeps them well mixed
+        permuted = (np.outer(hashes, self._a) + self._b) % MERSENNE_PRIME & MAX_HASH
+        # Values fit in 32 bits: store them in half the space
+        return permuted.min(axis=0).astype(np.uint32)
+
+    def _band_keys(self, signature: np.ndarray):
+        rows = self.rows
+        for band in range(self.bands):
+            yield band, signature[band * rows : (band + 1) * rows].tobytes()
+
+    def similarity(self, first: np.ndarray, second: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return float(np.mean(first == second))
+
+    def query(
+        self,
+        signature: np.ndarray,
+        accept: Optional[Callable[[Hashable], bool]] = None,
+    ) -> Optional[Hashable]:
+        """Key of the first indexed text at least threshold-similar (and, if
+        given, whose key passes accept), else None"""
+        checked = set()
+        for band, band_key in self._band_keys(signature):
+            for key in self._buckets[band].get(band_key, ()):
+                if key in checked:
+                    continue
+                checked.add(key)
+                if accept is not None and not accept(key):
+                    continue
+                if self.similarity(signature, self._signatures[key]) >= self.threshold:
+                    return key
+        return None
+
+    def add(self, key: Hashable, signature: np.ndarray):
+        """Index a text's signature under key, evicting the oldest text when
+        over max_size"""
+        self._signatures[key] = signature
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band].setdefault(band_key, []).append(key)
+        if self.max_size is not None and len(self._signatures) > self.max_size:
+            # Dicts keep insertion order: the first key is the oldest
+            self.remove(next(iter(self._signatures)))
+
+    def remove(self, key: Hashable):
+        """Drop a text from the index"""
+        signature = self._signatures.pop(key)
+        for band, band_key in self._band_keys(signature):
+            bucket = self._buckets[band][band_key]
+            bucket.remove(key)
+            if not bucket:
+                del self._buckets[band][band_key]
@@ -0,0 +1,87 @@
+"""
+Pipelined Pagination
+
+A producer thread fetches upcoming list pages into a bounded queue while the
+caller is still extracting the cards (and detail pages) of the current page,
+so list-page latency is hidden behind extraction.
+"""
+
+import queue
+import threading
+from typing import Any, Iterator, List, Optional, Tuple
+
+DEFAULT_PREFETCH_PAGES = 2
+
+_DONE = object()
+
+
+def page_url(base_url: str, page_num: int) -> str:
+    """Return the URL of a zero-based list page"""
+    return base_url if page_num == 0 else f"{base_url}?page={page_num}"
+
+
+def iter_list_pages(
+    scraper,
+    base_url: str,
+    max_pages: Optional[int] = None,
+    prefetch: int = DEFAULT_PREFETCH_PAGES,
+    label: str = "",
+) -> Iterator[Tuple[int, List[Any]]]:
+    """Yield (page_num, job_cards) for each list page, fetching ahead
+
+    Args:
+        scraper: Object with scrape_jobs_list(url)
+        base_url: URL of the first list page
+        max_pages: Maximum number of pages (unlimited if None)
+        prefetch: Pages fetched ahead of the one being processed
+        label: Prefix for progress messages, e.g. "[jobly.fi] "
+
+    Stops after max_pages or at the first empty page after the first one.
+    Errors raised while fetching a page are re-raised to the caller.
+    """
+    pages: queue.Queue = queue.Queue(maxsize=max(1, prefetch))
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        # Give up if the consumer went away instead of blocking forever
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        page_num = 0
+        try:
+            while max_pages is None or page_num < max_pages:
+                if stop.is_set():
+                    return
+                print(f"{label}Scraping page {page_num + 1}...")
+                job_cards = scraper.scrape_jobs_list(page_url(base_url, page_num))
+
+                # Stop if no more jobs found (but allow first page to be empty)
+                if not job_cards and page_num > 0:
+                    print(f"{label}No more job postings found.")
+                    break
+                if not put((page_num, job_cards)):
+                    return
+                page_num += 1
+        except Exception as e:
+            put(e)
+            return
+        put(_DONE)
+
+    producer = threading.Thread(target=produce, name="list-page-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
@@ -0,0 +1,96 @@
+"""
+Parse Worker Pool
+
+Parsing detail pages and scrubbing personal data from them is CPU-bound, so
+concurrent fetch threads still take turns on the GIL while parsing. A ParsePool
+parses in worker processes instead: fetch threads hand over the downloaded
+body bytes and its declared encoding, and get the cleaned description back.
+Decoding (and charset detection when no encoding is declared) runs in the
+worker too, so fetch concurrency (threads) and parse parallelism (processes)
+scale independently.
+
+Each worker holds one ProfileScraper per site profile, built once when the
+worker starts; its learned description selectors stay in that worker.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Optional
+
+import requests
+
+from html_parser import DEFAULT_PARSER
+from site_profiles import ProfileScraper, SiteProfile
+
+# Worker process state: profile name -> scraper parsing its pages
+_scrapers: Dict[str, ProfileScraper] = {}
+
+
+def _init_worker(profiles, parser):
+    for profile in profiles:
+        _scrapers[profile.name] = ProfileScraper(parser=parser, profile=profile)
+
+
+def decode_body(content: bytes, encoding: Optional[str]) -> str:
+    """Text of a response body, decoded as requests' Response.text would"""
+    response = requests.Response()
+    response._content = content
+    response.encoding = encoding
+    return response.text
+
+
+def _parse_job_page(profile_name, content, encoding, job_url):
+    markup = decode_body(content, encoding)
+    return _scrapers[profile_name].parse_job_page(markup, job_url)
+
+
+class ParsePool:
+    """Worker processes parsing the detail pages of the given site profiles"""
+
+    def __init__(
+        self,
+        profiles: Iterable[SiteProfile],
+        parser: str = DEFAULT_PARSER,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Args:
+            profiles: Sites whose pages the workers parse
+            parser: Parser backend, see html_parser.PARSER_BACKENDS
+            max_workers: Worker processes (number of CPUs if None)
+        """
+        self.profiles = list(profiles)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # Spawned rather than forked: the pool is started next to running
+        # fetch threads, whose held locks a forked child would inherit
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.profiles, parser),
+        )
+
+    def parse_job_page(
+        self,
+        profile_name: str,
+        content: bytes,
+        encoding: Optional[str],
+        job_url: str,
+    ) -> str:
+        """Cleaned description of a detail page's raw body (encoding as in
+        Response.encoding, detected if None), see ProfileScraper.parse_job_page
+        (blocks until a worker is done)"""
+        return self._executor.submit(
+            _parse_job_page, profile_name, content, encoding, job_url
+        ).result()
+
+    def close(self):
+        """Stop the workers once pending pages are parsed"""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
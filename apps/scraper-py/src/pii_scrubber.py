@@ -0,0 +1,165 @@
+"""
+PII Scrubber
+
+Removes phone numbers, email addresses, URLs and contact-person names from job
+descriptions. Every pattern is compiled once at import time and each pass is
+linear in the length of the text:
+
+1. Phone numbers, then email addresses and URLs (these two only when the text
+   contains "@" / "://")
+2. One scan per contact keyword ("yhteystiedot", "contact", ...) present in
+   the text, replacing each occurrence and everything up to the next two-word
+   (name-like) pair on its line with the keyword itself
+3. Whitespace collapsing
+
+No pattern can backtrack over more than one run of characters: the email and
+name patterns may only start where a run starts (negative lookbehind), so
+adversarial inputs such as "a.a.a.a..." or "email, email, ..." stay linear.
+The email match is then trimmed to where the previous pattern's leading \b
+would have started it (see remove_emails).
+"""
+
+import re
+from typing import Optional
+
+# More specific phone number patterns (avoid matching dates). The first digit
+# is spelled out (\d\d{1,2} rather than \d{2,3}) so the regex engine can skip
+# ahead to candidate digits instead of trying every position.
+PHONE_PATTERNS = [
+    # +358 50 339 2228
+    re.compile(r"\+\d{1,3}[\s\-]\d{1,2}[\s\-]\d{1,3}[\s\-]?\d{0,4}"),
+    # 050 339 2228
+    re.compile(r"\d\d{1,2}[\s\-]\d{1,3}[\s\-]\d{1,4}[\s\-]?\d{0,4}"),
+    # 050-339-2228
+    re.compile(r"\d\d{2}[\s\-]\d{3}[\s\-]\d{4}"),
+]
+ADDRESS = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
+EMAIL = re.compile(r"(?<![A-Za-z0-9._%+-])" + ADDRESS.pattern)
+URL = re.compile(r"https?://[^\s]+")
+WORD_CHAR = re.compile(r"\w")
+
+# Keywords introducing a contact person's name, applied in this order
+CONTACT_KEYWORDS = [
+    "yhteydenotto",
+    "yhteystiedot",
+    "contact",
+    "lisätietoja",
+    "additional information",
+    "ota yhteyttä",
+    "call",
+    "email",
+]
+KEYWORD_PATTERNS = [
+    (keyword, re.compile(r"\b" + re.escape(keyword) + r"\b", re.IGNORECASE))
+    for keyword in CONTACT_KEYWORDS
+]
+# Two adjacent words of 2+ ASCII letters, e.g. "Matti Virtanen"
+NAME_PAIR = re.compile(r"(?<![a-z])[a-z]{2,}\s[a-z]{2,}", re.IGNORECASE)
+
+WHITESPACE = re.compile(r"\s+")
+
+
+def remove_contact_names(text: str, keyword: str, pattern: re.Pattern) -> str:
+    """Replace each occurrence of a contact keyword and the text up to the next
+    name pair starting on the same line with the keyword (text itself is
+    returned if nothing was replaced)
+
+    Same result as re.sub(r"\bkeyword\b.*?NAME", keyword, text, re.I) in one
+    linear scan: the lazy .*? re-searched the rest of the line for every
+    keyword occurrence without a name after it.
+    """
+    parts = []
+    pos = 0
+    # First name pair / newline at or after the current keyword, reused until
+    # a keyword lies past them, so no stretch of text is searched twice
+    pair = None
+    newline = -1
+    for match in pattern.finditer(text):
+        if match.start() < pos:
+            continue  # inside text already replaced
+        end = match.end()
+        if pair is None or pair.start() < end:
+            pair = NAME_PAIR.search(text, end)
+            if pair is None:
+                break  # no names left: later keywords cannot match either
+        if newline < end:
+            newline = text.find("\n", end)
+            if newline == -1:
+                newline = len(text)
+        if pair.start() >= newline:
+            continue  # the name is on a later line
+        parts.append(text[pos : match.start()])
+        parts.append(keyword)
+        pos = pair.end()
+    if not parts:
+        return text
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+def remove_emails(text: str) -> str:
+    """Remove what EMAIL.sub would with the previous pattern's leading \b
+
+    EMAIL starts at the beginning of a run of address characters; the \b
+    pattern started at the run's first word boundary, which can lie inside
+    the run ("lisä.x@y.fi" loses only ".x@y.fi") or not exist at all
+    ("lisätietojax@y.fi" is no email, but the text after its "@" may start
+    one). Later starts in the same run end the same way, so each run is only
+    scanned once; a run only continues past an email that ended inside it.
+    """
+    parts = []
+    pos = 0
+    search_from = 0
+    after_email = False
+    while True:
+        match = ADDRESS.match(text, search_from) if after_email else None
+        if match is None:
+            match = EMAIL.search(text, search_from)
+        if match is None:
+            break
+        start = match.start()
+        at = text.index("@", start)
+        word = start > 0 and WORD_CHAR.match(text[start - 1]) is not None
+        while start < at:
+            is_word = WORD_CHAR.match(text[start]) is not None
+            if is_word != word:
+                break
+            word = is_word
+            start += 1
+        if start == at:
+            # No word boundary before the "@"
+            search_from = at + 1
+            after_email = False
+            continue
+        parts.append(text[pos:start])
+        pos = search_from = match.end()
+        after_email = True
+    if not parts:
+        return text
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+def scrub_personal_data(text: Optional[str]) -> Optional[str]:
+    """Remove personal information like phone numbers, emails, and person names."""
+    if not text:
+        return text
+
+    for pattern in PHONE_PATTERNS:
+        text = pattern.sub("", text)
+    if "@" in text:
+        text = remove_emails(text)
+    if "://" in text:
+        text = URL.sub("", text)
+
+    # Substring checks skip the keyword scans for keywords not in the text
+    lowered = text.lower()
+    for keyword, pattern in KEYWORD_PATTERNS:
+        if keyword in lowered:
+            cleaned = remove_contact_names(text, keyword, pattern)
+            if cleaned is not text:
+                text = cleaned
+                lowered = text.lower()
+
+    # Clean up extra whitespace
+    return WHITESPACE.sub(" ", text).strip()
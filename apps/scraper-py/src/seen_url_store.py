@@ -0,0 +1,167 @@
+"""
+Seen-URL Store
+
+Persistent URL -> (fingerprint, description hash, last_seen) index shared across
+pipeline runs. Detail pages of known URLs are not fetched again; their stored
+description is reused until the entry is older than the refresh-after TTL.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from job_deduplicator import generate_job_fingerprint
+
+# apps/scraper-py/logs/
+LOGS_DIR = Path(__file__).resolve().parent.parent / "logs"
+DEFAULT_STORE_PATH = LOGS_DIR / "seen_urls.json"
+DEFAULT_REFRESH_AFTER = timedelta(days=7)
+
+
+def hash_description(description: str) -> str:
+    """Return a short content hash of a job description"""
+    return hashlib.blake2b(description.encode(), digest_size=16).hexdigest()
+
+
+class SeenUrlStore:
+    """URL index consulted before fetching a job's detail page"""
+
+    def __init__(self, path=None, refresh_after: timedelta = DEFAULT_REFRESH_AFTER):
+        """
+        Args:
+            path: JSON file backing the store (DEFAULT_STORE_PATH if None)
+            refresh_after: Age after which a stored description is fetched again
+        """
+        self.path = Path(path) if path else DEFAULT_STORE_PATH
+        self.refresh_after = refresh_after
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Load entries from disk, starting empty if the file is missing or broken"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except FileNotFoundError:
+            self.entries = {}
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Warning: Ignoring unreadable seen-URL store {self.path}: {e}")
+            self.entries = {}
+
+    def save(self):
+        """Write the store to disk atomically"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = json.dumps(self.entries, ensure_ascii=False)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def lookup(self, url: str, fingerprint: str) -> Optional[str]:
+        """Return the stored description if the entry is fresh and unchanged"""
+        with self._lock:
+            entry = self.entries.get(url)
+            if not entry or entry.get("fingerprint") != fingerprint:
+                return None
+            fetched_at = datetime.fromisoformat(entry["fetched_at"])
+            if datetime.now() - fetched_at > self.refresh_after:
+                return None
+            entry["last_seen"] = datetime.now().isoformat(timespec="seconds")
+            return entry["description"]
+
+    def record(
+        self,
+        url: str,
+        fingerprint: str,
+        description: str,
+        fetched_at: Optional[datetime] = None,
+    ):
+        """Store the description fetched for a URL"""
+        fetched_at = (fetched_at or datetime.now()).isoformat(timespec="seconds")
+        with self._lock:
+            self.entries[url] = {
+                "fingerprint": fingerprint,
+                "description_hash": hash_description(description),
+                "description": description,
+                "fetched_at": fetched_at,
+                "last_seen": fetched_at,
+            }
+
+    def fetch_description(
+        self, job: Dict[str, Any], scrape_job: Callable[[str], str]
+    ) -> str:
+        """Return the job's description, only calling scrape_job for unknown
+        or stale URLs"""
+        url = job.get("url")
+        if not url or url == "N/A":
+            return scrape_job(url)
+
+        fingerprint = generate_job_fingerprint(job)
+        description = self.lookup(url, fingerprint)
+        # Fetch threads of both sources share the store
+        with self._lock:
+            if description is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if description is not None:
+            return description
+
+        description = scrape_job(url)
+        if description and description != "N/A":
+            self.record(url, fingerprint, description)
+        return description
+
+    def import_pipeline_results(self, logs_dir=None) -> int:
+        """Seed the store from earlier pipeline_results_*.json files
+
+        Uses the original (pre-translation) title and description, and the
+        file's modification time as the fetch time. Returns the number of
+        URLs added or refreshed.
+        """
+        logs_dir = Path(logs_dir) if logs_dir else LOGS_DIR
+        imported = 0
+        # Oldest first so newer results win
+        for results_file in sorted(
+            logs_dir.glob("pipeline_results_*.json"), key=lambda p: p.stat().st_mtime
+        ):
+            try:
+                with open(results_file, "r", encoding="utf-8") as f:
+                    jobs = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Warning: Skipping {results_file.name}: {e}")
+                continue
+
+            # Whole seconds like the stored fetched_at, so the comparison below
+            # skips files imported before
+            fetched_at = datetime.fromtimestamp(int(results_file.stat().st_mtime))
+            for job in jobs:
+                url = job.get("url")
+                description = job.get("original_description") or job.get("description")
+                if not url or url == "N/A" or not description or description == "N/A":
+                    continue
+
+                existing = self.entries.get(url)
+                if existing and existing["fetched_at"] >= fetched_at.isoformat():
+                    continue
+
+                card = {**job, "title": job.get("original_title") or job.get("title")}
+                self.record(
+                    url, generate_job_fingerprint(card), description, fetched_at
+                )
+                imported += 1
+        return imported
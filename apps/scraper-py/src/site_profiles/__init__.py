@@ -0,0 +1,22 @@
+"""
+Site Profiles Package
+
+Each job board is a declarative SiteProfile (selectors, field rules, URLs)
+whose CSS selectors are compiled once at import time. ProfileScraper and
+ProfileExtractor run any profile, so fetching, parsing and extraction
+improvements apply to every site at once.
+"""
+
+from .duunitori import DUUNITORI
+from .engine import ProfileExtractor, ProfileScraper
+from .jobly import JOBLY
+from .profile import FieldRule, SiteProfile
+
+__all__ = [
+    "DUUNITORI",
+    "FieldRule",
+    "JOBLY",
+    "ProfileExtractor",
+    "ProfileScraper",
+    "SiteProfile",
+]
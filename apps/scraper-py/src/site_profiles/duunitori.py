@@ -0,0 +1,77 @@
+"""duunitori.fi site profile"""
+
+from bs4 import SoupStrainer
+
+from .profile import FieldRule, SiteProfile
+
+
+def is_job_card_tag(name, attrs):
+    """SoupStrainer test keeping the elements matched by the card selectors
+    (div.job-box / [class*=job-box] / [data-jobid], article)"""
+    if name == "article":
+        return True
+    if name != "div":
+        return False
+    classes = attrs.get("class") or ""
+    if not isinstance(classes, str):
+        classes = " ".join(classes)
+    return "job-box" in classes or "data-jobid" in attrs
+
+
+def location_before_dash(text):
+    # "Helsinki – 3 km" -> "Helsinki"
+    return text.split("–")[0].strip()
+
+
+def strip_published_prefix(text):
+    if text.startswith("Julkaistu"):
+        return text.replace("Julkaistu", "").strip()
+    return text
+
+
+DUUNITORI = SiteProfile(
+    name="duunitori",
+    source="duunitori.fi",
+    base_url="https://duunitori.fi",
+    list_url="https://duunitori.fi/tyopaikat",
+    card_selectors=[
+        "div.job-box",  # Parent container with job data
+        'div[class*="job-box"]',  # Container pattern
+        "div[data-jobid]",  # Container with job ID
+        "article",  # Fallback to article tags
+    ],
+    list_page_strainer=SoupStrainer(is_job_card_tag),
+    title=[FieldRule("a.job-box__hover"), FieldRule("a")],
+    # Company is a data attribute of the job link, else a company element
+    company=[
+        FieldRule("a.job-box__hover", attribute="data-company"),
+        FieldRule('span[class*="company"]'),
+        FieldRule('div[class*="company"]'),
+        FieldRule('[class*="employer"]'),
+        FieldRule('span[class*="recruiter"]'),
+        FieldRule('div[class*="recruiter"]'),
+    ],
+    location=[FieldRule(".job-box__job-location", clean=location_before_dash)],
+    publish_date=[FieldRule(".job-box__job-posted", clean=strip_published_prefix)],
+    description_selectors=[
+        # Duunitori.fi specific selectors (highest priority)
+        'div[class*="job-description"]',
+        'div[class*="description"]',
+        ".job-description",
+        ".description",
+        'div[class*="job-content"]',
+        'section[class*="job-content"]',
+        # Common job selectors
+        "div.job-description",
+        "section.job-description",
+        "div.description",
+        "section.description",
+        "div.content",
+        "main.content",
+        "article",
+        "main",
+    ],
+    # The description sits in the page's main block
+    description_stop_markers=(b"description--jobentry", b"</main>"),
+    fallback_card_link='a[href*="/tyopaikat/"]',
+)
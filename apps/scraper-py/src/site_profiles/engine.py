@@ -0,0 +1,360 @@
+"""Scraper and extractor running any SiteProfile"""
+
+import json
+import os
+from datetime import datetime
+from urllib.parse import urldefrag
+
+import requests
+
+from description_extractor import DescriptionExtractor
+from html_parser import DEFAULT_PARSER, node_key, parse_html, release_tree
+from json_ld import (
+    find_job_postings,
+    is_job_posting,
+    job_from_posting,
+    page_posting,
+    posting_description,
+)
+from pii_scrubber import scrub_personal_data
+from transport import get_default_pool
+
+from .profile import SiteProfile
+
+
+def closest_div(node, with_class):
+    """Nearest div enclosing node (with a class attribute if with_class)"""
+    node = node.parent
+    while node is not None:
+        if node.name == "div" and (not with_class or node.get("class") is not None):
+            return node
+        node = node.parent
+    return None
+
+
+def link_containers(links, with_class, limit):
+    """Distinct closest divs of the links in document order, at most limit"""
+    containers = {}
+    for link in links:
+        div = closest_div(link, with_class)
+        if div is not None:
+            containers.setdefault(node_key(div), div)
+            if len(containers) >= limit:
+                break
+    return list(containers.values())
+
+
+def record_key(job):
+    """URL of a job record without fragment or trailing slash"""
+    return urldefrag(job["url"])[0].rstrip("/")
+
+
+def merge_posting_records(card_jobs, posting_jobs):
+    """Records of a list page that embeds JobPosting data: the posting records
+    when they cover every linked card, else the cards in page order, each card
+    with a posting overlaid by it, followed by the postings no card links to"""
+    postings = {record_key(job): job for job in posting_jobs}
+    if all(record_key(job) in postings for job in card_jobs if job["url"] != "N/A"):
+        return posting_jobs
+    jobs = []
+    for job in card_jobs:
+        posting = postings.pop(record_key(job), None)
+        if posting is not None:
+            # Card fields fill in what the posting leaves out
+            job = {**job, **{k: v for k, v in posting.items() if v != "N/A"}}
+        jobs.append(job)
+    return jobs + list(postings.values())
+
+
+class ProfileScraper:
+    """Fetches list and detail pages of the job board described by PROFILE"""
+
+    PROFILE: SiteProfile = None
+
+    def __init__(
+        self, transport=None, parser=DEFAULT_PARSER, profile=None, parse_pool=None
+    ):
+        """
+        Args:
+            transport: SessionPool the pages are fetched through (shared default
+            pool if None)
+            parser: Parser backend of list and detail pages, see
+            html_parser.PARSER_BACKENDS
+            profile: Site to scrape (the class's PROFILE if None)
+            parse_pool: ParsePool parsing detail pages in worker processes
+            (parsed in the calling thread if None)
+        """
+        self.profile = profile or self.PROFILE
+        # Pooled keep-alive sessions shared with the other scrapers by default
+        self.transport = transport or get_default_pool()
+        self.parser = parser
+        self.parse_pool = parse_pool
+        # Remembers the selector that matched on each host and tries it first
+        self.description_extractor = DescriptionExtractor(
+            self.profile.description_patterns,
+            self.profile.min_description_words,
+            generic=self.profile.generic_description_patterns,
+        )
+
+    def clean_personal_data(self, text):
+        """Remove personal information like phone numbers, emails, and person names."""
+        return scrub_personal_data(text)
+
+    def description_from_posting(self, posting):
+        """Cleaned description of a JSON-LD JobPosting ("" if too short)"""
+        text = posting_description(
+            posting, self.profile.min_description_words, self.parser
+        )
+        return self.clean_personal_data(text) if text else ""
+
+    def posting_record(self, posting):
+        """Job record of a JSON-LD JobPosting, with its description if long
+        enough to spare the detail page"""
+        job = job_from_posting(posting, self.profile.base_url)
+        description = self.description_from_posting(posting)
+        if description:
+            job["description"] = description
+        return job
+
+    def scrape_job(self, job_url):
+        if not job_url or job_url == "N/A":
+            return "N/A"
+
+        try:
+            response = self.transport.get(
+                job_url, stop_after=self.profile.description_stop_markers
+            )
+        except requests.RequestException as e:
+            print(f"Error fetching the job URL: {e}")
+            return "N/A"
+
+        if self.parse_pool is not None:
+            # Decoded and parsed in a worker process; this thread only waits
+            # for the result
+            try:
+                return self.parse_pool.parse_job_page(
+                    self.profile.name, response.content, response.encoding, job_url
+                )
+            except Exception as e:
+                print(f"Error processing job page: {e}")
+                return "N/A"
+        return self.parse_job_page(response.text, job_url)
+
+    def parse_job_page(self, markup, job_url):
+        """Cleaned description of a fetched detail page ("N/A" if none)"""
+        try:
+            # Embedded JobPosting data of this job spares the DOM walk
+            posting = page_posting(find_job_postings(markup), job_url)
+            if posting is not None:
+                job_description = self.description_from_posting(posting)
+                if job_description:
+                    return job_description
+
+            soup = parse_html(markup, self.parser)
+            try:
+                job_description = self.description_extractor.extract(soup, job_url)
+            finally:
+                release_tree(soup)
+
+            # Clean personal data from the description
+            if job_description:
+                job_description = self.clean_personal_data(job_description)
+
+            if not job_description:
+                job_description = "N/A"
+
+            return job_description
+
+        except Exception as e:
+            print(f"Error processing job page: {e}")
+            return "N/A"
+
+    def scrape_jobs_list(self, job_url):
+        """Plain job records of a list page (see SiteProfile.read_card)"""
+        if not job_url:
+            raise ValueError("Job URL must be provided")
+
+        try:
+            response = self.transport.get(job_url)
+
+            # Handle Brotli decompression automatically
+            html_content = response.text
+
+            postings = [
+                posting
+                for posting in find_job_postings(html_content)
+                if posting.get("url") and posting.get("title")
+            ]
+
+            # List pages are parsed down to the job cards, skipping
+            # nav/footer/scripts
+            soup = parse_html(
+                html_content,
+                self.parser,
+                parse_only=self.profile.list_page_strainer,
+            )
+            try:
+                job_cards = []
+                for pattern in self.profile.card_patterns:
+                    job_cards = soup.select(pattern)
+                    if job_cards:
+                        break
+                # Cards are read into plain records right away so the tree can
+                # be freed before the detail pages are fetched
+                jobs = self.read_records(job_cards, self.profile.read_card)
+            finally:
+                release_tree(soup)
+
+            if postings:
+                # Embedded JobPosting data stands in for the cards it covers;
+                # pages may embed only some jobs, such as featured ones
+                return merge_posting_records(
+                    jobs, self.read_records(postings, self.posting_record)
+                )
+
+            if not jobs and self.profile.fallback_link_pattern is not None:
+                # The fallbacks search the whole page, not just the card subtrees
+                soup = parse_html(html_content, self.parser)
+                try:
+                    jobs = self.read_records(
+                        self.find_cards_by_link(soup), self.profile.read_card
+                    )
+                finally:
+                    release_tree(soup)
+
+            return jobs
+
+        except requests.RequestException as e:
+            print(f"Error fetching the job URL: {e}")
+            return []
+
+    @staticmethod
+    def read_records(cards, read):
+        """read(card) of every card, skipping cards that cannot be read"""
+        jobs = []
+        for card in cards:
+            try:
+                jobs.append(read(card))
+            except Exception as e:
+                print(f"Error extracting job data: {e}")
+        return jobs
+
+    def find_cards_by_link(self, soup):
+        """Fallback job cards: the closest div around each job link
+
+        One pass over the job links, each climbing to its card, rather than a
+        subtree search for a link below every div of the page.
+        """
+        print("  ⚠️  No job cards found with specific selectors...")
+        links = soup.select(self.profile.fallback_link_pattern)
+        # Closest div with a class around each job link
+        job_cards = link_containers(links, with_class=True, limit=10)
+        print(f"  🔍 Found {len(job_cards)} potential job cards with link pattern")
+
+        # Last resort: closest div of any kind
+        if not job_cards:
+            print("  ⚠️  Still no cards, trying last resort...")
+            job_cards = link_containers(links, with_class=False, limit=20)
+            print(f"  🔍 Last resort found {len(job_cards)} potential cards")
+
+        return job_cards
+
+
+class ProfileExtractor:
+    """Turns the job cards of a ProfileScraper into job dicts"""
+
+    PROFILE: SiteProfile = None
+
+    def __init__(self, scraper, seen_store=None, profile=None, card_index=None):
+        self.jobs = []
+        self.scraper = scraper
+        self.profile = profile or self.PROFILE
+        # Optional SeenUrlStore reusing descriptions of already scraped URLs
+        self.seen_store = seen_store
+        # Optional JobDeduplicator shared by the extractors of all sources,
+        # skipping the detail fetch of cards it already holds
+        self.card_index = card_index
+
+    @property
+    def SOURCE(self):
+        """Source name stored in each job"""
+        return self.profile.source
+
+    def extract_job_data(self, job_card):
+        try:
+            job = self.parse_job_card(job_card)
+            if self.is_duplicate_card(job):
+                return None
+
+            job["description"] = self.fetch_description(job)
+
+            job["source"] = self.SOURCE
+            return job
+
+        except Exception as e:
+            print(f"Error extracting job data: {e}")
+            return self.empty_job()
+
+    def is_duplicate_card(self, job):
+        """Whether the card index already holds the card's URL or its
+        company + title + location fingerprint (the card is claimed if not)
+
+        The fingerprint uses list-card fields only, so a posting found on
+        another source is skipped before its detail page is fetched.
+        """
+        return self.card_index is not None and not self.card_index.accept(job)
+
+    def fetch_description(self, job):
+        """Fetch the job's detail page unless the seen-URL store knows it"""
+        if job.get("description"):
+            # Full description came with the list page's JobPosting data
+            return job["description"]
+        if self.seen_store is None:
+            return self.scraper.scrape_job(job["url"])
+        return self.seen_store.fetch_description(job, self.scraper.scrape_job)
+
+    def parse_job_card(self, job_card):
+        """Extract the list-card fields of a job (everything but the description)
+
+        job_card is a record returned by scrape_jobs_list, a JSON-LD JobPosting
+        or a parsed card element.
+        """
+        if isinstance(job_card, dict):
+            if is_job_posting(job_card):
+                return self.scraper.posting_record(job_card)
+            return dict(job_card)
+        return self.profile.read_card(job_card)
+
+    def empty_job(self):
+        """Placeholder job returned when a card cannot be extracted"""
+        return {
+            "title": "N/A",
+            "url": "N/A",
+            "company": "N/A",
+            "location": "N/A",
+            "publish_date": "N/A",
+            "description": "N/A",
+            "source": self.SOURCE,
+        }
+
+    def save_jobs(self, output_file):
+        # get path
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        project_root = os.path.abspath(os.path.join(script_dir, "../.."))
+        logs_dir = os.path.join(project_root, "logs")  # apps/scraper-py/logs/
+
+        # Ensure logs directory exists
+        os.makedirs(logs_dir, exist_ok=True)
+
+        if not output_file:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_file = f"jobs_{self.profile.name}_{timestamp}.json"
+
+        output_file = os.path.join(logs_dir, output_file)
+
+        try:
+            with open(output_file, "w", encoding="utf-8") as f:
+                json.dump(self.jobs, f, ensure_ascii=False, indent=4)
+            print(f"Jobs saved to {output_file}")
+        except Exception as e:
+            print(f"Error saving jobs: {e}")
@@ -0,0 +1,44 @@
+"""jobly.fi site profile"""
+
+from bs4 import SoupStrainer
+
+from .profile import FieldRule, SiteProfile
+
+
+def strip_trailing_comma(text):
+    return text.rstrip(",")
+
+
+JOBLY = SiteProfile(
+    name="jobly",
+    source="jobly.fi",
+    base_url="https://www.jobly.fi",
+    list_url="https://www.jobly.fi/en/jobs",
+    card_selectors=["article"],
+    list_page_strainer=SoupStrainer("article"),
+    title=[FieldRule("h2.node__title a"), FieldRule("h2.node__title")],
+    company=[FieldRule("span.recruiter-company-profile-job-organization")],
+    location=[FieldRule("div.location")],
+    publish_date=[FieldRule("span.date", clean=strip_trailing_comma)],
+    description_selectors=[
+        # Jobly.fi specific selectors (highest priority)
+        'div.field__item[property="content:encoded"]',
+        "div.field--name-body div.field__item",
+        # Common job selectors
+        "div.job-description",
+        "section.job-description",
+        "div.description",
+        "section.description",
+        'div[class*="job-content"]',
+        'section[class*="job-content"]',
+        "div.content",
+        "main.content",
+        'div[class*="job-description"]',
+        ".job-description",
+        ".description",
+        "article",
+        "main",
+    ],
+    # The description sits in the page's article
+    description_stop_markers=(b'property="content:encoded"', b"</article>"),
+)
@@ -0,0 +1,133 @@
+"""Declarative description of a job board, compiled once at import time"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from bs4 import SoupStrainer
+from soupsieve import SoupSieve
+
+from html_parser import compile_selector
+
+
+@dataclass(frozen=True)
+class FieldRule:
+    """Read a card field from the first element matching selector: its text,
+    or the given attribute, optionally post-processed by clean"""
+
+    selector: str
+    attribute: Optional[str] = None
+    clean: Optional[Callable[[str], str]] = None
+    pattern: SoupSieve = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "pattern", compile_selector(self.selector))
+
+    def read(self, card) -> Optional[str]:
+        """Field value from a card, None if missing or blank"""
+        elem = card.select_one(self.pattern)
+        if elem is None:
+            return None
+        if self.attribute:
+            value = (elem.get(self.attribute) or "").strip()
+        else:
+            value = elem.get_text(strip=True)
+        if value and self.clean:
+            value = self.clean(value)
+        return value or None
+
+
+def read_first(card, rules: Sequence[FieldRule]) -> str:
+    """Value of the first rule finding a non-blank value ("N/A" if none)"""
+    for rule in rules:
+        value = rule.read(card)
+        if value:
+            return value
+    return "N/A"
+
+
+@dataclass(frozen=True)
+class SiteProfile:
+    """Everything site-specific about scraping one job board
+
+    Field rules are tried in order and the first non-blank value wins; the
+    element matched by the title rules also provides the job URL (its href).
+    """
+
+    # Output file prefix (jobs_<name>_<timestamp>.json)
+    name: str
+    # "source" stored in every job
+    source: str
+    # Origin that relative job links are resolved against
+    base_url: str
+    list_url: str
+    # List page: job-card containers in priority order, the first that matches
+    # anything wins; parsing is restricted to list_page_strainer
+    card_selectors: Sequence[str]
+    list_page_strainer: Optional[SoupStrainer]
+    title: Sequence[FieldRule]
+    company: Sequence[FieldRule]
+    location: Sequence[FieldRule]
+    publish_date: Sequence[FieldRule]
+    # Detail page: description containers in priority order
+    description_selectors: Sequence[str]
+    # Detail downloads stop at the end marker after the start marker
+    description_stop_markers: Optional[Tuple[bytes, bytes]] = None
+    min_description_words: int = 50
+    # Catch-all containers among description_selectors, never learned per host
+    generic_description_selectors: Sequence[str] = (
+        "div.content",
+        "main.content",
+        "article",
+        "main",
+    )
+    # Links marking any element as a job card when no card selector matches
+    fallback_card_link: Optional[str] = None
+
+    card_patterns: Tuple[SoupSieve, ...] = field(init=False, repr=False, compare=False)
+    description_patterns: Tuple[SoupSieve, ...] = field(
+        init=False, repr=False, compare=False
+    )
+    generic_description_patterns: Tuple[SoupSieve, ...] = field(
+        init=False, repr=False, compare=False
+    )
+    fallback_link_pattern: Optional[SoupSieve] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        for name, selectors in [
+            ("card_patterns", self.card_selectors),
+            ("description_patterns", self.description_selectors),
+        ]:
+            patterns = tuple(compile_selector(selector) for selector in selectors)
+            object.__setattr__(self, name, patterns)
+        generic = tuple(
+            pattern
+            for selector, pattern in zip(
+                self.description_selectors, self.description_patterns
+            )
+            if selector in self.generic_description_selectors
+        )
+        object.__setattr__(self, "generic_description_patterns", generic)
+        link = self.fallback_card_link
+        object.__setattr__(
+            self, "fallback_link_pattern", compile_selector(link) if link else None
+        )
+
+    def read_card(self, card) -> Dict[str, str]:
+        """Plain job record of a list-page card (every field but the
+        description), holding no reference to the parse tree"""
+        job = {"title": "N/A", "url": "N/A"}
+        for rule in self.title:
+            title_elem = card.select_one(rule.pattern)
+            if title_elem is not None:
+                job["title"] = title_elem.get_text(strip=True)
+                href = title_elem.get("href")
+                if href:
+                    job["url"] = self.base_url + href if href.startswith("/") else href
+                break
+
+        job["company"] = read_first(card, self.company)
+        job["location"] = read_first(card, self.location)
+        job["publish_date"] = read_first(card, self.publish_date)
+        return job
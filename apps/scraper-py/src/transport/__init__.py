@@ -0,0 +1,42 @@
+"""
+Transport Package
+
+Shared HTTP layer used by all scrapers: pooled keep-alive sessions per host,
+an on-disk conditional-request cache, per-host rate limiting, retries with
+backoff, per-host circuit breaking, record/replay cassettes and streamed,
+size-capped body reading.
+"""
+
+from .cassette import Cassette, CassetteMissError
+from .http_cache import DEFAULT_CACHE_DIR, HttpCache
+from .rate_limiter import (
+    DEFAULT_BURST,
+    DEFAULT_REQUESTS_PER_SECOND,
+    HostRateLimiter,
+    TokenBucket,
+    parse_retry_after,
+)
+from .retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+from .session_pool import HEADERS, SessionPool, configure_default_pool, get_default_pool
+from .streaming import DEFAULT_MAX_BYTES, ResponseTooLargeError
+
+__all__ = [
+    "Cassette",
+    "CassetteMissError",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "DEFAULT_BURST",
+    "DEFAULT_CACHE_DIR",
+    "DEFAULT_MAX_BYTES",
+    "DEFAULT_REQUESTS_PER_SECOND",
+    "HEADERS",
+    "HostRateLimiter",
+    "HttpCache",
+    "ResponseTooLargeError",
+    "RetryPolicy",
+    "SessionPool",
+    "TokenBucket",
+    "configure_default_pool",
+    "get_default_pool",
+    "parse_retry_after",
+]
@@ -0,0 +1,116 @@
+"""Record/replay of HTTP responses for offline runs and benchmarks"""
+
+import base64
+import gzip
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .http_cache import SKIPPED_HEADERS
+
+CASSETTE_VERSION = 1
+MODES = ("record", "replay")
+
+
+class CassetteMissError(requests.RequestException):
+    """Raised in replay mode for a URL the cassette has no response for"""
+
+
+class Cassette:
+    """Request/response pairs stored in a single gzip-compressed JSON file.
+
+    In "record" mode every response fetched by the SessionPool is added to the
+    cassette; call save() (or SessionPool.close()) to write it. In "replay"
+    mode responses are served from the cassette without touching the network,
+    optionally after an injected per-request latency.
+    """
+
+    def __init__(self, path, mode: str = "replay", latency: float = 0.0):
+        """
+        Args:
+            path: Cassette file, conventionally *.json.gz
+            mode: "record" or "replay"
+            latency: Seconds each replayed response is delayed by
+        """
+        if mode not in MODES:
+            raise ValueError(f"Cassette mode must be one of {MODES}, got {mode!r}")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency = latency
+        self.interactions: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+        if mode == "replay" or self.path.exists():
+            self.load()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    def load(self):
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version in {self.path}")
+        self.interactions = data["interactions"]
+
+    def save(self):
+        """Write the cassette atomically"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {"version": CASSETTE_VERSION, "interactions": self.interactions}
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def record(self, url: str, response: requests.Response):
+        """Add the response fetched for a URL"""
+        interaction = {
+            "status": response.status_code,
+            "final_url": response.url,
+            "encoding": response.encoding,
+            "headers": {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in SKIPPED_HEADERS
+            },
+            "body": base64.b64encode(response.content).decode("ascii"),
+        }
+        with self._lock:
+            self.interactions[url] = interaction
+
+    def play(self, url: str) -> requests.Response:
+        """Return the recorded response for a URL"""
+        with self._lock:
+            interaction = self.interactions.get(url)
+        if interaction is None:
+            raise CassetteMissError(f"No recorded response for {url}")
+        if self.latency:
+            time.sleep(self.latency)
+
+        response = requests.Response()
+        response.status_code = interaction["status"]
+        response.url = interaction.get("final_url") or url
+        response.headers = CaseInsensitiveDict(interaction["headers"])
+        response.encoding = interaction["encoding"]
+        response._content = base64.b64decode(interaction["body"])
+        response.truncated = False
+        return response
@@ -0,0 +1,135 @@
+"""On-disk HTTP response cache revalidated with ETag / Last-Modified"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# apps/scraper-py/logs/http_cache/
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[2] / "logs" / "http_cache"
+
+# Headers describing the stored (already decoded) body rather than the transfer
+SKIPPED_HEADERS = {
+    "connection",
+    "content-encoding",
+    "content-length",
+    "keep-alive",
+    "transfer-encoding",
+}
+
+
+class HttpCache:
+    """Persistent store of response bodies and their validators.
+
+    Requests for cached URLs are sent as conditional requests; a 304 reply is
+    answered from disk so unchanged pages are not downloaded again.
+    """
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def _read_meta(self, url: str, variant: Optional[str] = None) -> Optional[Dict]:
+        meta_path, _ = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # Guard against hash collisions
+        if meta.get("url") != url:
+            return None
+        # A body cut short by stop markers only serves requests using them
+        truncated_for = meta.get("truncated_for")
+        return meta if truncated_for is None or truncated_for == variant else None
+
+    def conditional_headers(
+        self, url: str, variant: Optional[str] = None
+    ) -> Dict[str, str]:
+        """Return If-None-Match / If-Modified-Since headers for a cached URL"""
+        meta = self._read_meta(url, variant)
+        if not meta:
+            return {}
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def load(
+        self, url: str, variant: Optional[str] = None
+    ) -> Optional[requests.Response]:
+        """Rebuild the cached 200 response for a URL, or None if not cached"""
+        meta = self._read_meta(url, variant)
+        if not meta:
+            return None
+        _, body_path = self._paths(url)
+        try:
+            body = body_path.read_bytes()
+        except OSError:
+            return None
+
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = meta.get("final_url", url)
+        response.headers = CaseInsensitiveDict(meta.get("headers", {}))
+        response.encoding = meta.get("encoding")
+        response._content = body
+        response.from_cache = True
+        response.truncated = meta.get("truncated_for") is not None
+        return response
+
+    def store(
+        self, url: str, response: requests.Response, truncated_for: Optional[str] = None
+    ) -> bool:
+        """Store a 200 response that carries validators, return True if stored
+
+        truncated_for names the stop markers a partial body was read with.
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code != 200 or not (etag or last_modified):
+            return False
+
+        meta = {
+            "url": url,
+            "final_url": response.url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "encoding": response.encoding,
+            "truncated_for": truncated_for,
+            "headers": {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in SKIPPED_HEADERS
+            },
+        }
+        meta_path, body_path = self._paths(url)
+        # Body first, so metadata never points at a missing or partial body
+        self._atomic_write(body_path, response.content)
+        self._atomic_write(
+            meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8")
+        )
+        return True
+
+    def _atomic_write(self, path: Path, data: bytes):
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
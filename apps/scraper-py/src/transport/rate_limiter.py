@@ -0,0 +1,114 @@
+"""Per-host token-bucket rate limiting with Retry-After support"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+DEFAULT_REQUESTS_PER_SECOND = 2.0
+DEFAULT_BURST = 5
+
+# Wait used for a 429 reply without a usable Retry-After header
+DEFAULT_RETRY_AFTER = 5.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Return the wait in seconds of a Retry-After header (seconds or HTTP date)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Allows `rate` requests per second on average and bursts of `burst`"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token if available, otherwise return the seconds to wait"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self.blocked_until:
+                return self.blocked_until - now
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            wait = self._reserve()
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for `seconds` and drop the saved burst"""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+
+
+class HostRateLimiter:
+    """One token bucket per host, so each site gets its own politeness budget"""
+
+    def __init__(
+        self,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        host_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+    ):
+        """
+        Args:
+            requests_per_second: Average request rate allowed per host
+            burst: Requests a host may receive back to back after being idle
+            host_limits: Per-host (requests_per_second, burst) overrides keyed
+            by hostname, e.g. {"duunitori.fi": (1.0, 2)}
+        """
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.host_limits = host_limits or {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        host = (urlsplit(url).hostname or "").lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self.host_limits.get(
+                    host, (self.requests_per_second, self.burst)
+                )
+                bucket = TokenBucket(rate, burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url: str):
+        """Block until the URL's host may receive another request"""
+        self.bucket_for(url).acquire()
+
+    def pause(self, url: str, seconds: float):
+        """Hold back all requests to the URL's host, e.g. after a 429 reply"""
+        self.bucket_for(url).pause(seconds)
@@ -0,0 +1,175 @@
+"""Retry policy with jittered exponential backoff and per-host circuit breaking"""
+
+import threading
+import time
+from typing import Callable, Dict, FrozenSet, Optional
+from urllib.parse import urlsplit
+
+import requests
+from tenacity import (
+    RetryCallState,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from .rate_limiter import DEFAULT_RETRY_AFTER, parse_retry_after
+
+# Status classes worth another attempt: throttling and transient server errors
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Network failures that say nothing about the requested page itself
+RETRYABLE_EXCEPTIONS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a request to a host whose circuit is open"""
+
+
+class CircuitBreaker:
+    """Stops sending requests to a host after repeated consecutive failures.
+
+    After `failure_threshold` failures in a row the host's circuit opens and
+    requests fail fast with CircuitOpenError. Once `reset_timeout` seconds have
+    passed a single trial request is let through; success closes the circuit,
+    failure keeps it open for another `reset_timeout`.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        self._trial_in_flight: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host(url: str) -> str:
+        return (urlsplit(url).hostname or "").lower()
+
+    def is_open(self, url: str) -> bool:
+        with self._lock:
+            return self.host(url) in self._opened_at
+
+    def before_request(self, url: str):
+        """Raise CircuitOpenError unless a request to the URL's host may be sent"""
+        host = self.host(url)
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+            if opened_at is None:
+                return
+            elapsed = time.monotonic() - opened_at
+            if elapsed >= self.reset_timeout and not self._trial_in_flight.get(host):
+                # Half-open: let one trial request through
+                self._trial_in_flight[host] = True
+                return
+        raise CircuitOpenError(f"Circuit open for {host}: skipping request to {url}")
+
+    def record_success(self, url: str):
+        host = self.host(url)
+        with self._lock:
+            self._failures.pop(host, None)
+            self._opened_at.pop(host, None)
+            self._trial_in_flight.pop(host, None)
+
+    def record_failure(self, url: str):
+        host = self.host(url)
+        with self._lock:
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            was_trial = self._trial_in_flight.pop(host, False)
+            if was_trial or failures >= self.failure_threshold:
+                if host not in self._opened_at or was_trial:
+                    print(f"⚠️ Circuit opened for {host} after {failures} failures")
+                self._opened_at[host] = time.monotonic()
+
+
+class RetryPolicy:
+    """Retries transient failures with jittered exponential backoff via tenacity"""
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        backoff_base: float = 1.0,
+        max_backoff: float = 30.0,
+        retry_statuses: FrozenSet[int] = RETRYABLE_STATUS_CODES,
+        max_retry_after: Optional[float] = None,
+    ):
+        """
+        Args:
+            max_attempts: Total attempts per request, including the first
+            backoff_base: Scale of the exponential backoff in seconds
+            max_backoff: Upper bound of a single backoff wait in seconds
+            retry_statuses: HTTP status codes that are retried
+            max_retry_after: Longest Retry-After wait honored in seconds
+            (max_backoff if None); replies asking for longer are not retried
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self.retry_statuses = retry_statuses
+        self.max_retry_after = (
+            max_backoff if max_retry_after is None else max_retry_after
+        )
+        self._backoff = wait_random_exponential(
+            multiplier=backoff_base, max=max_backoff
+        )
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        """Return True for transient network errors and retryable status codes"""
+        if isinstance(exc, CircuitOpenError):
+            return False
+        if isinstance(exc, requests.HTTPError):
+            response = exc.response
+            if response is None or response.status_code not in self.retry_statuses:
+                return False
+            # A server asking for a longer pause than we wait is given up on
+            retry_after = self.retry_after(response)
+            return retry_after is None or retry_after <= self.max_retry_after
+        return isinstance(exc, RETRYABLE_EXCEPTIONS)
+
+    @staticmethod
+    def retry_after(response: requests.Response) -> Optional[float]:
+        """Wait in seconds a 429 or 503 reply asks for (None if it sets none)"""
+        if response.status_code not in (429, 503):
+            return None
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is None and response.status_code == 429:
+            retry_after = DEFAULT_RETRY_AFTER
+        return retry_after
+
+    def wait(self, retry_state: RetryCallState) -> float:
+        """Backoff before the next attempt, at least the server's Retry-After
+        (at most max_retry_after)"""
+        backoff = self._backoff(retry_state)
+        exc = retry_state.outcome.exception()
+        response = getattr(exc, "response", None)
+        if response is not None:
+            retry_after = self.retry_after(response)
+            if retry_after is not None:
+                return max(backoff, min(retry_after, self.max_retry_after))
+        return backoff
+
+    def call(self, fn: Callable, *args, **kwargs):
+        """Call fn, retrying retryable failures; the last failure is re-raised"""
+        retrying = Retrying(
+            stop=stop_after_attempt(self.max_attempts),
+            wait=self.wait,
+            retry=retry_if_exception(self.is_retryable),
+            before_sleep=self._log_retry,
+            reraise=True,
+        )
+        return retrying(fn, *args, **kwargs)
+
+    @staticmethod
+    def _log_retry(retry_state: RetryCallState):
+        exc: Optional[BaseException] = retry_state.outcome.exception()
+        print(
+            f"Retrying in {retry_state.next_action.sleep:.1f}s "
+            f"(attempt {retry_state.attempt_number} failed: {exc})"
+        )
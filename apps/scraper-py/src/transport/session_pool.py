@@ -0,0 +1,267 @@
+"""Pooled keep-alive HTTP sessions shared by the scrapers"""
+
+import threading
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .cassette import Cassette
+from .http_cache import HttpCache
+from .rate_limiter import (
+    DEFAULT_BURST,
+    DEFAULT_REQUESTS_PER_SECOND,
+    HostRateLimiter,
+    parse_retry_after,
+)
+from .retry import CircuitBreaker, RetryPolicy
+from .streaming import DEFAULT_MAX_BYTES, StopMarkers, read_body, stop_markers_key
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": (
+        "text/html,application/xhtml+xml," "application/xml;q=0.9,image/webp,*/*;q=0.8"
+    ),
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate, br",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Cache-Control": "max-age=0",
+}
+
+
+class SessionPool:
+    """One pooled requests.Session per host, reused across all page fetches.
+
+    Reusing the session keeps TCP+TLS connections alive between list and
+    detail requests instead of paying a fresh handshake for every page.
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = 10,
+        keep_alive: bool = True,
+        timeout: float = 10,
+        headers: Optional[Dict[str, str]] = None,
+        cache: Optional[HttpCache] = None,
+        requests_per_second: Optional[float] = DEFAULT_REQUESTS_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        host_rate_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        cassette: Optional[Cassette] = None,
+        max_response_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+    ):
+        """
+        Args:
+            max_connections_per_host: Upper bound of open connections to one host;
+            extra concurrent requests wait for a free connection
+            keep_alive: Reuse connections between requests (sends
+            "Connection: close" when False)
+            timeout: Default request timeout in seconds
+            headers: Default request headers (HEADERS if None)
+            cache: On-disk cache used for conditional requests (optional)
+            requests_per_second: Average request rate allowed per host
+            (rate limiting disabled if None)
+            burst: Requests a host may receive back to back after being idle
+            host_rate_limits: Per-host (requests_per_second, burst) overrides
+            retry_policy: Backoff policy for transient failures (RetryPolicy()
+            if None, pass RetryPolicy(max_attempts=1) to disable retries)
+            circuit_breaker: Per-host breaker that fails fast on dead hosts
+            (CircuitBreaker() if None)
+            cassette: Records fetched responses, or replays them without any
+            network access (optional)
+            max_response_bytes: Default limit of a decoded response body
+            (unlimited if None)
+        """
+        self.max_connections_per_host = max_connections_per_host
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.headers = dict(HEADERS if headers is None else headers)
+        if not keep_alive:
+            self.headers["Connection"] = "close"
+        self.cache = cache
+        self.rate_limiter = (
+            HostRateLimiter(requests_per_second, burst, host_rate_limits)
+            if requests_per_second
+            else None
+        )
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.cassette = cassette
+        self.max_response_bytes = max_response_bytes
+
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_key(url: str) -> str:
+        """Return the scheme://host[:port] key a URL is pooled under"""
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}".lower()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            # Pools of the session's own host and of a host it redirects to
+            # (e.g. jobly.fi -> www.jobly.fi); every other host has a session
+            pool_connections=2,
+            pool_maxsize=self.max_connections_per_host,
+            pool_block=True,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def session_for(self, url: str) -> requests.Session:
+        """Return the shared session for the URL's host, creating it on first use"""
+        key = self.host_key(url)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._create_session()
+                self._sessions[key] = session
+            return session
+
+    def get(
+        self,
+        url: str,
+        max_bytes: Optional[int] = None,
+        stop_after: Optional[StopMarkers] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """GET a URL through the host's pooled session and raise on HTTP errors
+
+        The body is streamed and decompressed incrementally, limited to
+        max_bytes (max_response_bytes if None). With stop_after=(start, end)
+        the download ends right after the first end marker that follows the
+        start marker and response.truncated is True.
+
+        Transient failures are retried per the retry policy. With a cache
+        configured, known URLs are revalidated with a conditional request and
+        a 304 reply is served from disk. A replaying cassette answers without
+        any network access.
+        """
+        if self.cassette is not None and self.cassette.replaying:
+            response = self.cassette.play(url)
+            response.raise_for_status()
+            return response
+
+        kwargs["max_bytes"] = max_bytes or self.max_response_bytes
+        kwargs["stop_after"] = stop_after
+        response = self._fetch(url, **kwargs)
+        if self.cassette is not None:
+            self.cassette.record(url, response)
+        return response
+
+    def _fetch(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+
+        if self.cache is None:
+            return self._request(url, **kwargs)
+
+        # Truncated bodies are only reused by requests with the same markers
+        variant = stop_markers_key(kwargs["stop_after"])
+        headers = {
+            **self.cache.conditional_headers(url, variant),
+            **kwargs.pop("headers", {}),
+        }
+        response = self._request(url, headers=headers, **kwargs)
+        if response.status_code == 304:
+            cached = self.cache.load(url, variant)
+            if cached is not None:
+                return cached
+            # Cache entry vanished since the validators were read
+            response = self._request(url, **kwargs)
+
+        self.cache.store(url, response, variant if response.truncated else None)
+        return response
+
+    def _request(self, url: str, **kwargs) -> requests.Response:
+        return self.retry_policy.call(self._send, url, **kwargs)
+
+    def _send(
+        self,
+        url: str,
+        max_bytes: Optional[int] = None,
+        stop_after: Optional[StopMarkers] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """Send a single GET within the host's rate limit and circuit breaker"""
+        self.circuit_breaker.before_request(url)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url)
+
+        try:
+            response = self.session_for(url).get(url, stream=True, **kwargs)
+        except requests.RequestException:
+            self.circuit_breaker.record_failure(url)
+            raise
+
+        if response.status_code >= 500:
+            self.circuit_breaker.record_failure(url)
+        else:
+            self.circuit_breaker.record_success(url)
+
+        if response.status_code == 429 and self.rate_limiter is not None:
+            # Hold back every request to this host, not just this retry, but
+            # no longer than the retry policy honors
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after:
+                self.rate_limiter.pause(
+                    url, min(retry_after, self.retry_policy.max_retry_after)
+                )
+
+        if response.status_code >= 400:
+            response.close()
+            response.raise_for_status()
+        return read_body(response, max_bytes, stop_after)
+
+    def close(self):
+        """Close every pooled session and save a recording cassette"""
+        if self.cassette is not None and self.cassette.recording:
+            self.cassette.save()
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+_default_pool: Optional[SessionPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool() -> SessionPool:
+    """Return the process-wide pool shared by scrapers created without a transport"""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = SessionPool()
+        return _default_pool
+
+
+def configure_default_pool(**kwargs) -> SessionPool:
+    """Replace the process-wide pool with one built from SessionPool kwargs"""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is not None:
+            _default_pool.close()
+        _default_pool = SessionPool(**kwargs)
+        return _default_pool
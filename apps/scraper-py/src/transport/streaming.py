@@ -0,0 +1,110 @@
+"""Streamed, size-capped reading of response bodies"""
+
+from typing import Optional, Tuple
+
+import requests
+
+# Upper bound of a decoded response body
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+
+CHUNK_SIZE = 64 * 1024
+
+# After an early stop, up to this many bytes are still drained so the
+# connection can go back to the pool; longer remainders close it instead
+DRAIN_LIMIT = 256 * 1024
+
+# (start_marker, end_marker): stop reading at the first end_marker that
+# follows start_marker
+StopMarkers = Tuple[bytes, bytes]
+
+
+class ResponseTooLargeError(requests.RequestException):
+    """Raised when a response body exceeds the configured size limit"""
+
+
+def stop_markers_key(stop_after: Optional[StopMarkers]) -> Optional[str]:
+    """Return a printable key identifying a pair of stop markers"""
+    if not stop_after:
+        return None
+    return " .. ".join(marker.decode("latin-1") for marker in stop_after)
+
+
+def read_body(
+    response: requests.Response,
+    max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+    stop_after: Optional[StopMarkers] = None,
+) -> requests.Response:
+    """Read a stream=True response body chunk by chunk into response.content
+
+    gzip/deflate/br bodies are decompressed incrementally as they arrive.
+    Raises ResponseTooLargeError once the decoded body exceeds max_bytes.
+    With stop_after, reading stops right after the end marker that follows
+    the start marker, and response.truncated is set to True.
+    """
+    response.truncated = False
+    content_length = response.headers.get("Content-Length", "")
+    if (
+        max_bytes
+        and content_length.isdigit()
+        and "Content-Encoding" not in response.headers
+        and int(content_length) > max_bytes
+    ):
+        response.close()
+        raise ResponseTooLargeError(
+            f"{response.url} is {content_length} bytes (limit {max_bytes})"
+        )
+
+    start_marker, end_marker = stop_after or (None, None)
+    body = bytearray()
+    start_pos = None  # just past the start marker, once found
+    scanned = 0  # bytes already searched for the current marker
+
+    chunks = response.iter_content(CHUNK_SIZE)
+    try:
+        for chunk in chunks:
+            body += chunk
+            if max_bytes and len(body) > max_bytes:
+                raise ResponseTooLargeError(
+                    f"{response.url} exceeds the {max_bytes} byte limit"
+                )
+            if start_marker is None:
+                continue
+
+            if start_pos is None:
+                found = body.find(start_marker, max(0, scanned - len(start_marker)))
+                scanned = len(body)
+                if found == -1:
+                    continue
+                start_pos = scanned = found + len(start_marker)
+
+            found = body.find(end_marker, max(start_pos, scanned - len(end_marker)))
+            scanned = len(body)
+            if found != -1:
+                del body[found + len(end_marker) :]
+                response.truncated = True
+                break
+    except BaseException:
+        response.close()
+        raise
+
+    if response.truncated:
+        _drain(response, chunks)
+
+    response._content = bytes(body)
+    response._content_consumed = True
+    return response
+
+
+def _drain(response: requests.Response, chunks):
+    """Discard a short remainder so the connection stays reusable"""
+    drained = 0
+    try:
+        for chunk in chunks:
+            drained += len(chunk)
+            if drained > DRAIN_LIMIT:
+                break
+        else:
+            return
+    except requests.RequestException:
+        pass
+    response.close()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Benchmark Job Extractors
+Measures JoblyExtractor and DuunitoriExtractor throughput against a replayed
+HTTP cassette, so runs are deterministic and need no network access
+
+Usage:
+    python tests/bench_extractors.py --synthetic 100 --latency 0.05
+    python tests/bench_extractors.py --record logs/live.json.gz --pages 2
+    python tests/bench_extractors.py --cassette logs/live.json.gz --concurrency 8
+    python tests/bench_extractors.py --synthetic 100 --parse-workers 4
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from fake_responses import html_response  # noqa: E402
+
+from async_extraction import extract_jobs_concurrently  # noqa: E402
+from duunitori.duunitori_extractor import DuunitoriExtractor  # noqa: E402
+from duunitori.duunitori_scraper import DuunitoriScraper  # noqa: E402
+from jobly.jobly_extractor import JoblyExtractor  # noqa: E402
+from jobly.jobly_scraper import JoblyScraper  # noqa: E402
+from pagination import iter_list_pages  # noqa: E402
+from parse_pool import ParsePool  # noqa: E402
+from transport import Cassette, SessionPool  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+SOURCES = {
+    "jobly.fi": (JoblyScraper, JoblyExtractor, "https://www.jobly.fi/en/jobs"),
+    "duunitori.fi": (
+        DuunitoriScraper,
+        DuunitoriExtractor,
+        "https://duunitori.fi/tyopaikat",
+    ),
+}
+
+
+def write_synthetic_cassette(path, cards_per_source):
+    """Record a list page with `cards_per_source` cards per site, each card
+    linking to a copy of the saved detail page"""
+    cassette = Cassette(path, mode="record")
+    jobly_detail = (FIXTURES_DIR / "jobly_job.html").read_bytes()
+    duunitori_detail = (FIXTURES_DIR / "duunitori_job.html").read_bytes()
+
+    jobly_cards, duunitori_cards = [], []
+    for i in range(cards_per_source):
+        jobly_url = f"https://www.jobly.fi/en/job/software-developer-{i}"
+        jobly_cards.append(
+            '<article><h2 class="node__title">'
+            f'<a href="/en/job/software-developer-{i}">Software Developer {i}</a></h2>'
+            '<span class="recruiter-company-profile-job-organization">Koodi Oy</span>'
+            '<div class="location">Helsinki</div><span class="date">1.1.2025,</span>'
+            "</article>"
+        )
+        cassette.record(jobly_url, html_response(jobly_detail, jobly_url))
+
+        duunitori_url = f"https://duunitori.fi/tyopaikat/tyo/kehittaja-{i}"
+        duunitori_cards.append(
+            f'<div class="job-box" data-jobid="{i}">'
+            f'<a class="job-box__hover" href="/tyopaikat/tyo/kehittaja-{i}" '
+            f'data-company="Ohjelmisto Oy">Kehittäjä {i}</a>'
+            '<span class="job-box__job-location">Helsinki</span>'
+            '<span class="job-box__job-posted">Julkaistu 1.1.</span></div>'
+        )
+        cassette.record(duunitori_url, html_response(duunitori_detail, duunitori_url))
+
+    for url, cards in [
+        (SOURCES["jobly.fi"][2], jobly_cards),
+        (SOURCES["duunitori.fi"][2], duunitori_cards),
+    ]:
+        page = f"<html><body><main>{''.join(cards)}</main></body></html>"
+        cassette.record(url, html_response(page, url))
+    cassette.save()
+
+
+def crawl(transport, pages, concurrency, parse_pool=None):
+    """Scrape every source through the transport, return {source: (jobs, secs)}"""
+    results = {}
+    for source, (scraper_class, extractor_class, base_url) in SOURCES.items():
+        scraper = scraper_class(transport=transport, parse_pool=parse_pool)
+        extractor = extractor_class(scraper)
+        start = time.perf_counter()
+        for _, job_cards in iter_list_pages(scraper, base_url, pages, label="  "):
+            if concurrency > 1:
+                jobs = extract_jobs_concurrently(extractor, job_cards, concurrency)
+            else:
+                jobs = [extractor.extract_job_data(card) for card in job_cards]
+            extractor.jobs.extend(jobs)
+        results[source] = (len(extractor.jobs), time.perf_counter() - start)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark job extractors")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--cassette", type=Path, help="Replay this cassette")
+    mode.add_argument("--record", type=Path, help="Record live pages to this file")
+    mode.add_argument(
+        "--synthetic", type=int, metavar="CARDS", help="Replay generated pages"
+    )
+    parser.add_argument("--pages", type=int, default=1, help="List pages per source")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Injected seconds per response"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=8, help="Detail fetches in flight"
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=0,
+        help="Parse detail pages in this many processes (0: in the fetch threads)",
+    )
+    args = parser.parse_args()
+
+    if args.record:
+        print(f"⏺️ Recording {args.pages} page(s) per source to {args.record}")
+        with SessionPool(cassette=Cassette(args.record, mode="record")) as transport:
+            crawl(transport, args.pages, args.concurrency)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cassette_path = args.cassette
+        if args.synthetic:
+            cassette_path = Path(tmp_dir) / "synthetic.json.gz"
+            write_synthetic_cassette(cassette_path, args.synthetic)
+
+        parse_pool = None
+        if args.parse_workers:
+            profiles = [
+                scraper_class.PROFILE for scraper_class, _, _ in SOURCES.values()
+            ]
+            parse_pool = ParsePool(profiles, max_workers=args.parse_workers)
+        cassette = Cassette(cassette_path, mode="replay", latency=args.latency)
+        try:
+            with SessionPool(requests_per_second=None, cassette=cassette) as transport:
+                results = crawl(transport, args.pages, args.concurrency, parse_pool)
+        finally:
+            if parse_pool is not None:
+                parse_pool.close()
+
+    print("\n📊 EXTRACTOR THROUGHPUT")
+    print(
+        f"   latency={args.latency}s concurrency={args.concurrency}"
+        f" parse_workers={args.parse_workers}"
+    )
+    for source, (job_count, seconds) in results.items():
+        rate = job_count / seconds if seconds else float("inf")
+        print(
+            f"   • {source:<13} {job_count:>5} jobs in {seconds:6.2f}s ({rate:.1f}/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark Fallback Card Discovery
+Times ProfileScraper.find_cards_by_link against the previous per-div subtree
+search on generated Duunitori list pages without job-box markup, where the
+job cards follow a growing block of nested divs without job links (comment
+threads, menus, ads)
+
+Usage:
+    python tests/bench_fallback_cards.py
+    python tests/bench_fallback_cards.py --sizes 1000 4000 --parser lxml
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from duunitori.duunitori_scraper import DuunitoriScraper  # noqa: E402
+from html_parser import PARSER_BACKENDS, compile_selector, parse_html  # noqa: E402
+
+ANY_DIV = compile_selector("div")
+DIV_WITH_CLASS = compile_selector("div[class]")
+
+
+def previous_find_cards_by_link(soup, link):
+    """The fallback replaced by find_cards_by_link (reference only)"""
+    job_cards = []
+    for div in soup.select(DIV_WITH_CLASS):
+        if div.select_one(link):
+            job_cards.append(div)
+            if len(job_cards) >= 10:
+                break
+    if not job_cards:
+        for div in soup.select(ANY_DIV)[:50]:
+            if div.select_one(link):
+                job_cards.append(div)
+                if len(job_cards) >= 20:
+                    break
+    return job_cards
+
+
+def list_page(nested_divs, cards=20):
+    """List page whose cards come after `nested_divs` divs nested inside
+    each other"""
+    thread = '<div class="comment"><p>Kommentti</p>' * nested_divs
+    thread += "</div>" * nested_divs
+    listing = "".join(
+        f'<div class="listing"><a href="/tyopaikat/tyo/kehittaja-{i}">'
+        f"Kehittäjä {i}</a><span>Helsinki</span></div>"
+        for i in range(cards)
+    )
+    return f"<html><body><main>{thread}{listing}</main></body></html>"
+
+
+def milliseconds(fn):
+    start = time.perf_counter()
+    # find_cards_by_link reports its progress on stdout
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark fallback card discovery")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[250, 1000, 2000],
+        help="Nested divs before the job cards",
+    )
+    parser.add_argument(
+        "--parser", choices=PARSER_BACKENDS, default="lxml", help="Parser backend"
+    )
+    args = parser.parse_args()
+
+    scraper = DuunitoriScraper(parser=args.parser)
+    link = scraper.profile.fallback_link_pattern
+
+    print(f"\n📊 FALLBACK CARD DISCOVERY (ms, {args.parser})")
+    for size in args.sizes:
+        sys.setrecursionlimit(max(sys.getrecursionlimit(), 4 * size))
+        soup = parse_html(list_page(size), args.parser)
+        previous = milliseconds(lambda: previous_find_cards_by_link(soup, link))
+        current = milliseconds(lambda: scraper.find_cards_by_link(soup))
+        print(
+            f"   • {size:>6} nested divs  previous={previous:9.1f}"
+            f"  link pass={current:7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
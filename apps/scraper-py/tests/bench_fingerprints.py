@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark Job Fingerprinting
+Times the previous per-job fingerprinting, the precompiled per-job function
+and batch fingerprinting over a generated job archive, or over the jobs of
+saved pipeline_results_*.json files
+
+Usage:
+    python tests/bench_fingerprints.py
+    python tests/bench_fingerprints.py --jobs 500000
+    python tests/bench_fingerprints.py --results-dir logs
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from test_job_deduplicator import previous_generate_job_fingerprint  # noqa: E402
+
+from job_deduplicator import (  # noqa: E402
+    generate_job_fingerprint,
+    generate_job_fingerprints,
+)
+
+COMPANIES = ["Koodi Oy", "ABC Ltd.", "Åbo Akademi AB", "Hoiva Oyj", "Kahvila & Co"]
+TITLES = ["Senior Developer", "Myyjä (osa-aika)", "Kokki, Turku", "Data Analyst"]
+LOCATIONS = ["Helsinki", "Turku, Varsinais-Suomi", "Espoo", "Oulu", "N/A"]
+
+
+def generated_jobs(count):
+    """Jobs of ~count / 20 companies, with mostly distinct titles"""
+    rng = random.Random(0)
+    return [
+        {
+            "company": f"{rng.choice(COMPANIES)} {i % max(1, count // 20)}",
+            "title": f"{rng.choice(TITLES)} {i}",
+            "location": rng.choice(LOCATIONS),
+        }
+        for i in range(count)
+    ]
+
+
+def saved_jobs(results_dir):
+    jobs = []
+    for results_file in Path(results_dir).glob("pipeline_results_*.json"):
+        with open(results_file, "r", encoding="utf-8") as f:
+            jobs.extend(job for job in json.load(f) if isinstance(job, dict))
+    return jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark job fingerprinting")
+    parser.add_argument("--jobs", type=int, default=200_000, help="Generated jobs")
+    parser.add_argument(
+        "--results-dir", type=Path, help="Fingerprint saved pipeline results instead"
+    )
+    args = parser.parse_args()
+
+    jobs = (
+        saved_jobs(args.results_dir) if args.results_dir else generated_jobs(args.jobs)
+    )
+
+    implementations = {
+        "previous": lambda: [previous_generate_job_fingerprint(job) for job in jobs],
+        "per job": lambda: [generate_job_fingerprint(job) for job in jobs],
+        "batch": lambda: generate_job_fingerprints(jobs),
+    }
+    print(f"\n📊 FINGERPRINTS ({len(jobs)} jobs)")
+    results = {}
+    for name, fn in implementations.items():
+        start = time.perf_counter()
+        results[name] = fn()
+        print(f"   • {name:<9} {time.perf_counter() - start:7.2f} s")
+    identical = all(
+        fingerprints == results["previous"] for fingerprints in results.values()
+    )
+    print(f"   identical: {identical}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark HTML Parser Backends
+Measures parse time and parse+extract time per page for every backend in
+html_parser.PARSER_BACKENDS, over the saved fixture pages, generated pages or
+a recorded cassette
+
+Usage:
+    python tests/bench_parsers.py
+    python tests/bench_parsers.py --synthetic 100 --repeat 20
+    python tests/bench_parsers.py --cassette logs/live.json.gz
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from bench_extractors import SOURCES, write_synthetic_cassette  # noqa: E402
+from test_scrapers_offline import record_fixture_cassette  # noqa: E402
+
+from html_parser import PARSER_BACKENDS, parse_html  # noqa: E402
+from transport import Cassette, SessionPool  # noqa: E402
+
+
+def page_kind(url):
+    """("jobly.fi" | "duunitori.fi", "list" | "detail") of a recorded URL"""
+    for source, (_, _, base_url) in SOURCES.items():
+        if url.startswith(base_url.rsplit("/", 1)[0]):
+            return source, "list" if url.split("?")[0] == base_url else "detail"
+    return None, None
+
+
+def time_per_call(fn, repeat):
+    """Median seconds of fn() over `repeat` calls"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def bench(cassette_path, repeat):
+    """Return {(source, kind, backend): (parse_secs, extract_secs, pages)}"""
+    cassette = Cassette(cassette_path, mode="replay")
+    results = {}
+    with SessionPool(requests_per_second=None, cassette=cassette) as transport:
+        for url in cassette.interactions:
+            source, kind = page_kind(url)
+            if source is None:
+                continue
+            scraper_class, extractor_class, _ = SOURCES[source]
+            html = transport.get(url).text
+
+            for backend in PARSER_BACKENDS:
+                scraper = scraper_class(transport=transport, parser=backend)
+                extractor = extractor_class(scraper)
+                if kind == "list":
+
+                    def extract():
+                        for card in scraper.scrape_jobs_list(url):
+                            extractor.parse_job_card(card)
+
+                else:
+
+                    def extract():
+                        scraper.scrape_job(url)
+
+                parse_secs = time_per_call(lambda: parse_html(html, backend), repeat)
+                extract_secs = time_per_call(extract, repeat)
+
+                key = (source, kind, backend)
+                total_parse, total_extract, pages = results.get(key, (0.0, 0.0, 0))
+                results[key] = (
+                    total_parse + parse_secs,
+                    total_extract + extract_secs,
+                    pages + 1,
+                )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML parser backends")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--cassette", type=Path, help="Benchmark the recorded pages")
+    mode.add_argument(
+        "--synthetic", type=int, metavar="CARDS", help="Benchmark generated pages"
+    )
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per page")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cassette_path = args.cassette
+        if not cassette_path:
+            cassette_path = Path(tmp_dir) / "pages.json.gz"
+            if args.synthetic:
+                write_synthetic_cassette(cassette_path, args.synthetic)
+            else:
+                record_fixture_cassette(cassette_path)
+        results = bench(cassette_path, args.repeat)
+
+    print("\n📊 PARSER BACKENDS (median ms per page)")
+    print(f"   {'page':<22} {'backend':<12} {'parse':>8} {'extract':>8}")
+    for (source, kind, backend), (parse_secs, extract_secs, pages) in sorted(
+        results.items()
+    ):
+        print(
+            f"   • {source + ' ' + kind:<20} {backend:<12} "
+            f"{parse_secs / pages * 1000:8.2f} {extract_secs / pages * 1000:8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark PII Scrubber
+Times pii_scrubber.scrub_personal_data against the previous per-pattern
+implementation on realistic descriptions and on worst-case inputs of growing
+size
+
+Usage:
+    python tests/bench_pii_scrubber.py
+    python tests/bench_pii_scrubber.py --sizes 10000 40000 160000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from test_pii_scrubber import (  # noqa: E402
+    LONG_SAMPLES,
+    WORST_CASES,
+    previous_clean_personal_data,
+)
+
+from pii_scrubber import scrub_personal_data  # noqa: E402
+
+IMPLEMENTATIONS = {
+    "previous": previous_clean_personal_data,
+    "compiled": scrub_personal_data,
+}
+
+
+def seconds(fn, texts, repeat=3):
+    """Best wall time of scrubbing all texts, over `repeat` runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the PII scrubber")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[5_000, 20_000, 80_000],
+        help="Worst-case input lengths in characters",
+    )
+    args = parser.parse_args()
+
+    texts = LONG_SAMPLES * 25
+    print(f"\n📊 PII SCRUBBER ({len(texts)} descriptions)")
+    for name, fn in IMPLEMENTATIONS.items():
+        elapsed = seconds(fn, texts)
+        print(f"   • {name:<9} {elapsed * 1000:8.1f} ms")
+
+    print("\n📈 WORST CASES (ms)")
+    for case, unit in WORST_CASES.items():
+        for size in args.sizes:
+            text = unit * (size // len(unit))
+            timings = "  ".join(
+                f"{name}={seconds(fn, [text], repeat=1) * 1000:9.1f}"
+                for name, fn in IMPLEMENTATIONS.items()
+            )
+            print(f"   • {case:<22} {size:>7} chars  {timings}")
+
+
+if __name__ == "__main__":
+    main()
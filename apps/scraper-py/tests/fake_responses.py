@@ -0,0 +1,17 @@
+"""
+Fake HTTP responses shared by the scraper tests and benchmarks
+"""
+
+import requests
+
+
+def html_response(body, url=None, status_code=200, headers=None):
+    """Response serving body (str or UTF-8 bytes) as an HTML page"""
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response.encoding = "utf-8"
+    response.headers["Content-Type"] = "text/html; charset=utf-8"
+    response.headers.update(headers or {})
+    response._content = body.encode("utf-8") if isinstance(body, str) else body
+    return response
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Unit tests for concurrent job extraction
+Tests card ordering, the concurrency bound and pre-fetch card deduplication
+with a fake scraper
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+from bs4 import BeautifulSoup
+
+# Add the src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, src_path)
+
+from async_extraction import extract_jobs_concurrently  # noqa: E402
+from duunitori.duunitori_extractor import DuunitoriExtractor  # noqa: E402
+from job_deduplicator import JobDeduplicator  # noqa: E402
+from jobly.jobly_extractor import JoblyExtractor  # noqa: E402
+
+
+def make_cards(count):
+    html = "".join(f"""
+        <article>
+          <h2 class="node__title"><a href="/en/job/{i}">Job {i}</a></h2>
+          <span class="recruiter-company-profile-job-organization">Company {i}</span>
+          <div class="location">Helsinki</div>
+          <span class="date">1.1.2025,</span>
+        </article>
+        """ for i in range(count))
+    return BeautifulSoup(html, "html.parser").find_all("article")
+
+
+class FakeScraper:
+    """Returns the URL as description, sleeping longer for earlier cards"""
+
+    def __init__(self, count):
+        self.count = count
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fetched = []
+        self.lock = threading.Lock()
+
+    def scrape_job(self, job_url):
+        with self.lock:
+            self.in_flight += 1
+            self.fetched.append(job_url)
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        index = int(job_url.rsplit("/", 1)[1])
+        time.sleep(0.01 * (self.count - index))
+        with self.lock:
+            self.in_flight -= 1
+        return f"description of {job_url}"
+
+
+class TestExtractJobsConcurrently(unittest.TestCase):
+    """Test async extraction matches sequential extraction"""
+
+    def test_results_match_sequential_extraction_in_card_order(self):
+        cards = make_cards(6)
+        extractor = JoblyExtractor(FakeScraper(6))
+
+        sequential = [extractor.extract_job_data(card) for card in cards]
+        concurrent = extract_jobs_concurrently(extractor, cards, max_concurrency=3)
+
+        self.assertEqual(concurrent, sequential)
+        self.assertEqual(concurrent[0]["url"], "https://www.jobly.fi/en/job/0")
+        self.assertEqual(concurrent[0]["source"], "jobly.fi")
+
+    def test_concurrency_is_bounded(self):
+        scraper = FakeScraper(10)
+        extractor = JoblyExtractor(scraper)
+
+        extract_jobs_concurrently(extractor, make_cards(10), max_concurrency=3)
+
+        self.assertGreater(scraper.max_in_flight, 1)
+        self.assertLessEqual(scraper.max_in_flight, 3)
+
+    def test_unparseable_card_yields_placeholder_job(self):
+        extractor = JoblyExtractor(FakeScraper(1))
+
+        jobs = extract_jobs_concurrently(extractor, [None] + make_cards(1))
+
+        self.assertEqual(jobs[0], extractor.empty_job())
+        self.assertEqual(jobs[1]["title"], "Job 0")
+
+    def test_failing_fetch_yields_placeholder_job(self):
+        scraper = FakeScraper(4)
+        scrape_job = scraper.scrape_job
+
+        def flaky_scrape_job(job_url):
+            if job_url.endswith("/2"):
+                raise KeyError("description")
+            return scrape_job(job_url)
+
+        scraper.scrape_job = flaky_scrape_job
+        extractor = JoblyExtractor(scraper)
+        cards = make_cards(4)
+
+        sequential = [extractor.extract_job_data(card) for card in cards]
+        concurrent = extract_jobs_concurrently(extractor, cards, max_concurrency=2)
+
+        self.assertEqual(concurrent, sequential)
+        self.assertEqual(
+            [job["title"] for job in concurrent], ["Job 0", "Job 1", "N/A", "Job 3"]
+        )
+
+
+class TestCardDeduplication(unittest.TestCase):
+    """Cards already held by a shared card index are not fetched"""
+
+    def test_cross_source_duplicates_skip_the_detail_fetch(self):
+        card_index = JobDeduplicator()
+        jobly_scraper = FakeScraper(3)
+        jobly = JoblyExtractor(jobly_scraper, card_index=card_index)
+        duunitori_scraper = FakeScraper(3)
+        duunitori = DuunitoriExtractor(duunitori_scraper, card_index=card_index)
+        # The same postings as duunitori.fi list records, under other URLs
+        records = [
+            {
+                "title": f"Job {i}!",
+                "company": f"Company {i} Oy",
+                "location": "Helsinki",
+                "url": f"https://duunitori.fi/tyopaikat/tyo/{i}",
+            }
+            for i in (1, 2)
+        ]
+
+        jobs = extract_jobs_concurrently(jobly, make_cards(2), max_concurrency=2)
+        self.assertEqual([job["title"] for job in jobs], ["Job 0", "Job 1"])
+
+        duplicates = extract_jobs_concurrently(duunitori, records)
+        self.assertIsNone(duplicates[0])
+        self.assertEqual(duplicates[1]["title"], "Job 2!")
+        self.assertEqual(
+            duunitori_scraper.fetched, ["https://duunitori.fi/tyopaikat/tyo/2"]
+        )
+
+        # Sequential extraction consults the same index
+        self.assertIsNone(jobly.extract_job_data(make_cards(1)[0]))
+        self.assertEqual(len(jobly_scraper.fetched), 2)
+        self.assertEqual(card_index.duplicates, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
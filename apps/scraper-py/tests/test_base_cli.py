@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Smoke test for the shared scraper CLI
+Imports base_cli and builds a CLI the way jobly_cli and duunitori_cli do
+"""
+
+import os
+import sys
+import unittest
+
+# Add the src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, src_path)
+
+from base_cli import BaseScraperCLI  # noqa: E402
+from duunitori.duunitori_extractor import DuunitoriExtractor  # noqa: E402
+from duunitori.duunitori_scraper import DuunitoriScraper  # noqa: E402
+from transport import DEFAULT_BURST, DEFAULT_REQUESTS_PER_SECOND  # noqa: E402
+
+
+class TestBaseScraperCLI(unittest.TestCase):
+    """The CLI module imports and keeps its configuration"""
+
+    def test_build_cli_with_defaults(self):
+        cli = BaseScraperCLI(
+            scraper_class=DuunitoriScraper,
+            extractor_class=DuunitoriExtractor,
+            base_url="https://duunitori.fi/tyopaikat",
+        )
+        self.assertIs(cli.scraper_class, DuunitoriScraper)
+        self.assertEqual(cli.requests_per_second, DEFAULT_REQUESTS_PER_SECOND)
+        self.assertEqual(cli.burst, DEFAULT_BURST)
+        self.assertEqual(cli.max_pages, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Test Description Extractor
+Covers the priority-ordered selector scan and the per-host learned selector
+"""
+
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, src_path)
+
+from description_extractor import DescriptionExtractor  # noqa: E402
+from html_parser import PARSER_BACKENDS, parse_html  # noqa: E402
+from site_profiles import DUUNITORI  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+WORDS = " ".join(f"word{i}" for i in range(12))
+
+
+def page(body):
+    return parse_html(f"<html><body>{body}</body></html>")
+
+
+class TestDescriptionExtractor(unittest.TestCase):
+    """Selector learning per host"""
+
+    SELECTORS = ["div.primary", "div.secondary", "main"]
+
+    def setUp(self):
+        self.extractor = DescriptionExtractor(self.SELECTORS, min_words=10)
+
+    def test_priority_order_and_min_words(self):
+        soup = page(
+            f"<main><div class='primary'>too short</div>"
+            f"<div class='secondary'>{WORDS}</div></main>"
+        )
+        self.assertEqual(self.extractor.extract(soup, "https://a.fi/1"), WORDS)
+        self.assertEqual(self.extractor.learned, {"a.fi": "div.secondary"})
+        self.assertEqual(self.extractor.extract(page("short"), "https://b.fi/1"), "")
+
+    def test_learned_selector_is_tried_first(self):
+        soup = page(f"<div class='secondary'>{WORDS}</div>")
+        self.extractor.extract(soup, "https://a.fi/1")
+
+        with patch.object(self.extractor, "match", wraps=self.extractor.match) as match:
+            self.assertEqual(self.extractor.extract(soup, "https://a.fi/2"), WORDS)
+        match.assert_called_once_with(soup, "div.secondary")
+        self.assertEqual((self.extractor.hits, self.extractor.misses), (1, 1))
+        self.assertEqual(self.extractor.hit_rate, 0.5)
+
+    def test_miss_falls_back_and_relearns(self):
+        self.extractor.extract(
+            page(f"<div class='secondary'>{WORDS}</div>"), "https://a.fi/1"
+        )
+        soup = page(f"<div class='primary'>{WORDS}</div>")
+
+        self.assertEqual(self.extractor.extract(soup, "https://a.fi/2"), WORDS)
+        self.assertEqual(self.extractor.learned["a.fi"], "div.primary")
+        self.assertEqual((self.extractor.hits, self.extractor.misses), (0, 2))
+
+    def test_hosts_learn_independently(self):
+        self.extractor.extract(page(f"<div class='primary'>{WORDS}</div>"), "//a.fi/")
+        self.extractor.extract(page(f"<main>{WORDS}</main>"), "https://b.fi/1")
+
+        self.assertEqual(
+            self.extractor.learned, {"a.fi": "div.primary", "b.fi": "main"}
+        )
+
+    def test_generic_selectors_are_not_learned(self):
+        extractor = DescriptionExtractor(self.SELECTORS, 10, generic=["main"])
+        soup = page(f"<main>{WORDS}</main>")
+
+        self.assertEqual(extractor.extract(soup, "https://a.fi/1"), WORDS)
+        self.assertEqual(extractor.learned, {})
+
+    def test_catch_all_does_not_shadow_later_descriptions(self):
+        extractor = DescriptionExtractor(
+            DUUNITORI.description_patterns,
+            DUUNITORI.min_description_words,
+            generic=DUUNITORI.generic_description_patterns,
+        )
+        nav = " ".join(f"nav{i}" for i in range(50))
+        short = " ".join(f"short{i}" for i in range(10))
+        description = " ".join(f"word{i}" for i in range(60))
+
+        # Description too short: the page's main block wins
+        first = page(f"<main><nav>{nav}</nav><div class='description'>{short}</div>")
+        self.assertIn("nav0", extractor.extract(first, "https://duunitori.fi/1"))
+        self.assertEqual(extractor.learned, {})
+
+        second = page(
+            f"<main><nav>{nav}</nav><div class='description'>{description}</div>"
+        )
+        self.assertEqual(
+            extractor.extract(second, "https://duunitori.fi/2"), description
+        )
+
+
+class TestWordCounting(unittest.TestCase):
+    """Early-exit word counting agrees with counting the full text"""
+
+    def test_matches_full_text_count_on_saved_pages(self):
+        for parser in PARSER_BACKENDS:
+            for filename in ["jobly_job.html", "duunitori_job.html"]:
+                soup = parse_html((FIXTURES_DIR / filename).read_text(), parser)
+                for min_words in [0, 5, 50, 500]:
+                    extractor = DescriptionExtractor([], min_words)
+                    with self.subTest(parser=parser, page=filename, n=min_words):
+                        for elem in soup.select("main, article, div, p"):
+                            full_count = len(
+                                elem.get_text(separator=" ", strip=True).split()
+                            )
+                            self.assertEqual(
+                                extractor.has_enough_words(elem),
+                                full_count > min_words,
+                            )
+
+    def test_stops_reading_text_at_threshold(self):
+        paragraphs = "".join("<p>three more words</p>" for _ in range(1000))
+        for parser in PARSER_BACKENDS:
+            with self.subTest(parser=parser):
+                soup = parse_html(f"<main>{paragraphs}</main>", parser)
+                main = soup.select_one("main")
+                strings = iter(main.stripped_strings)
+
+                class Elem:
+                    stripped_strings = strings
+
+                extractor = DescriptionExtractor([], min_words=10)
+                self.assertTrue(extractor.has_enough_words(Elem))
+                # 4 nodes * 3 words > 10: the remaining 996 were never read
+                self.assertEqual(sum(1 for _ in strings), 996)
+
+
+if __name__ == "__main__":
+    unittest.main()
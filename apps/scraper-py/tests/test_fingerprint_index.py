@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test fingerprint index
+Classifies jobs against the jobs recorded by earlier runs
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+# Add the src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, src_path)
+
+from fingerprint_index import (  # noqa: E402
+    NEW,
+    UNCHANGED,
+    UPDATED,
+    FingerprintIndex,
+)
+
+JOB = {
+    "title": "Software Developer",
+    "company": "Koodi Oy",
+    "location": "Helsinki",
+    "publish_date": "12.3.2025",
+    "description": "Build things.",
+    "url": "https://www.jobly.fi/en/job/1",
+}
+
+
+class TestFingerprintIndex(unittest.TestCase):
+    """new / unchanged / updated across runs"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "index.sqlite3"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_classification_survives_reopening(self):
+        with FingerprintIndex(self.path) as index:
+            self.assertEqual(index.classify(JOB), NEW)
+            # Classifying does not record
+            self.assertEqual(index.classify(JOB), NEW)
+            index.record([JOB], seen_at=datetime(2025, 3, 12))
+
+        with FingerprintIndex(self.path) as index:
+            self.assertEqual(index.classify(dict(JOB)), UNCHANGED)
+            self.assertEqual(index.classify(dict(JOB, description="New.")), UPDATED)
+            # Same URL, retitled posting
+            self.assertEqual(index.classify(dict(JOB, title="Developer")), UPDATED)
+            # Same posting found under another URL
+            other_url = dict(JOB, url="https://duunitori.fi/tyopaikat/tyo/1")
+            self.assertEqual(index.classify(other_url), UNCHANGED)
+            self.assertEqual(
+                index.classify(dict(JOB, title="Kokki", url="https://x.fi/2")), NEW
+            )
+
+    def test_record_keeps_first_seen_and_replaces_changed_fingerprints(self):
+        index = FingerprintIndex(":memory:")
+        index.record([JOB], seen_at=datetime(2025, 3, 12))
+        retitled = dict(JOB, title="Senior Software Developer")
+        index.record([retitled], seen_at=datetime(2025, 3, 19))
+
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.classify(retitled), UNCHANGED)
+        self.assertEqual(index.classify(dict(JOB, url="N/A")), NEW)
+        row = index._conn.execute("SELECT first_seen, last_seen FROM jobs").fetchone()
+        self.assertEqual(tuple(row), ("2025-03-12T00:00:00", "2025-03-19T00:00:00"))
+
+    def test_classify_jobs_groups_in_order(self):
+        index = FingerprintIndex(":memory:")
+        index.record([JOB])
+        jobs = [
+            dict(JOB, title="A", url="a"),
+            JOB,
+            dict(JOB, publish_date="13.3.2025"),
+            dict(JOB, title="B", url="b"),
+        ]
+        groups = index.classify_jobs(jobs)
+        self.assertEqual(groups[NEW], [jobs[0], jobs[3]])
+        self.assertEqual(groups[UNCHANGED], [JOB])
+        self.assertEqual(groups[UPDATED], [jobs[2]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test HTML parser backends
+Checks that every backend answers the CSS-only node interface used by the
+scrapers and extractors in the same way
+"""
+
+import gc
+import os
+import sys
+import unittest
+import weakref
+
+# Add the src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, src_path)
+
+from bs4 import SoupStrainer  # noqa: E402
+
+from html_parser import PARSER_BACKENDS, parse_html, release_tree  # noqa: E402
+
+PAGE = """
+<html><head><title>Jobs</title><style>.card { color: red; }</style></head>
+<body>
+  <div class="card featured" data-jobid="7">
+    <h2 class="node__title"><a href="/en/job/x-7"> Developer &amp; Tester </a></h2>
+    <script>window.tracking = "secret";</script>
+    <!-- hidden comment -->
+    <p>  </p>
+    <span class="date">12.3.2025,</span>
+  </div>
+  <div class="card" data-jobid="8" hidden><a href="/en/job/y-8">Designer</a></div>
+</body></html>
+"""
+
+
+class TestParserBackends(unittest.TestCase):
+    """Same answers from html.parser, lxml and selectolax"""
+
+    def test_select_and_attributes(self):
+        for parser in PARSER_BACKENDS:
+            with self.subTest(parser=parser):
+                soup = parse_html(PAGE, parser)
+                cards = soup.select("div.card")
+                self.assertEqual(len(cards), 2)
+                self.assertEqual(cards[0].get("data-jobid"), "7")
+                self.assertEqual(cards[1].get("hidden"), "")
+                self.assertIsNone(cards[0].get("missing"))
+                self.assertEqual(
+                    cards[0].select_one("h2.node__title a").get("href"), "/en/job/x-7"
+                )
+                self.assertIsNone(cards[0].select_one("span.company"))
+
+    def test_get_text_skips_scripts_styles_and_comments(self):
+        for parser in PARSER_BACKENDS:
+            with self.subTest(parser=parser):
+                card = parse_html(PAGE, parser).select_one("div.card")
+                self.assertEqual(
+                    card.get_text(separator=" ", strip=True),
+                    "Developer & Tester 12.3.2025,",
+                )
+                self.assertEqual(
+                    card.select_one("a").get_text(strip=True), "Developer & Tester"
+                )
+
+    def test_parse_only_keeps_matching_subtrees(self):
+        strainer = SoupStrainer("div", attrs={"data-jobid": True})
+        for parser in ("html.parser", "lxml"):
+            with self.subTest(parser=parser):
+                soup = parse_html(PAGE, parser, parse_only=strainer)
+                self.assertEqual(len(soup.select("div.card")), 2)
+                self.assertEqual(soup.select("title"), [])
+                self.assertEqual(soup.select("style"), [])
+                self.assertEqual(
+                    soup.select_one("h2.node__title a").get("href"), "/en/job/x-7"
+                )
+
+        # selectolax builds the whole tree regardless of the strainer
+        soup = parse_html(PAGE, "selectolax", parse_only=strainer)
+        self.assertEqual(len(soup.select("div.card")), 2)
+
+    def test_release_frees_nodes_without_the_cycle_collector(self):
+        gc.disable()
+        self.addCleanup(gc.enable)
+        # selectolax trees have no reference cycles to break
+        for parser in ("html.parser", "lxml"):
+            with self.subTest(parser=parser):
+                soup = parse_html(PAGE, parser)
+                node = weakref.ref(soup.select_one("h2.node__title a"))
+                release_tree(soup)
+                del soup
+                self.assertIsNone(node())
+
+        release_tree(parse_html(PAGE, "selectolax"))
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            parse_html(PAGE, "html5lib-ish")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Test job deduplication
+Covers exact fingerprint matches, batch fingerprinting, streaming
+deduplication and MinHash near-duplicate detection
+"""
+
+import hashlib
+import os
+import random
+import re
+import sys
+import threading
+import unittest
+
+import pandas as pd
+
+# Add the src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, src_path)
+
+from bloom_filter import BloomFilter, BoundedKeySet  # noqa: E402
+from job_deduplicator import (  # noqa: E402
+    JobDeduplicator,
+    deduplicate_jobs,
+    fingerprint_frame,
+    generate_job_fingerprint,
+    generate_job_fingerprints,
+    iter_unique_jobs,
+    normalize_text,
+)
+from near_duplicates import NearDuplicateIndex, lsh_bands, shingles  # noqa: E402
+
+
+def previous_normalize_text(text):
+    """The four-pass normalize_text replaced by the one-pass version
+    (reference only)"""
+    if not text:
+        return ""
+    text = text.lower().strip()
+    text = re.sub(r"\b(oy|oyj|ab|ltd|inc|gmbh)\b", "", text)
+    text = re.sub(r"[^\w\s]", "", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    return text
+
+
+def previous_generate_job_fingerprint(job):
+    """generate_job_fingerprint before batch fingerprinting (reference only)"""
+    company = previous_normalize_text(job.get("company", ""))
+    title = previous_normalize_text(job.get("title", ""))
+    location = previous_normalize_text(job.get("location", ""))
+    fingerprint_str = f"{company}|{title}|{location}"
+    return hashlib.blake2b(fingerprint_str.encode(), digest_size=16).hexdigest()
+
+
+# Letters, suffixes, punctuation and Unicode whitespace/case edge cases
+ALPHABET = list("abcoyjdlt OYABLTD.,-_!&/()'|\t\n\x0b\x1c\x85\xa0\u3000äÖİßΣς09") + [
+    "oy",
+    "Oyj",
+    "AB",
+    "ltd",
+    "inc",
+    "GmbH",
+    "o.y",
+]
+
+
+def random_text(rng, length=12):
+    return "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, length)))
+
+
+def random_jobs(count, seed=0):
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        job = {
+            "company": rng.choice([None, "", "Koodi Oy", "ABC, Ltd", random_text(rng)]),
+            "title": random_text(rng),
+            "location": rng.choice(["Helsinki", "", None, random_text(rng)]),
+        }
+        if i % 5 == 0:
+            del job["location"]
+        jobs.append(job)
+    return jobs
+
+
+def description(topic, words=120):
+    return " ".join(f"{topic}{i % 40} tehtävä{i}" for i in range(words))
+
+
+def make_job(title, company, location, text, url, source="jobly.fi"):
+    return {
+        "title": title,
+        "company": company,
+        "location": location,
+        "description": text,
+        "url": url,
+        "source": source,
+    }
+
+
+JOBS = [
+    make_job(
+        "Senior Developer", "Koodi Oy", "Helsinki", description("koodi"), "jobly/1"
+    ),
+    make_job(
+        "Senior Software Developer",
+        "Koodi Ltd",
+        "Helsinki, Uusimaa",
+        description("koodi"),
+        "duunitori/1",
+        "duunitori.fi",
+    ),
+    make_job("Kokki", "Ravintola Ky", "Turku", description("keittiö"), "jobly/2"),
+]
+
+
+class TestExactDeduplication(unittest.TestCase):
+    """Default mode: URL and company|title|location fingerprint"""
+
+    def test_fingerprint_ignores_company_suffix_and_punctuation(self):
+        jobs = [
+            make_job("Software Developer", "ABC Oy", "Helsinki", "", "a"),
+            make_job("Software Developer!", "ABC Ltd", "helsinki", "", "b"),
+            make_job("Software Developer", "ABC Oy", "Espoo", "", "a"),
+        ]
+        self.assertEqual(deduplicate_jobs(jobs), jobs[:1])
+
+    def test_reworded_titles_are_kept_without_threshold(self):
+        self.assertEqual(deduplicate_jobs(JOBS), JOBS)
+
+
+class TestBatchFingerprints(unittest.TestCase):
+    """Precompiled and batch fingerprints equal the previous implementation"""
+
+    def test_normalize_text_matches_previous_implementation(self):
+        rng = random.Random(1)
+        for _ in range(20_000):
+            text = random_text(rng)
+            self.assertEqual(normalize_text(text), previous_normalize_text(text))
+
+    def test_batch_fingerprints_are_identical(self):
+        jobs = random_jobs(2_000)
+        expected = [previous_generate_job_fingerprint(job) for job in jobs]
+        self.assertEqual([generate_job_fingerprint(job) for job in jobs], expected)
+        self.assertEqual(generate_job_fingerprints(jobs), expected)
+        self.assertEqual(generate_job_fingerprints([]), [])
+
+    def test_fingerprint_frame_keeps_the_index(self):
+        frame = pd.DataFrame(
+            {"company": ["ABC Oy", None], "title": ["Kokki", "Kokki"]}, index=[7, 9]
+        )
+        fingerprints = fingerprint_frame(frame)
+        self.assertEqual(list(fingerprints.index), [7, 9])
+        self.assertEqual(
+            fingerprints[9], previous_generate_job_fingerprint({"title": "Kokki"})
+        )
+
+
+class TestStreamingDeduplication(unittest.TestCase):
+    """Generator deduplication and its bounded-memory key sets"""
+
+    def test_stream_matches_batch_and_yields_as_jobs_arrive(self):
+        jobs = random_jobs(2_000) + JOBS + JOBS
+        for i, job in enumerate(jobs):
+            job["url"] = f"url/{i % 1_500}"
+        for threshold in (None, 0.8):
+            self.assertEqual(
+                list(iter_unique_jobs(iter(jobs), threshold)),
+                deduplicate_jobs(jobs, threshold),
+            )
+
+        arrived = []
+
+        def scrape():
+            for job in JOBS:
+                arrived.append(job)
+                yield job
+
+        stream = iter_unique_jobs(scrape())
+        self.assertIs(next(stream), JOBS[0])
+        self.assertEqual(arrived, JOBS[:1])
+
+    def test_deduplicator_shared_between_threads(self):
+        jobs = random_jobs(500)
+        expected = deduplicate_jobs(jobs)
+        deduplicator = JobDeduplicator()
+        accepted = []
+        threads = [
+            threading.Thread(target=lambda: accepted.extend(deduplicator.unique(jobs)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertCountEqual(accepted, expected)
+        self.assertEqual(deduplicator.duplicates, 4 * len(jobs) - len(expected))
+
+    def test_key_set_spills_to_bloom_filter(self):
+        keys = BoundedKeySet(max_exact=100, capacity=1_000, error_rate=0.01)
+        for i in range(1_000):
+            keys.add(f"key{i}")
+        keys.add("key5")
+        self.assertTrue(keys.spilled)
+        self.assertEqual(len(keys._exact), 100)
+        self.assertEqual(len(keys), 1_000)
+        self.assertTrue(all(f"key{i}" in keys for i in range(1_000)))
+        false_positives = sum(f"other{i}" in keys for i in range(10_000))
+        self.assertLess(false_positives, 300)
+
+        exact = BoundedKeySet()
+        exact.add("a")
+        self.assertIn("a", exact)
+        self.assertNotIn("b", exact)
+        self.assertFalse(exact.spilled)
+
+    def test_bloom_filter_size(self):
+        bloom = BloomFilter(capacity=1_000_000, error_rate=0.001)
+        # ~1.8 MB and 10 hashes for a million keys at 0.1%
+        self.assertAlmostEqual(bloom.num_bits / 8 / 1e6, 1.8, delta=0.05)
+        self.assertEqual(bloom.num_hashes, 10)
+        with self.assertRaises(ValueError):
+            BloomFilter(error_rate=1)
+
+
+class TestNearDuplicates(unittest.TestCase):
+    """MinHash + LSH mode"""
+
+    def test_reworded_title_and_location_are_near_duplicates(self):
+        self.assertEqual(
+            deduplicate_jobs(JOBS, similarity_threshold=0.8), [JOBS[0], JOBS[2]]
+        )
+
+    def test_threshold_controls_how_similar_texts_must_be(self):
+        # Half of the description rewritten
+        text = description("koodi", 60) + " " + description("muu", 60)
+        rewritten = dict(JOBS[1], description=text)
+        jobs = [JOBS[0], rewritten]
+        self.assertEqual(deduplicate_jobs(jobs, similarity_threshold=0.9), jobs)
+        self.assertEqual(deduplicate_jobs(jobs, similarity_threshold=0.2), jobs[:1])
+
+    def test_jobs_without_description_are_only_compared_exactly(self):
+        jobs = [
+            make_job("Myyjä", "Kauppa Oy", "Oulu", "N/A", "a"),
+            make_job("Myyjä", "Toinen Kauppa Oy", "Oulu", "N/A", "b"),
+        ]
+        self.assertEqual(deduplicate_jobs(jobs, similarity_threshold=0.5), jobs)
+
+    def test_same_role_in_several_cities_is_kept(self):
+        text = description("myynti")
+        jobs = [
+            make_job("Myyjä", "K-Market Oy", city, text, f"jobly/{city}")
+            for city in ("Helsinki", "Tampere", "Oulu")
+        ]
+        self.assertEqual(deduplicate_jobs(jobs, similarity_threshold=0.8), jobs)
+
+        # Only another company's or the same board's posting: kept as well
+        other_company = make_job(
+            "Myyjä", "S-Market", "Espoo", text, "duunitori/1", "duunitori.fi"
+        )
+        self.assertEqual(
+            deduplicate_jobs(jobs + [other_company], similarity_threshold=0.8),
+            jobs + [other_company],
+        )
+        # The same posting on the other board is dropped
+        cross_source = make_job(
+            "Myyjä (osa-aika)", "K-Market", "Oulu", text, "duunitori/2", "duunitori.fi"
+        )
+        self.assertEqual(
+            deduplicate_jobs(jobs + [cross_source], similarity_threshold=0.8), jobs
+        )
+
+    def test_index_estimates_jaccard_similarity(self):
+        index = NearDuplicateIndex(threshold=0.5, num_perm=256)
+        first = " ".join(f"w{i}" for i in range(200))
+        # 98 of 300 distinct shingles shared
+        second = " ".join(f"w{i}" for i in range(100, 302))
+        similarity = index.similarity(index.signature(first), index.signature(second))
+        self.assertAlmostEqual(similarity, 98 / 300, delta=0.1)
+
+        index.add("first", index.signature(first))
+        self.assertEqual(index.query(index.signature(first + " w999")), "first")
+        self.assertIsNone(index.query(index.signature(second)))
+        self.assertIsNone(index.signature("   "))
+
+    def test_window_evicts_the_oldest_texts(self):
+        index = NearDuplicateIndex(threshold=0.8, max_size=2)
+        texts = [" ".join(f"{topic}{i}" for i in range(50)) for topic in "abc"]
+        signatures = [index.signature(text) for text in texts]
+        for key, signature in enumerate(signatures):
+            index.add(key, signature)
+
+        self.assertEqual(len(index), 2)
+        self.assertIsNone(index.query(signatures[0]))
+        self.assertEqual(index.query(signatures[2]), 2)
+        self.assertTrue(all(all(bucket) for bucket in index._buckets))
+        self.assertEqual(sum(map(len, index._buckets)), 2 * index.bands)
+
+        deduplicator = JobDeduplicator(0.8, near_duplicate_window=1)
+        self.assertTrue(deduplicator.accept(JOBS[0]))
+        self.assertTrue(deduplicator.accept(JOBS[2]))
+        # The matching job left the window
+        self.assertTrue(deduplicator.accept(JOBS[1]))
+        jobs = [JOBS[0], JOBS[2], JOBS[1]]
+        self.assertEqual(
+            list(iter_unique_jobs(jobs, 0.8, near_duplicate_window=1)), jobs
+        )
+        self.assertEqual(list(iter_unique_jobs(jobs, 0.8)), jobs[:2])
+
+    def test_shingles_and_bands(self):
+        self.assertEqual(shingles("a b c d", 3), ["a b c", "b c d"])
+        self.assertEqual(shingles("a b", 3), ["a b"])
+        bands, rows = lsh_bands(0.8, 128)
+        self.assertLessEqual(bands * rows, 128)
+        self.assertGreaterEqual(1 - (1 - 0.8**rows) ** bands, 0.95)
+
+        with self.assertRaises(ValueError):
+            NearDuplicateIndex(threshold=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Test JSON-LD JobPosting fast path
+Covers reading embedded JobPosting data and the scrapers' use of it on list
+and detail pages
+"""
+
+import json
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add the src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, src_path)
+
+from fake_responses import html_response  # noqa: E402
+
+from duunitori.duunitori_extractor import DuunitoriExtractor  # noqa: E402
+from duunitori.duunitori_scraper import DuunitoriScraper  # noqa: E402
+from jobly.jobly_extractor import JoblyExtractor  # noqa: E402
+from jobly.jobly_scraper import JoblyScraper  # noqa: E402
+from json_ld import (  # noqa: E402
+    find_job_postings,
+    job_from_posting,
+    page_posting,
+    posting_description,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+DESCRIPTION = "<p>" + " ".join(f"sana{i}" for i in range(60)) + "</p>"
+
+POSTING = {
+    "@context": "https://schema.org",
+    "@type": "JobPosting",
+    "title": "Ohjelmistokehittäjä",
+    "url": "/tyopaikat/tyo/ohjelmistokehittaja-1",
+    "datePosted": "2025-03-12T08:00:00+02:00",
+    "hiringOrganization": {"@type": "Organization", "name": "Ohjelmisto Oy"},
+    "jobLocation": {
+        "@type": "Place",
+        "address": {"@type": "PostalAddress", "addressLocality": "Helsinki"},
+    },
+    "description": DESCRIPTION,
+}
+
+
+def ld_script(data):
+    return f'<script type="application/ld+json">{json.dumps(data)}</script>'
+
+
+class TestJsonLd(unittest.TestCase):
+    """Reading JobPosting objects"""
+
+    def test_finds_postings_in_graphs_lists_and_item_lists(self):
+        other = {"@type": "JobPosting", "title": "B", "url": "/b"}
+        page = (
+            "<html><head>"
+            + ld_script({"@type": "Organization", "name": "Duunitori"})
+            + "<script type='application/ld+json'>{not json</script>"
+            + ld_script({"@graph": [POSTING]})
+            + ld_script(
+                {
+                    "@type": "ItemList",
+                    "itemListElement": [{"@type": "ListItem", "item": other}],
+                }
+            )
+            + "</head></html>"
+        )
+        postings = find_job_postings(page)
+        self.assertEqual([p["title"] for p in postings], [POSTING["title"], "B"])
+
+    def test_job_fields(self):
+        self.assertEqual(
+            job_from_posting(POSTING, "https://duunitori.fi"),
+            {
+                "title": "Ohjelmistokehittäjä",
+                "url": "https://duunitori.fi/tyopaikat/tyo/ohjelmistokehittaja-1",
+                "company": "Ohjelmisto Oy",
+                "location": "Helsinki",
+                "publish_date": "2025-03-12",
+            },
+        )
+        self.assertEqual(
+            job_from_posting({"title": "X"}, "https://duunitori.fi")["company"], "N/A"
+        )
+
+    def test_description_text_and_threshold(self):
+        text = posting_description(POSTING, min_words=50)
+        self.assertTrue(text.startswith("sana0 sana1"))
+        self.assertEqual(posting_description(POSTING, min_words=100), "")
+
+        escaped = dict(POSTING, description=DESCRIPTION.replace("<", "&lt;"))
+        self.assertEqual(posting_description(escaped, min_words=50), text)
+
+
+class TestScraperFastPath(unittest.TestCase):
+    """Scrapers use JobPosting data instead of the DOM when present"""
+
+    def test_detail_page_description_skips_dom(self):
+        transport = MagicMock()
+        transport.get.return_value = html_response(
+            f"<html><head>{ld_script(POSTING)}</head><body></body></html>",
+            url="https://www.jobly.fi/en/job/x-1",
+        )
+        scraper = JoblyScraper(transport=transport)
+
+        with patch("site_profiles.engine.parse_html") as parse_html:
+            description = scraper.scrape_job("https://www.jobly.fi/en/job/x-1")
+        parse_html.assert_not_called()
+        self.assertTrue(description.startswith("sana0 sana1"))
+
+    def test_detail_page_uses_its_own_posting(self):
+        url = "https://duunitori.fi/tyopaikat/tyo/ohjelmistokehittaja-1"
+        related = dict(
+            POSTING,
+            url="/tyopaikat/tyo/muu-2",
+            description="<p>" + " ".join(["muu"] * 60) + "</p>",
+        )
+        self.assertIs(page_posting([related, POSTING], url + "#haku"), POSTING)
+        self.assertIs(page_posting([related], url), related)
+        self.assertIsNone(page_posting([related, dict(related, url="/x")], url))
+
+        transport = MagicMock()
+        words = " ".join(["sivu"] * 60)
+        transport.get.return_value = html_response(
+            f"<html><head>{ld_script([related, dict(related, url='/x')])}</head>"
+            f"<body><div class='description'>{words}</div></body></html>",
+            url=url,
+        )
+        scraper = DuunitoriScraper(transport=transport)
+        self.assertEqual(scraper.scrape_job(url), words)
+
+    def test_detail_page_without_posting_uses_selectors(self):
+        transport = MagicMock()
+        words = " ".join(["word"] * 60)
+        transport.get.return_value = html_response(
+            f"<html><body><main>{words}</main></body></html>",
+            url="https://www.jobly.fi/en/job/x-1",
+        )
+        scraper = JoblyScraper(transport=transport)
+        self.assertEqual(scraper.scrape_job("https://www.jobly.fi/en/job/x-1"), words)
+
+    def test_list_page_postings_replace_cards(self):
+        short = dict(POSTING, description="Lyhyt kuvaus", url="/tyopaikat/tyo/k-2")
+        transport = MagicMock()
+        transport.get.return_value = html_response(
+            "<html><body>"
+            + ld_script({"@type": "ItemList", "itemListElement": [POSTING, short]})
+            + "<div class='job-box'><a class='job-box__hover'>DOM</a></div>"
+            + "</body></html>",
+            url="https://duunitori.fi/tyopaikat",
+        )
+        scraper = DuunitoriScraper(transport=transport)
+        scraper.scrape_job = MagicMock(return_value="Haettu kuvaus")
+        extractor = DuunitoriExtractor(scraper)
+
+        job_cards = scraper.scrape_jobs_list("https://duunitori.fi/tyopaikat")
+        jobs = [extractor.extract_job_data(card) for card in job_cards]
+
+        self.assertEqual(len(jobs), 2)
+        self.assertTrue(jobs[0]["description"].startswith("sana0"))
+        self.assertEqual(jobs[0]["source"], "duunitori.fi")
+        # A summary too short to be the description still fetches the detail page
+        self.assertEqual(jobs[1]["description"], "Haettu kuvaus")
+        scraper.scrape_job.assert_called_once_with(
+            "https://duunitori.fi/tyopaikat/tyo/k-2"
+        )
+
+    def test_list_page_with_some_postings_keeps_other_cards(self):
+        """Postings of featured jobs only replace the cards they describe"""
+        featured = dict(
+            POSTING,
+            title="Data Analyst (featured)",
+            url="https://www.jobly.fi/en/job/data-analyst-2345678/",
+            hiringOrganization="",
+        )
+        page = (FIXTURES_DIR / "jobly_list.html").read_text(encoding="utf-8")
+        transport = MagicMock()
+        transport.get.return_value = html_response(
+            page.replace("</head>", ld_script(featured) + "</head>"),
+            url="https://www.jobly.fi/en/jobs",
+        )
+        scraper = JoblyScraper(transport=transport)
+        scraper.scrape_job = MagicMock(return_value="Haettu kuvaus")
+        extractor = JoblyExtractor(scraper)
+
+        job_cards = scraper.scrape_jobs_list("https://www.jobly.fi/en/jobs")
+        jobs = [extractor.extract_job_data(card) for card in job_cards]
+
+        self.assertEqual(
+            [job["title"] for job in jobs],
+            ["Software Developer", "Data Analyst (featured)", "Myyjä"],
+        )
+        self.assertTrue(jobs[1]["description"].startswith("sana0"))
+        # The card supplies the company the posting leaves out
+        self.assertEqual(jobs[1]["company"], "Analytiikka Ab")
+        self.assertEqual(jobs[0]["description"], "Haettu kuvaus")
+        self.assertEqual(scraper.scrape_job.call_count, 2)
+
+    def test_jobly_extractor_reads_postings(self):
+        scraper = JoblyScraper(transport=MagicMock())
+        job = JoblyExtractor(scraper).parse_job_card(
+            dict(POSTING, url="https://www.jobly.fi/en/job/x-1")
+        )
+        self.assertEqual(job["url"], "https://www.jobly.fi/en/job/x-1")
+        self.assertEqual(job["publish_date"], "2025-03-12")
+
+
+if __name__ == "__main__":
+    unittest.main()
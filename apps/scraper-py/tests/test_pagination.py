@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Unit tests for pipelined pagination
+Tests page order, stop conditions and that list pages are fetched ahead
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Add the src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, src_path)
+
+from pagination import iter_list_pages, page_url  # noqa: E402
+
+BASE_URL = "https://duunitori.fi/tyopaikat"
+
+
+class FakeListScraper:
+    """Serves `pages` non-empty list pages, then empty ones"""
+
+    def __init__(self, pages, delay=0.0, fail_on=None):
+        self.pages = pages
+        self.delay = delay
+        self.fail_on = fail_on
+        self.requested = []
+        self.lock = threading.Lock()
+
+    def scrape_jobs_list(self, job_url):
+        with self.lock:
+            self.requested.append(job_url)
+        time.sleep(self.delay)
+        page_num = 0 if job_url == BASE_URL else int(job_url.rsplit("=", 1)[1])
+        if page_num == self.fail_on:
+            raise RuntimeError("broken page")
+        if page_num >= self.pages:
+            return []
+        return [f"card {page_num}-{i}" for i in range(2)]
+
+
+class TestIterListPages(unittest.TestCase):
+    """Test the producer/consumer pagination engine"""
+
+    def test_page_url(self):
+        self.assertEqual(page_url(BASE_URL, 0), BASE_URL)
+        self.assertEqual(page_url(BASE_URL, 3), f"{BASE_URL}?page=3")
+
+    def test_pages_in_order_until_empty_page(self):
+        scraper = FakeListScraper(pages=3)
+        pages = list(iter_list_pages(scraper, BASE_URL))
+
+        self.assertEqual([page_num for page_num, _ in pages], [0, 1, 2])
+        self.assertEqual(pages[1][1], ["card 1-0", "card 1-1"])
+
+    def test_max_pages_limits_requests(self):
+        scraper = FakeListScraper(pages=10)
+        pages = list(iter_list_pages(scraper, BASE_URL, max_pages=2))
+
+        self.assertEqual(len(pages), 2)
+        self.assertEqual(len(scraper.requested), 2)
+
+    def test_fetch_errors_reach_the_caller(self):
+        scraper = FakeListScraper(pages=5, fail_on=1)
+        pages = iter_list_pages(scraper, BASE_URL)
+
+        self.assertEqual(next(pages)[0], 0)
+        with self.assertRaises(RuntimeError):
+            next(pages)
+
+    def test_next_pages_are_fetched_while_current_is_processed(self):
+        scraper = FakeListScraper(pages=4, delay=0.05)
+        start = time.monotonic()
+        for _ in iter_list_pages(scraper, BASE_URL, max_pages=4, prefetch=2):
+            time.sleep(0.05)  # extraction of the current page
+
+        # Sequential fetch + extract would take 8 * 0.05s
+        self.assertLess(time.monotonic() - start, 0.35)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test parse worker pool
+Detail pages parsed in worker processes give the same descriptions as parsing
+them in the fetching thread
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+# Add the src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, src_path)
+
+from fake_responses import html_response  # noqa: E402
+
+from async_extraction import extract_jobs_concurrently  # noqa: E402
+from duunitori.duunitori_scraper import DuunitoriScraper  # noqa: E402
+from jobly.jobly_extractor import JoblyExtractor  # noqa: E402
+from jobly.jobly_scraper import JoblyScraper  # noqa: E402
+from parse_pool import ParsePool, decode_body  # noqa: E402
+from site_profiles import DUUNITORI, JOBLY  # noqa: E402
+
+WORDS = " ".join(f"sana{i}" for i in range(60))
+
+PAGES = {
+    "https://www.jobly.fi/en/job/1": (
+        f"<html><body><main>{WORDS} Contact Matti Virtanen 040 123 4567"
+        "</main></body></html>"
+    ),
+    "https://www.jobly.fi/en/job/2": "<html><body><p>Too short</p></body></html>",
+    "https://www.jobly.fi/en/job/3": "<html><body><main",
+}
+
+
+class TestParsePool(unittest.TestCase):
+    """Worker processes parse pages handed over by the fetch threads"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = ParsePool([JOBLY, DUUNITORI], "html.parser", max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+
+    def test_workers_match_in_process_parsing(self):
+        scraper = JoblyScraper(transport=MagicMock())
+        for url, markup in PAGES.items():
+            with self.subTest(url=url):
+                self.assertEqual(
+                    self.pool.parse_job_page(
+                        JOBLY.name, markup.encode("utf-8"), "utf-8", url
+                    ),
+                    scraper.parse_job_page(markup, url),
+                )
+        url = "https://www.jobly.fi/en/job/1"
+        description = scraper.parse_job_page(PAGES[url], url)
+        self.assertTrue(description.startswith("sana0"))
+        self.assertNotIn("040", description)
+
+    def test_scrapers_hand_fetched_pages_to_the_pool(self):
+        transport = MagicMock()
+        transport.get.side_effect = lambda url, **kwargs: html_response(PAGES[url])
+        scraper = JoblyScraper(transport=transport, parse_pool=self.pool)
+        scraper.parse_job_page = MagicMock()
+
+        cards = [{"title": f"Job {i}", "url": url} for i, url in enumerate(PAGES)]
+        jobs = extract_jobs_concurrently(JoblyExtractor(scraper), cards, 3)
+
+        scraper.parse_job_page.assert_not_called()
+        expected = JoblyScraper(transport=transport)
+        self.assertEqual(
+            [job["description"] for job in jobs],
+            [expected.scrape_job(url) for url in PAGES],
+        )
+
+    def test_profiles_are_kept_apart(self):
+        markup = f"<html><body><div class='description'>{WORDS}</div></body></html>"
+        url = "https://duunitori.fi/tyopaikat/tyo/1"
+        self.assertEqual(
+            self.pool.parse_job_page(DUUNITORI.name, markup.encode(), "utf-8", url),
+            DuunitoriScraper(transport=MagicMock()).parse_job_page(markup, url),
+        )
+
+    def test_workers_decode_raw_bodies(self):
+        markup = (
+            "<html><body><div class='description'>Työpaikka Jyväskylässä "
+            f"{WORDS}</div></body></html>"
+        )
+        url = "https://duunitori.fi/tyopaikat/tyo/1"
+        expected = DuunitoriScraper(transport=MagicMock()).parse_job_page(markup, url)
+        self.assertTrue(expected.startswith("Työpaikka Jyväskylässä"))
+        for content, encoding in [
+            (markup.encode("iso-8859-1"), "iso-8859-1"),
+            (markup.encode("utf-8"), None),
+        ]:
+            with self.subTest(encoding=encoding):
+                self.assertEqual(decode_body(content, encoding), markup)
+                self.assertEqual(
+                    self.pool.parse_job_page(DUUNITORI.name, content, encoding, url),
+                    expected,
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
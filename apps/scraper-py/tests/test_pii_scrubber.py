@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Test PII Scrubber
+Compares the compiled scrubber with the previous per-pattern implementation,
+on realistic and adversarial input (timings: tests/bench_pii_scrubber.py)
+"""
+
+import os
+import re
+import sys
+import time
+import unittest
+
+# Add the src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, src_path)
+
+from pii_scrubber import scrub_personal_data  # noqa: E402
+
+SAMPLES = [
+    "Soita 040 123 4567 tai +358 50 339 2228, myös 050-339-2228.",
+    "Lähetä hakemus osoitteeseen rekry@koodi.fi tai katso https://koodi.fi/ura",
+    "Lisätietoja antaa Matti Virtanen, puh. 040 123 4567.",
+    "For additional information contact: Liisa Koski (liisa.koski@example.com)",
+    "Yhteystiedot:\nTiimi\nAnna Laine",
+    "Haemme kokkia. Työ alkaa 1.4.2025 ja kestää 12 kk.",
+    "Ota yhteyttä rekrytoija Pekka Nieminen, call Pekka now or email HR team.",
+    # Non-ASCII letters next to address characters: the leading \b decides
+    # where (and whether) an email starts
+    ",lisätietojax@y.fi",
+    "Hakemukset: työ.haku@yritys.fi tai lisä.x@y.fi",
+    "Kysy Äijä-Pekalta: ä.pekka@firma.fi, é%x@y.fi%@y.fi",
+    "rekry@firma.fi@toinen.fi ja x@x@y.fi+%@y.fi",
+    "",
+]
+
+# Adversarial inputs, repeated
+WORST_CASES = {
+    # No name pair after any keyword (the lazy .*? scanned to the end of the
+    # text for every keyword)
+    "keywords without names": "email, ",
+    # Email-like run without "@" at every "." boundary
+    "email-like run": "a.",
+    "email-like run with @": "ä.a@",
+    # Long runs of letters and digits
+    "letters": "abcdefghij",
+    "digits": "0123456789",
+}
+
+# Job descriptions padded to realistic length
+LONG_SAMPLES = [
+    (" ".join(["Vastuullinen työ kasvavassa yrityksessä."] * 200) + " " + sample)
+    for sample in SAMPLES
+]
+
+
+def previous_clean_personal_data(text):
+    """The per-pattern scrubber replaced by pii_scrubber (reference only)"""
+    if not text:
+        return text
+    for pattern in [
+        r"\+\d{1,3}[\s\-]\d{1,2}[\s\-]\d{1,3}[\s\-]?\d{0,4}",
+        r"\d{2,3}[\s\-]\d{1,3}[\s\-]\d{1,4}[\s\-]?\d{0,4}",
+        r"\d{3}[\s\-]\d{3}[\s\-]\d{4}",
+    ]:
+        text = re.sub(pattern, "", text)
+    text = re.sub(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+" r"\.[A-Za-z]{2,}\b", "", text)
+    text = re.sub(r"https?://[^\s]+", "", text)
+    for keyword in [
+        "yhteydenotto",
+        "yhteystiedot",
+        "contact",
+        "lisätietoja",
+        "additional information",
+        "ota yhteyttä",
+        "call",
+        "email",
+    ]:
+        if keyword in text.lower():
+            pattern = r"\b" + re.escape(keyword) + r"\b.*?([A-Z][a-z]+\s[A-Z][a-z]+)"
+            text = re.sub(pattern, keyword, text, flags=re.IGNORECASE)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def best_time(fn, arg, runs=7):
+    """Fastest of several runs, which load on the machine can only slow down"""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn(arg)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+class TestPiiScrubber(unittest.TestCase):
+    """Same output as before, in linear time"""
+
+    def test_matches_previous_implementation(self):
+        for text in SAMPLES + LONG_SAMPLES:
+            with self.subTest(text=text[-60:]):
+                self.assertEqual(
+                    scrub_personal_data(text), previous_clean_personal_data(text)
+                )
+
+    def test_removes_contact_details(self):
+        text = scrub_personal_data(
+            "Contact Matti Virtanen: matti@koodi.fi, +358 50 339 2228, "
+            "https://koodi.fi/jobs"
+        )
+        self.assertEqual(text, "contact: , ,")
+
+    def test_name_must_start_on_the_keywords_line(self):
+        self.assertEqual(
+            scrub_personal_data("Yhteystiedot:\nMatti Virtanen"),
+            "Yhteystiedot: Matti Virtanen",
+        )
+
+    def test_worst_case_inputs_match_previous_implementation(self):
+        # Inputs that made the previous patterns quadratic, at a size where
+        # they are still quick (growth is timed below)
+        for unit in WORST_CASES.values():
+            text = unit * (2_000 // len(unit))
+            with self.subTest(unit=unit):
+                self.assertEqual(
+                    scrub_personal_data(text), previous_clean_personal_data(text)
+                )
+
+    def test_worst_case_inputs_are_linear(self):
+        for name, unit in WORST_CASES.items():
+            small = unit * (4_000 // len(unit))
+            large = small * 32
+            with self.subTest(name=name):
+                ratio = best_time(scrub_personal_data, large) / max(
+                    best_time(scrub_personal_data, small), 1e-6
+                )
+                # 32x the input: ~32x the time when linear, ~1000x when
+                # quadratic; the margin absorbs noise on a loaded machine
+                self.assertLess(ratio, 128)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Offline scraper tests
+Replays saved jobly.fi and duunitori.fi pages from a cassette, so the scrapers
+and extractors run end to end without network access
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, src_path)
+
+from fake_responses import html_response  # noqa: E402
+
+from duunitori.duunitori_extractor import DuunitoriExtractor  # noqa: E402
+from duunitori.duunitori_scraper import DuunitoriScraper  # noqa: E402
+from html_parser import PARSER_BACKENDS  # noqa: E402
+from jobly.jobly_extractor import JoblyExtractor  # noqa: E402
+from jobly.jobly_scraper import JoblyScraper  # noqa: E402
+from transport import Cassette, SessionPool  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+JOBLY_LIST_URL = "https://www.jobly.fi/en/jobs"
+DUUNITORI_LIST_URL = "https://duunitori.fi/tyopaikat"
+
+# URL -> saved page served for it
+FIXTURE_PAGES = {
+    JOBLY_LIST_URL: "jobly_list.html",
+    "https://www.jobly.fi/en/job/software-developer-1234567": "jobly_job.html",
+    DUUNITORI_LIST_URL: "duunitori_list.html",
+    "https://duunitori.fi/tyopaikat/tyo/ohjelmistokehittaja-helsinki-1111": (
+        "duunitori_job.html"
+    ),
+}
+
+
+def record_fixture_cassette(path):
+    """Write a cassette answering FIXTURE_PAGES with the saved pages"""
+    cassette = Cassette(path, mode="record")
+    for url, filename in FIXTURE_PAGES.items():
+        page = (FIXTURES_DIR / filename).read_bytes()
+        cassette.record(url, html_response(page, url=url))
+    cassette.save()
+
+
+class TestScrapersOffline(unittest.TestCase):
+    """Run both scrapers against replayed pages"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.cassette_path = Path(cls.tmp_dir.name) / "fixtures.json.gz"
+        record_fixture_cassette(cls.cassette_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+
+    def setUp(self):
+        self.transport = SessionPool(
+            requests_per_second=None,
+            cassette=Cassette(self.cassette_path, mode="replay"),
+        )
+
+    def tearDown(self):
+        self.transport.close()
+
+    def test_jobly_list_and_detail_pages(self):
+        scraper = JoblyScraper(transport=self.transport)
+        extractor = JoblyExtractor(scraper)
+
+        job_cards = scraper.scrape_jobs_list(JOBLY_LIST_URL)
+        jobs = [extractor.extract_job_data(card) for card in job_cards]
+
+        self.assertEqual(len(jobs), 3)
+        self.assertEqual(
+            {k: v for k, v in jobs[0].items() if k != "description"},
+            {
+                "title": "Software Developer",
+                "url": "https://www.jobly.fi/en/job/software-developer-1234567",
+                "company": "Koodi Oy",
+                "location": "Helsinki",
+                "publish_date": "12.3.2025",
+                "source": "jobly.fi",
+            },
+        )
+        description = jobs[0]["description"]
+        self.assertTrue(description.startswith("Koodi Oy is a growing software"))
+        self.assertNotIn("123 4567", description)
+        self.assertNotIn("@koodi.fi", description)
+        self.assertNotIn("https://koodi.fi", description)
+        self.assertEqual(jobs[2]["url"], "https://www.jobly.fi/en/job/myyja-3456789")
+
+    def test_duunitori_list_and_detail_pages(self):
+        scraper = DuunitoriScraper(transport=self.transport)
+        extractor = DuunitoriExtractor(scraper)
+
+        job_cards = scraper.scrape_jobs_list(DUUNITORI_LIST_URL)
+        jobs = [extractor.extract_job_data(card) for card in job_cards]
+
+        self.assertEqual(len(jobs), 3)
+        self.assertEqual(jobs[0]["title"], "Ohjelmistokehittäjä")
+        self.assertEqual(jobs[0]["company"], "Ohjelmisto Oy")
+        self.assertEqual(jobs[0]["location"], "Helsinki")
+        self.assertEqual(jobs[0]["publish_date"], "12.3.")
+        self.assertTrue(jobs[0]["description"].startswith("Ohjelmisto Oy on kasvava"))
+        self.assertNotIn("040 123 4567", jobs[0]["description"])
+        # Blank data-company falls back to the company element
+        self.assertEqual(jobs[2]["company"], "Turun Hoiva Oy")
+
+    def test_duunitori_cards_without_job_box_markup(self):
+        """Pages without job-box containers fall back to divs linking to jobs"""
+        page_url = DUUNITORI_LIST_URL + "?page=9"
+        cassette = Cassette(Path(self.tmp_dir.name) / "fallback.json.gz", "record")
+        page = (
+            b"<html><body><nav><a href='/'>Etusivu</a></nav>"
+            b"<div class='listing'><a href='/tyopaikat/tyo/a-1'>Kokki</a></div>"
+            b"<div class='listing'><a href='/tyopaikat/tyo/b-2'>Siivooja</a></div>"
+            b"</body></html>"
+        )
+        cassette.record(page_url, html_response(page, url=page_url))
+        cassette.save()
+
+        transport = SessionPool(
+            requests_per_second=None,
+            cassette=Cassette(cassette.path, mode="replay"),
+        )
+        with transport:
+            scraper = DuunitoriScraper(transport=transport)
+            job_cards = scraper.scrape_jobs_list(page_url)
+
+        self.assertEqual(
+            [(card["title"], card["url"]) for card in job_cards],
+            [
+                ("Kokki", "https://duunitori.fi/tyopaikat/tyo/a-1"),
+                ("Siivooja", "https://duunitori.fi/tyopaikat/tyo/b-2"),
+            ],
+        )
+
+    def test_unrecorded_detail_page_becomes_not_available(self):
+        scraper = DuunitoriScraper(transport=self.transport)
+        description = scraper.scrape_job("https://duunitori.fi/tyopaikat/tyo/x-9")
+        self.assertEqual(description, "N/A")
+
+
+class TestParserParity(unittest.TestCase):
+    """Every parser backend extracts the same jobs from the saved pages"""
+
+    SOURCES = [
+        (JoblyScraper, JoblyExtractor, JOBLY_LIST_URL),
+        (DuunitoriScraper, DuunitoriExtractor, DUUNITORI_LIST_URL),
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.cassette_path = Path(cls.tmp_dir.name) / "fixtures.json.gz"
+        record_fixture_cassette(cls.cassette_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+
+    def extract_all(self, parser):
+        transport = SessionPool(
+            requests_per_second=None,
+            cassette=Cassette(self.cassette_path, mode="replay"),
+        )
+        jobs = []
+        with transport:
+            for scraper_class, extractor_class, list_url in self.SOURCES:
+                scraper = scraper_class(transport=transport, parser=parser)
+                extractor = extractor_class(scraper)
+                for card in scraper.scrape_jobs_list(list_url):
+                    jobs.append(extractor.extract_job_data(card))
+        return jobs
+
+    def test_backends_extract_identical_jobs(self):
+        expected = self.extract_all("html.parser")
+        self.assertEqual(len(expected), 6)
+        # First card of each site links to a saved detail page
+        self.assertNotEqual(expected[0]["description"], "N/A")
+        self.assertNotEqual(expected[3]["description"], "N/A")
+
+        for parser in PARSER_BACKENDS:
+            with self.subTest(parser=parser):
+                self.assertEqual(self.extract_all(parser), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
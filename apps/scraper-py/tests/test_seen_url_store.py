@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the persistent seen-URL store
+Tests description reuse, refresh-after TTL and seeding from pipeline results
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add the src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, src_path)
+
+from seen_url_store import SeenUrlStore  # noqa: E402
+
+JOB = {
+    "title": "Software Developer",
+    "company": "ABC Oy",
+    "location": "Helsinki",
+    "url": "https://duunitori.fi/tyopaikat/tyo/1",
+}
+
+
+class TestSeenUrlStore(unittest.TestCase):
+    """Test that known URLs skip the detail-page fetch"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "seen_urls.json"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_known_url_reuses_description_across_runs(self):
+        scrape_job = MagicMock(return_value="Fetched description")
+        store = SeenUrlStore(self.path)
+        self.assertEqual(
+            store.fetch_description(JOB, scrape_job), "Fetched description"
+        )
+        store.save()
+
+        next_run = SeenUrlStore(self.path)
+        self.assertEqual(
+            next_run.fetch_description(JOB, scrape_job), "Fetched description"
+        )
+        scrape_job.assert_called_once_with(JOB["url"])
+        self.assertEqual((next_run.hits, next_run.misses), (1, 0))
+
+    def test_stale_entry_is_fetched_again(self):
+        store = SeenUrlStore(self.path, refresh_after=timedelta(days=1))
+        fingerprint = "unused"
+        store.record(JOB["url"], fingerprint, "Old", datetime.now() - timedelta(days=2))
+        self.assertIsNone(store.lookup(JOB["url"], fingerprint))
+
+    def test_changed_card_fields_are_fetched_again(self):
+        scrape_job = MagicMock(side_effect=["First", "Second"])
+        store = SeenUrlStore(self.path)
+        store.fetch_description(JOB, scrape_job)
+
+        renamed = {**JOB, "title": "Senior Software Developer"}
+        self.assertEqual(store.fetch_description(renamed, scrape_job), "Second")
+
+    def test_failed_fetch_is_not_recorded(self):
+        store = SeenUrlStore(self.path)
+        store.fetch_description(JOB, MagicMock(return_value="N/A"))
+        self.assertNotIn(JOB["url"], store.entries)
+
+    def test_import_pipeline_results_uses_original_fields(self):
+        translated = {
+            **JOB,
+            "title": "Translated title",
+            "description": "Translated description",
+            "original_title": JOB["title"],
+            "original_description": "Alkuperäinen kuvaus",
+        }
+        results = Path(self.tmp_dir.name) / "pipeline_results_20250101_000000.json"
+        results.write_text(json.dumps([translated]), encoding="utf-8")
+
+        store = SeenUrlStore(self.path)
+        self.assertEqual(store.import_pipeline_results(self.tmp_dir.name), 1)
+
+        scrape_job = MagicMock()
+        self.assertEqual(
+            store.fetch_description(JOB, scrape_job), "Alkuperäinen kuvaus"
+        )
+        scrape_job.assert_not_called()
+
+    def test_import_pipeline_results_skips_files_already_imported(self):
+        results = Path(self.tmp_dir.name) / "pipeline_results_20250101_000000.json"
+        results.write_text(json.dumps([{**JOB, "description": "Kuvaus"}]))
+        # Sub-second modification time, as most filesystems record
+        os.utime(results, (1_700_000_000.75, 1_700_000_000.75))
+
+        store = SeenUrlStore(self.path)
+        self.assertEqual(store.import_pipeline_results(self.tmp_dir.name), 1)
+        store.save()
+
+        next_run = SeenUrlStore(self.path)
+        self.assertEqual(next_run.import_pipeline_results(self.tmp_dir.name), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
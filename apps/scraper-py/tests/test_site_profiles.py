@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Test site profiles
+Runs the profile engine on a made-up job board described only by a profile
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+from bs4 import SoupStrainer
+from soupsieve import SelectorSyntaxError
+
+# Add the src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, src_path)
+
+from fake_responses import html_response  # noqa: E402
+
+from html_parser import PARSER_BACKENDS  # noqa: E402
+from site_profiles import (  # noqa: E402
+    DUUNITORI,
+    JOBLY,
+    FieldRule,
+    ProfileExtractor,
+    ProfileScraper,
+    SiteProfile,
+)
+
+LIST_PAGE = """
+<html><body><nav><a href="/">Home</a></nav>
+<ul>
+  <li class="posting"><h3><a href="/jobs/1">Baker</a></h3>
+    <b class="employer" data-name=" Leipomo Oy "></b><i class="city">Oulu</i></li>
+  <li class="posting"><h3>Unlinked</h3>
+    <b class="employer" data-name=""><span class="company">Kahvila Ky</span></b></li>
+</ul></body></html>
+"""
+
+
+def make_profile(**overrides):
+    fields = dict(
+        name="example",
+        source="example.fi",
+        base_url="https://example.fi",
+        list_url="https://example.fi/jobs",
+        card_selectors=["li.posting"],
+        list_page_strainer=SoupStrainer("li"),
+        title=[FieldRule("h3 a"), FieldRule("h3")],
+        company=[
+            FieldRule("b.employer", attribute="data-name"),
+            FieldRule(".company", clean=str.upper),
+        ],
+        location=[FieldRule("i.city")],
+        publish_date=[FieldRule("time")],
+        description_selectors=["main"],
+    )
+    fields.update(overrides)
+    return SiteProfile(**fields)
+
+
+class TestSiteProfiles(unittest.TestCase):
+    """A declarative profile is all a new site needs"""
+
+    def test_engine_runs_a_new_profile(self):
+        transport = MagicMock()
+        transport.get.return_value = html_response(LIST_PAGE)
+
+        profile = make_profile()
+        scraper = ProfileScraper(transport=transport, profile=profile)
+        extractor = ProfileExtractor(scraper, profile=profile)
+
+        jobs = [
+            extractor.parse_job_card(card)
+            for card in scraper.scrape_jobs_list(profile.list_url)
+        ]
+        self.assertEqual(
+            jobs,
+            [
+                {
+                    "title": "Baker",
+                    "url": "https://example.fi/jobs/1",
+                    "company": "Leipomo Oy",
+                    "location": "Oulu",
+                    "publish_date": "N/A",
+                },
+                {
+                    "title": "Unlinked",
+                    "url": "N/A",
+                    "company": "KAHVILA KY",
+                    "location": "N/A",
+                    "publish_date": "N/A",
+                },
+            ],
+        )
+        self.assertEqual(extractor.SOURCE, "example.fi")
+
+    def test_parse_trees_are_released_after_reading(self):
+        transport = MagicMock()
+        transport.get.return_value = html_response(LIST_PAGE)
+        scraper = ProfileScraper(transport=transport, profile=make_profile())
+
+        with patch("site_profiles.engine.release_tree") as release_tree:
+            jobs = scraper.scrape_jobs_list("https://example.fi/jobs")
+            self.assertEqual(release_tree.call_count, 1)
+
+            words = " ".join(["word"] * 60)
+            transport.get.return_value = html_response(f"<main>{words}</main>")
+            self.assertEqual(scraper.scrape_job("https://example.fi/jobs/1"), words)
+            self.assertEqual(release_tree.call_count, 2)
+
+        # Plain records, no elements keeping the list page alive
+        self.assertEqual([type(job) for job in jobs], [dict, dict])
+        self.assertEqual(jobs[0]["title"], "Baker")
+
+    def test_fallback_cards_are_the_divs_closest_to_job_links(self):
+        page = """
+        <html><body><div class="page"><div class="results">
+          <div class="listing"><div><a href="/jobs/1">Kokki</a></div>
+            <a href="/jobs/1">Lue lisää</a></div>
+          <div class="listing"><a href="/jobs/2">Siivooja</a></div>
+          <div class="ad"><a href="/ads/3">Mainos</a></div>
+        </div></div>
+        <section><div><a href="/jobs/4">Ei luokkaa</a></div></section>
+        </body></html>
+        """
+        # Without a class, every div around a job link is a card candidate
+        classless = page.replace('class="', 'data-x="')
+        profile = make_profile(
+            title=[FieldRule("a")], fallback_card_link='a[href^="/jobs/"]'
+        )
+        transport = MagicMock()
+        for parser in PARSER_BACKENDS:
+            with self.subTest(parser=parser):
+                scraper = ProfileScraper(transport, parser, profile)
+
+                transport.get.return_value = html_response(page)
+                jobs = scraper.scrape_jobs_list(profile.list_url)
+                self.assertEqual([job["title"] for job in jobs], ["Kokki", "Siivooja"])
+
+                transport.get.return_value = html_response(classless)
+                jobs = scraper.scrape_jobs_list(profile.list_url)
+                self.assertEqual(
+                    [job["title"] for job in jobs],
+                    ["Kokki", "Kokki", "Siivooja", "Ei luokkaa"],
+                )
+
+    def test_selectors_compile_at_load_time(self):
+        self.assertEqual(len(JOBLY.description_patterns), 15)
+        self.assertEqual(DUUNITORI.card_patterns[0].pattern, "div.job-box")
+        self.assertIsNone(JOBLY.fallback_link_pattern)
+
+        with self.assertRaises(SelectorSyntaxError):
+            make_profile(card_selectors=["li[unclosed"])
+        with self.assertRaises(SelectorSyntaxError):
+            FieldRule("h3 >")
+
+
+if __name__ == "__main__":
+    unittest.main()
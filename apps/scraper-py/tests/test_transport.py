@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared HTTP transport
+Tests pooling, caching, rate limiting, retries, cassettes and streaming offline
+"""
+
+import gzip
+import io
+import os
+import sys
+import tempfile
+import time
+import unittest
+from email.utils import formatdate
+from unittest.mock import patch
+
+# Add the src directory to Python path
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, src_path)
+
+import requests  # noqa: E402
+from fake_responses import html_response  # noqa: E402
+from urllib3.response import HTTPResponse  # noqa: E402
+
+from transport import (  # noqa: E402
+    HEADERS,
+    Cassette,
+    CassetteMissError,
+    CircuitBreaker,
+    CircuitOpenError,
+    HostRateLimiter,
+    HttpCache,
+    ResponseTooLargeError,
+    RetryPolicy,
+    SessionPool,
+    TokenBucket,
+    parse_retry_after,
+)
+from transport.streaming import read_body  # noqa: E402
+
+
+def make_response(status_code=200, body=b"", headers=None, url="https://x.fi/"):
+    response = html_response(body, url=url, status_code=status_code, headers=headers)
+    response.raw = io.BytesIO(body)
+    return response
+
+
+class TestSessionPool(unittest.TestCase):
+    """Test per-host session reuse and adapter configuration"""
+
+    def setUp(self):
+        self.pool = SessionPool(max_connections_per_host=2)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_same_host_reuses_session(self):
+        first = self.pool.session_for("https://www.jobly.fi/en/jobs")
+        second = self.pool.session_for("https://www.jobly.fi/en/job/123")
+        self.assertIs(first, second)
+
+    def test_different_hosts_get_separate_sessions(self):
+        jobly = self.pool.session_for("https://www.jobly.fi/en/jobs")
+        duunitori = self.pool.session_for("https://duunitori.fi/tyopaikat")
+        self.assertIsNot(jobly, duunitori)
+
+    def test_adapter_caps_connections_per_host(self):
+        session = self.pool.session_for("https://duunitori.fi/tyopaikat")
+        adapter = session.get_adapter("https://duunitori.fi/tyopaikat")
+        # The host's connection pool holds and blocks at two connections
+        host_pool = adapter.poolmanager.connection_from_url(
+            "https://duunitori.fi/tyopaikat"
+        )
+        self.assertEqual(host_pool.pool.maxsize, 2)
+        self.assertTrue(host_pool.block)
+
+    def test_session_sends_default_headers(self):
+        session = self.pool.session_for("https://duunitori.fi/tyopaikat")
+        self.assertEqual(session.headers["User-Agent"], HEADERS["User-Agent"])
+        self.assertEqual(session.headers["Connection"], "keep-alive")
+
+    def test_keep_alive_disabled_closes_connections(self):
+        pool = SessionPool(keep_alive=False)
+        session = pool.session_for("https://duunitori.fi/tyopaikat")
+        self.assertEqual(session.headers["Connection"], "close")
+        pool.close()
+
+    def test_get_uses_default_timeout(self):
+        response = make_response(body=b"ok")
+        with patch("requests.Session.get", return_value=response) as mock_get:
+            result = self.pool.get("https://duunitori.fi/tyopaikat")
+
+        self.assertIs(result, response)
+        self.assertEqual(mock_get.call_args.kwargs["timeout"], 10)
+
+    def test_client_error_is_raised_without_retry(self):
+        with patch(
+            "requests.Session.get", return_value=make_response(status_code=404)
+        ) as mock_get:
+            with self.assertRaises(requests.HTTPError):
+                self.pool.get("https://duunitori.fi/tyopaikat/tyo/gone")
+        self.assertEqual(mock_get.call_count, 1)
+
+
+class TestHttpCache(unittest.TestCase):
+    """Test conditional requests served from the on-disk cache"""
+
+    URL = "https://duunitori.fi/tyopaikat/tyo/123"
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = HttpCache(self.tmp_dir.name)
+        self.pool = SessionPool(cache=self.cache)
+
+    def tearDown(self):
+        self.pool.close()
+        self.tmp_dir.cleanup()
+
+    def test_response_without_validators_is_not_stored(self):
+        stored = self.cache.store(self.URL, make_response(body=b"<html></html>"))
+        self.assertFalse(stored)
+        self.assertEqual(self.cache.conditional_headers(self.URL), {})
+
+    def test_store_and_load_round_trip(self):
+        response = make_response(
+            body="<p>Työpaikka</p>".encode("utf-8"),
+            headers={"ETag": '"abc"', "Content-Encoding": "br"},
+            url=self.URL,
+        )
+        self.assertTrue(self.cache.store(self.URL, response))
+
+        cached = self.cache.load(self.URL)
+        self.assertEqual(cached.status_code, 200)
+        self.assertEqual(cached.text, "<p>Työpaikka</p>")
+        self.assertNotIn("Content-Encoding", cached.headers)
+        self.assertEqual(
+            self.cache.conditional_headers(self.URL), {"If-None-Match": '"abc"'}
+        )
+
+    def test_truncated_body_only_serves_same_stop_markers(self):
+        response = make_response(body=b"<main>partial</main>", headers={"ETag": "1"})
+        self.cache.store(self.URL, response, truncated_for="start .. </main>")
+
+        self.assertEqual(self.cache.conditional_headers(self.URL), {})
+        self.assertIsNone(self.cache.load(self.URL))
+        cached = self.cache.load(self.URL, "start .. </main>")
+        self.assertTrue(cached.truncated)
+
+    def test_not_modified_is_served_from_disk(self):
+        first = make_response(
+            body=b"<html>cached</html>",
+            headers={"Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+        )
+        not_modified = make_response(status_code=304)
+
+        with patch("requests.Session.get", side_effect=[first, not_modified]) as get:
+            self.pool.get(self.URL)
+            second = self.pool.get(self.URL)
+
+        sent_headers = get.call_args_list[1].kwargs["headers"]
+        self.assertEqual(
+            sent_headers["If-Modified-Since"], "Wed, 01 Jan 2025 00:00:00 GMT"
+        )
+        self.assertEqual(second.content, b"<html>cached</html>")
+        self.assertTrue(second.from_cache)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test token buckets, per-host budgets and 429 handling"""
+
+    def test_burst_is_free_then_requests_are_paced(self):
+        bucket = TokenBucket(rate=50, burst=3)
+        start = time.monotonic()
+        for _ in range(3):
+            bucket.acquire()
+        self.assertLess(time.monotonic() - start, 0.015)
+
+        bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.015)
+
+    def test_hosts_have_separate_buckets_and_overrides(self):
+        limiter = HostRateLimiter(2.0, 5, host_limits={"duunitori.fi": (1.0, 2)})
+        jobly = limiter.bucket_for("https://www.jobly.fi/en/jobs")
+        duunitori = limiter.bucket_for("https://duunitori.fi/tyopaikat")
+        self.assertIsNot(jobly, duunitori)
+        self.assertEqual((jobly.rate, jobly.burst), (2.0, 5))
+        self.assertEqual((duunitori.rate, duunitori.burst), (1.0, 2))
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("120"), 120.0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+        in_a_minute = formatdate(time.time() + 60, usegmt=True)
+        self.assertAlmostEqual(parse_retry_after(in_a_minute), 60, delta=2)
+
+    def test_too_many_requests_is_retried_after_waiting(self):
+        pool = SessionPool(
+            requests_per_second=100,
+            burst=1,
+            retry_policy=RetryPolicy(backoff_base=0.001),
+        )
+        limited = make_response(status_code=429, headers={"Retry-After": "0"})
+        ok = make_response(body=b"ok")
+
+        with patch("requests.Session.get", side_effect=[limited, ok]) as mock_get:
+            response = pool.get("https://duunitori.fi/tyopaikat")
+
+        self.assertEqual(response.content, b"ok")
+        self.assertEqual(mock_get.call_count, 2)
+        pool.close()
+
+    def test_too_many_requests_raises_after_retries(self):
+        pool = SessionPool(
+            requests_per_second=None,
+            retry_policy=RetryPolicy(max_attempts=2, backoff_base=0.001),
+        )
+        limited = make_response(status_code=429, headers={"Retry-After": "0"})
+
+        with patch("requests.Session.get", return_value=limited) as mock_get:
+            with self.assertRaises(requests.HTTPError):
+                pool.get("https://duunitori.fi/tyopaikat")
+
+        self.assertEqual(mock_get.call_count, 2)
+        pool.close()
+
+    def test_retry_after_beyond_the_cap_fails_fast(self):
+        pool = SessionPool(
+            requests_per_second=100,
+            retry_policy=RetryPolicy(backoff_base=0.001, max_retry_after=10),
+        )
+        url = "https://duunitori.fi/tyopaikat"
+        limited = make_response(status_code=429, headers={"Retry-After": "86400"})
+
+        with patch("requests.Session.get", return_value=limited) as mock_get:
+            with self.assertRaises(requests.HTTPError):
+                pool.get(url)
+
+        self.assertEqual(mock_get.call_count, 1)
+        # The host is held back for the cap, not the day the server asked for
+        blocked_for = pool.rate_limiter.bucket_for(url).blocked_until - time.monotonic()
+        self.assertLessEqual(blocked_for, 10)
+        pool.close()
+
+
+class TestRetryAndCircuitBreaker(unittest.TestCase):
+    """Test backoff retries and failing fast on dead hosts"""
+
+    URL = "https://www.jobly.fi/en/job/1"
+
+    def make_pool(self, **kwargs):
+        pool = SessionPool(
+            requests_per_second=None,
+            retry_policy=RetryPolicy(max_attempts=3, backoff_base=0.001),
+            **kwargs,
+        )
+        self.addCleanup(pool.close)
+        return pool
+
+    def test_transient_failures_are_retried(self):
+        pool = self.make_pool()
+        side_effect = [
+            requests.Timeout("slow"),
+            make_response(status_code=503),
+            make_response(body=b"ok"),
+        ]
+        with patch("requests.Session.get", side_effect=side_effect) as mock_get:
+            response = pool.get(self.URL)
+
+        self.assertEqual(response.content, b"ok")
+        self.assertEqual(mock_get.call_count, 3)
+
+    def test_last_failure_is_raised_after_max_attempts(self):
+        pool = self.make_pool()
+        with patch(
+            "requests.Session.get", side_effect=requests.ConnectionError("down")
+        ) as mock_get:
+            with self.assertRaises(requests.ConnectionError):
+                pool.get(self.URL)
+        self.assertEqual(mock_get.call_count, 3)
+
+    def test_open_circuit_fails_fast(self):
+        pool = self.make_pool(
+            circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        )
+        with patch(
+            "requests.Session.get", side_effect=requests.ConnectionError("down")
+        ) as mock_get:
+            with self.assertRaises(CircuitOpenError):
+                pool.get(self.URL)
+            with self.assertRaises(CircuitOpenError):
+                pool.get("https://www.jobly.fi/en/job/2")
+
+        # Two failures opened the circuit, nothing was sent afterwards
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertFalse(pool.circuit_breaker.is_open("https://duunitori.fi/"))
+
+    def test_circuit_closes_after_successful_trial(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure(self.URL)
+        self.assertTrue(breaker.is_open(self.URL))
+
+        breaker.before_request(self.URL)  # trial request allowed
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request(self.URL)  # only one trial at a time
+
+        breaker.record_success(self.URL)
+        self.assertFalse(breaker.is_open(self.URL))
+
+
+class TestCassette(unittest.TestCase):
+    """Test recording responses and replaying them offline"""
+
+    URL = "https://www.jobly.fi/en/jobs"
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "jobly.json.gz")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_record_then_replay_without_network(self):
+        recorder = SessionPool(
+            requests_per_second=None, cassette=Cassette(self.path, mode="record")
+        )
+        live = make_response(
+            body="<p>Hyvä työ</p>".encode("utf-8"),
+            headers={"Content-Type": "text/html", "Content-Encoding": "gzip"},
+        )
+        with patch("requests.Session.get", return_value=live):
+            recorder.get(self.URL)
+        recorder.close()  # saves the cassette
+
+        player = SessionPool(cassette=Cassette(self.path, mode="replay", latency=0.02))
+        with patch("requests.Session.get") as mock_get:
+            start = time.monotonic()
+            replayed = player.get(self.URL)
+            elapsed = time.monotonic() - start
+
+        mock_get.assert_not_called()
+        self.assertGreaterEqual(elapsed, 0.02)
+        self.assertEqual(replayed.text, "<p>Hyvä työ</p>")
+        self.assertEqual(replayed.headers["Content-Type"], "text/html")
+        self.assertNotIn("Content-Encoding", replayed.headers)
+
+        with self.assertRaises(CassetteMissError):
+            player.get("https://www.jobly.fi/en/jobs?page=9")
+        player.close()
+
+    def test_invalid_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            Cassette(self.path, mode="live")
+
+
+def make_streamed_response(body, headers=None):
+    """Response whose body is read from a urllib3 stream, like stream=True"""
+    headers = headers or {}
+    response = requests.Response()
+    response.status_code = 200
+    response.url = "https://www.jobly.fi/en/job/1"
+    response.headers.update(headers)
+    response.raw = HTTPResponse(
+        body=io.BytesIO(body),
+        headers=headers,
+        preload_content=False,
+        decode_content=True,
+    )
+    return response
+
+
+class TestStreamedBodies(unittest.TestCase):
+    """Test size caps, incremental decompression and early stops"""
+
+    PAGE = (
+        b"<html><main><article>"
+        + b'<div property="content:encoded">'
+        + b"word " * 2000
+        + b"</div>"
+        + b"</article></main><footer>"
+        + b"x" * 5000
+        + b"</footer></html>"
+    )
+    MARKERS = (b'property="content:encoded"', b"</article>")
+
+    def test_gzip_body_is_decoded(self):
+        response = read_body(
+            make_streamed_response(
+                gzip.compress(self.PAGE), {"Content-Encoding": "gzip"}
+            )
+        )
+        self.assertEqual(response.content, self.PAGE)
+        self.assertFalse(response.truncated)
+
+    def test_body_over_limit_is_rejected(self):
+        with self.assertRaises(ResponseTooLargeError):
+            read_body(make_streamed_response(self.PAGE), max_bytes=1000)
+
+    def test_compressed_body_over_limit_is_rejected_while_decoding(self):
+        response = make_streamed_response(
+            gzip.compress(b"a" * 500_000), {"Content-Encoding": "gzip"}
+        )
+        with self.assertRaises(ResponseTooLargeError):
+            read_body(response, max_bytes=100_000)
+
+    def test_stops_after_end_marker_following_start_marker(self):
+        page = b"<article>teaser</article>" + self.PAGE
+        response = read_body(make_streamed_response(page), stop_after=self.MARKERS)
+
+        self.assertTrue(response.truncated)
+        self.assertTrue(response.content.endswith(b"word </div></article>"))
+        self.assertNotIn(b"<footer>", response.content)
+        self.assertIn(b"teaser", response.content)
+
+    def test_missing_start_marker_reads_whole_body(self):
+        response = read_body(
+            make_streamed_response(self.PAGE),
+            stop_after=(b"description--jobentry", b"</main>"),
+        )
+        self.assertFalse(response.truncated)
+        self.assertEqual(response.content, self.PAGE)
+
+    def test_markers_split_across_chunks_are_found(self):
+        with patch("transport.streaming.CHUNK_SIZE", 7):
+            response = read_body(
+                make_streamed_response(self.PAGE), stop_after=self.MARKERS
+            )
+        self.assertTrue(response.content.endswith(b"</article>"))
+
+
+if __name__ == "__main__":
+    unittest.main()